@@ -1,7 +1,7 @@
 """Configuration management for mem8 API."""
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -56,6 +56,69 @@ class Settings(BaseSettings):
         description="Redis connection URL"
     )
     
+    sync_backplane: str = Field(
+        default="inprocess",
+        description="How real-time sync events reach other API workers: inprocess or redis"
+    )
+    
+    # Response cache settings
+    response_cache_backend: str = Field(
+        default="redis",
+        description="Response cache storage: redis (memory fallback), memory or off"
+    )
+    response_cache_ttls: Dict[str, int] = Field(
+        default={"search": 30, "thoughts": 15, "stats": 10},
+        description="Response cache TTL in seconds per endpoint"
+    )
+    response_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum entries in the in-memory response cache"
+    )
+    
+    # Authenticated user cache
+    user_cache_backend: str = Field(
+        default="memory",
+        description="Where users resolved from access tokens are cached: memory, redis or off"
+    )
+    user_cache_ttl: int = Field(
+        default=30,
+        description="Seconds a cached user is trusted before it is reloaded"
+    )
+    user_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum users held in the in-memory user cache"
+    )
+    
+    # WebSocket fan-out settings
+    ws_send_queue_size: int = Field(
+        default=100,
+        description="Maximum queued outgoing messages per WebSocket connection"
+    )
+    ws_slow_consumer_policy: str = Field(
+        default="coalesce",
+        description="What to do when a client's queue is full: drop, coalesce or disconnect"
+    )
+    ws_send_timeout: float = Field(
+        default=10.0,
+        description="Seconds a single WebSocket send may take before the client is dropped"
+    )
+    
+    # Search suggestions
+    suggestion_refresh_interval: int = Field(
+        default=600,
+        description="Seconds between rebuilds of loaded suggestion indexes from the database (0 disables)"
+    )
+    suggestion_max_teams: int = Field(
+        default=1000,
+        description="Maximum team suggestion indexes kept in memory; least recently used are dropped"
+    )
+    
+    # Stats settings
+    stats_refresh_interval: int = Field(
+        default=600,
+        description="Seconds between full recomputes of per-team stats counters (0 disables)"
+    )
+    
     # Search settings
     search_model_name: str = Field(
         default="all-MiniLM-L6-v2",
@@ -68,6 +131,18 @@ class Settings(BaseSettings):
         description="Maximum file size in bytes"
     )
     
+    # Bulk import settings
+    import_batch_size: int = Field(
+        default=500,
+        description="Thoughts upserted per transaction by the bulk import endpoint"
+    )
+    
+    # HTTP file sync settings
+    sync_storage_dir: str = Field(
+        default="./sync-storage",
+        description="Directory holding per-team sync manifests and content chunks"
+    )
+    
     # Logging settings
     log_level: str = Field(default="INFO", description="Logging level")
     
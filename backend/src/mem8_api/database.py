@@ -2,7 +2,10 @@
 
 from typing import AsyncGenerator
 
-from sqlalchemy import MetaData
+import logging
+
+from sqlalchemy import MetaData, func, inspect, select, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -11,6 +14,9 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.ext.declarative import declarative_base
 
 from .config import get_settings
+from .metrics import instrument_engine
+
+logger = logging.getLogger(__name__)
 
 # Settings
 settings = get_settings()
@@ -38,6 +44,8 @@ else:
         pool_recycle=300,
     )
 
+instrument_engine(engine.sync_engine)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -57,6 +65,47 @@ async def init_db() -> None:
         
         # Create tables (checkfirst=True is default and handles conflicts properly)
         await conn.run_sync(metadata.create_all)
+        
+        existing = {
+            index["name"]
+            for index in await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_indexes("thoughts"))
+        }
+        if "uq_thoughts_team_path" not in existing:
+            await _check_unique_thought_paths(conn)
+    
+    # create_all skips indexes added to tables that already exist
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(index.create, checkfirst=True)
+            except SQLAlchemyError as e:
+                # Writes rely on unique indexes, so refuse to start without them
+                if index.unique:
+                    raise
+                logger.error(f"Could not create index {index.name}: {e}")
+    
+    # Superseded by uq_thoughts_team_path
+    if "ix_thoughts_team_path" in existing:
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP INDEX IF EXISTS ix_thoughts_team_path"))
+
+
+async def _check_unique_thought_paths(conn) -> None:
+    """Fail if a team has several thoughts at one path, before indexing (team_id, path) as unique."""
+    from .models import Thought
+    
+    duplicates = (await conn.execute(
+        select(Thought.team_id, Thought.path)
+        .group_by(Thought.team_id, Thought.path)
+        .having(func.count() > 1)
+    )).all()
+    if duplicates:
+        examples = ", ".join(f"{team_id}:{path}" for team_id, path in duplicates[:5])
+        raise RuntimeError(
+            f"{len(duplicates)} thought paths are used more than once in a team ({examples}). "
+            "Delete or move the duplicate thoughts, then restart to create uq_thoughts_team_path."
+        )
 
 
 async def close_db() -> None:
@@ -74,4 +123,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+def upsert_insert(db: AsyncSession):
+    """The dialect's ``insert`` construct, which supports ``on_conflict_do_update``."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise RuntimeError(f"Upserts are not supported for the {dialect} dialect")
+    return insert
@@ -1,7 +1,8 @@
 """Main FastAPI application for mem8 backend API."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
@@ -11,8 +12,15 @@ from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from starlette.responses import Response
 
 from .config import get_settings
-from .database import init_db, close_db
-from .routers import thoughts, search, sync, teams, health, auth, public
+from .database import AsyncSessionLocal, init_db, close_db
+from .metrics import PrometheusMiddleware
+from .routers import thoughts, search, sync, file_sync, teams, health, auth, public
+from .services.backplane import create_backplane
+from .services.response_cache import get_response_cache
+from .services.suggestions import get_suggestion_index, run_periodic_rebuild
+from .services.tags import backfill_thought_tags
+from .services.user_cache import get_user_cache
+from .services.team_stats import refresh_team_stats, run_periodic_refresh
 # from .websocket import websocket_endpoint
 
 # Setup logging
@@ -29,11 +37,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Initializing database...")
     await init_db()
     
+    # Move tags of pre-existing thoughts into the thought_tags table
+    async with AsyncSessionLocal() as db:
+        await backfill_thought_tags(db)
+    
+    # Backfill per-team counters, then keep repairing any drift
+    async with AsyncSessionLocal() as db:
+        await refresh_team_stats(db)
+    stats_task = None
+    if settings.stats_refresh_interval > 0:
+        stats_task = asyncio.create_task(
+            run_periodic_refresh(AsyncSessionLocal, settings.stats_refresh_interval)
+        )
+    
+    suggestions_task = None
+    if settings.suggestion_refresh_interval > 0:
+        suggestions_task = asyncio.create_task(
+            run_periodic_rebuild(get_suggestion_index(), AsyncSessionLocal, settings.suggestion_refresh_interval)
+        )
+    
+    logger.info(f"Starting {settings.sync_backplane} sync backplane...")
+    await sync.connection_manager.start_backplane(create_backplane(settings))
+    
     logger.info(f"mem8 API starting on {settings.host}:{settings.port}")
     yield
     
     # Cleanup
     logger.info("Shutting down mem8 API...")
+    for task in (stats_task, suggestions_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await sync.connection_manager.stop_backplane()
+    await get_response_cache().close()
+    await get_user_cache().close()
     await close_db()
 
 
@@ -64,6 +102,8 @@ app.add_middleware(
     allowed_hosts=settings.allowed_hosts,
 )
 
+app.add_middleware(PrometheusMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(public.router, prefix="/api/v1/public", tags=["public"])
@@ -83,6 +123,11 @@ app.include_router(
     prefix="/api/v1",
     tags=["sync"]
 )
+app.include_router(
+    file_sync.router,
+    prefix="/api/v1",
+    tags=["sync"]
+)
 app.include_router(
     teams.router,
     prefix="/api/v1",
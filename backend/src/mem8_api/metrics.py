@@ -0,0 +1,189 @@
+"""Prometheus metrics for mem8 API.
+
+All metrics live in the default registry exported by ``/metrics``. Labels are
+restricted to small, fixed value sets to keep cardinality bounded.
+"""
+
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# HTTP requests
+HTTP_REQUEST_SECONDS = Histogram(
+    "mem8_http_request_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],  # status is the class: 2xx, 4xx, ...
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "mem8_http_requests_in_progress",
+    "HTTP requests currently being served",
+)
+
+# Database
+DB_QUERY_SECONDS = Histogram(
+    "mem8_db_query_seconds",
+    "SQL statement execution time",
+    ["operation"],  # select, insert, update, delete, other
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# Search
+SEARCH_SECONDS = Histogram(
+    "mem8_search_seconds",
+    "Search execution time, excluding cache hits",
+    ["search_type"],  # fulltext, semantic
+    buckets=LATENCY_BUCKETS,
+)
+SEARCH_CANDIDATES = Histogram(
+    "mem8_search_candidates_scored",
+    "Thoughts scored per search",
+    ["search_type"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000),
+)
+SEARCH_EMBEDDING_SECONDS = Histogram(
+    "mem8_search_embedding_seconds",
+    "Time spent computing embeddings for one semantic search",
+    buckets=LATENCY_BUCKETS,
+)
+
+# Filesystem thoughts
+FILESYSTEM_SCAN_SECONDS = Histogram(
+    "mem8_filesystem_scan_seconds",
+    "Time to discover thoughts on the filesystem, including worktrees",
+    buckets=LATENCY_BUCKETS,
+)
+
+# WebSocket fan-out
+WEBSOCKET_CONNECTIONS = Gauge(
+    "mem8_websocket_connections",
+    "Open real-time sync WebSocket connections",
+)
+WEBSOCKET_SEND_QUEUE_DEPTH = Gauge(
+    "mem8_websocket_send_queue_depth",
+    "Messages waiting in WebSocket send queues across all connections",
+)
+WEBSOCKET_SEND_SECONDS = Histogram(
+    "mem8_websocket_send_seconds",
+    "Time spent sending one message to one WebSocket client",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+WEBSOCKET_MESSAGES_DROPPED = Counter(
+    "mem8_websocket_messages_dropped_total",
+    "Messages not delivered to a slow WebSocket client",
+    ["reason"],  # drop, coalesce, disconnect
+)
+WEBSOCKET_SLOW_CONSUMER_DISCONNECTS = Counter(
+    "mem8_websocket_slow_consumer_disconnects_total",
+    "WebSocket clients disconnected for falling behind",
+)
+
+# Response cache
+RESPONSE_CACHE_REQUESTS = Counter(
+    "mem8_response_cache_requests_total",
+    "Response cache lookups",
+    ["endpoint", "result"],  # endpoint: search, thoughts, stats; result: hit, miss
+)
+
+# Authentication
+USER_CACHE_REQUESTS = Counter(
+    "mem8_user_cache_requests_total",
+    "Authenticated user lookups by cache result",
+    ["result"],  # hit, miss
+)
+AUTH_SECONDS = Histogram(
+    "mem8_auth_seconds",
+    "Time to resolve the user of an access token",
+    ["source"],  # cache, database
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+
+_SQL_OPERATIONS = ("select", "insert", "update", "delete")
+_HTTP_METHODS = frozenset(("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"))
+
+
+def _status_class(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+def _method(scope: Scope) -> str:
+    # Clients can send any verb; keep the label to the standard ones
+    method = scope["method"]
+    return method if method in _HTTP_METHODS else "other"
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    # Newer FastAPI matches the router's own route and keeps the include prefix aside
+    fastapi_scope = scope.get("fastapi")
+    included = fastapi_scope.get("included_router") if isinstance(fastapi_scope, dict) else None
+    prefix = getattr(getattr(included, "include_context", None), "prefix", "")
+    return f"{prefix}{route.path}"
+
+
+class PrometheusMiddleware:
+    """Record HTTP latency per route template.
+
+    The route label is the matched path template (``/api/v1/thoughts/{thought_id}``),
+    or ``unmatched`` for 404s, and nonstandard methods are labelled ``other``,
+    so label values stay bounded.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            HTTP_REQUEST_SECONDS.labels(
+                method=_method(scope),
+                route=_route_template(scope),
+                status=_status_class(status_code),
+            ).observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every SQL statement run by ``engine`` (pass ``async_engine.sync_engine``)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("mem8_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["mem8_query_start"].pop()
+        operation = statement.lstrip()[:6].lower()
+        DB_QUERY_SECONDS.labels(
+            operation=operation if operation in _SQL_OPERATIONS else "other"
+        ).observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        starts = context.connection.info.get("mem8_query_start") if context.connection else None
+        if starts:
+            starts.pop()
@@ -1,15 +1,17 @@
 """Database models for mem8 API."""
 
 from .base import TimestampMixin, UUIDMixin
-from .thought import Thought
-from .team import Team, TeamMember
+from .thought import Thought, ThoughtTag
+from .team import Team, TeamMember, TeamStats
 from .user import User
 
 __all__ = [
     "TimestampMixin",
     "UUIDMixin", 
     "Thought",
+    "ThoughtTag",
     "Team",
     "TeamMember",
+    "TeamStats",
     "User",
 ]
\ No newline at end of file
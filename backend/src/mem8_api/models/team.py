@@ -1,10 +1,11 @@
 """Team models."""
 
 import uuid
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -69,4 +70,23 @@ class TeamMember(Base, UUIDMixin, TimestampMixin):
     user = relationship("User", back_populates="team_memberships")
     
     def __repr__(self) -> str:
-        return f"<TeamMember(team_id={self.team_id}, user_id={self.user_id}, role={self.role})>"
\ No newline at end of file
+        return f"<TeamMember(team_id={self.team_id}, user_id={self.user_id}, role={self.role})>"
+
+
+class TeamStats(Base):
+    """Aggregate thought counters per team, maintained on every thought write."""
+    
+    __tablename__ = "team_stats"
+    
+    team_id: Mapped[uuid.UUID] = mapped_column(
+        UuidType,
+        ForeignKey("teams.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    thought_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    word_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    archived_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    last_updated: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    def __repr__(self) -> str:
+        return f"<TeamStats(team_id={self.team_id}, thought_count={self.thought_count})>"
@@ -50,7 +50,8 @@ class Thought(Base, UUIDMixin, TimestampMixin):
     
     # Indexes for performance
     __table_args__ = (
-        Index("ix_thoughts_team_path", "team_id", "path"),
+        # One thought per path in a team; bulk import upserts on it
+        Index("uq_thoughts_team_path", "team_id", "path", unique=True),
         Index("ix_thoughts_team_title", "team_id", "title"),
         Index("ix_thoughts_content_hash", "content_hash"),
         Index("ix_thoughts_published_team", "is_published", "team_id"),
@@ -64,4 +65,30 @@ class Thought(Base, UUIDMixin, TimestampMixin):
         """Get content excerpt for display."""
         if len(self.content) <= 200:
             return self.content
-        return self.content[:197] + "..."
\ No newline at end of file
+        return self.content[:197] + "..."
+
+
+class ThoughtTag(Base):
+    """One tag of one thought.
+
+    ``Thought.tags`` stays the copy returned to clients; these rows mirror it
+    so tag filters and counts are index lookups instead of JSON scans.
+    """
+    
+    __tablename__ = "thought_tags"
+    
+    thought_id: Mapped[uuid.UUID] = mapped_column(
+        UuidType,
+        ForeignKey("thoughts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(Text, primary_key=True)
+    team_id: Mapped[uuid.UUID] = mapped_column(UuidType, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_thought_tags_team_tag", "team_id", "tag", "thought_id"),
+        Index("ix_thought_tags_tag", "tag", "thought_id"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<ThoughtTag(thought_id={self.thought_id}, tag='{self.tag}')>"
\ No newline at end of file
@@ -5,5 +5,6 @@ __all__ = [
     "thoughts", 
     "search",
     "sync",
+    "file_sync",
     "teams",
 ]
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Authentication router for GitHub OAuth integration."""
 
+import time
+
 import httpx
 import jwt
 from datetime import datetime, timedelta
@@ -11,7 +13,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
 from ..database import get_db
+from ..metrics import AUTH_SECONDS
 from ..models.user import User
+from ..services.user_cache import get_user_cache, user_from_snapshot, user_snapshot
 
 router = APIRouter()
 security = HTTPBearer(auto_error=False)
@@ -113,42 +117,34 @@ async def get_current_user_or_local(
         )
         
     token = auth_header.split(" ")[1]
-    
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token"
-            )
-    except jwt.PyJWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
-    
-    # Get user from database
-    result = await db.execute(
-        User.__table__.select().where(User.id == user_id)
-    )
-    user = result.first()
-    
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
-    
-    return user
+    return await _user_from_token(request, token, db)
+
 
 # Keep the original function for backward compatibility
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user from JWT token."""
-    token = credentials.credentials
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required"
+        )
+    return await _user_from_token(request, credentials.credentials, db)
+
+
+async def _user_from_token(request: Request, token: str, db: AsyncSession) -> User:
+    """Resolve the user named by an access token.
+    
+    The result is kept on the request, so several dependencies share one
+    lookup, and in the user cache, so later requests skip the database.
+    Either way it is a detached :class:`User` without the password hash.
+    """
+    cached = getattr(request.state, "user", None)
+    if cached is not None:
+        return cached
     
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
@@ -164,18 +160,29 @@ async def get_current_user(
             detail="Invalid token"
         )
     
-    # Get user from database
-    result = await db.execute(
-        User.__table__.select().where(User.id == user_id)
-    )
-    user = result.first()
-    
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+    started = time.perf_counter()
+    user_cache = get_user_cache()
+    user = await user_cache.get(user_id)
+    if user is not None:
+        AUTH_SECONDS.labels(source="cache").observe(time.perf_counter() - started)
+    else:
+        # Get user from database
+        result = await db.execute(
+            User.__table__.select().where(User.id == user_id)
         )
+        row = result.first()
+        
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        await user_cache.set(row)
+        # Same detached User as a cache hit, whichever path served the request
+        user = user_from_snapshot(user_snapshot(row))
+        AUTH_SECONDS.labels(source="database").observe(time.perf_counter() - started)
     
+    request.state.user = user
     return user
 
 
@@ -241,6 +248,9 @@ async def github_callback(
         await db.refresh(new_user)
         user = new_user
     
+    # Signing in again always picks up the current user row
+    await get_user_cache().invalidate(user.id)
+    
     # Create access token
     access_token, expire = create_access_token(user.id)
     
@@ -0,0 +1,122 @@
+"""HTTP file sync router.
+
+Protocol for a client syncing its ``memory/`` tree with a team:
+
+1. ``POST /sync/{team_id}/manifest`` with local ``{path: sha256}``; the
+   server returns the entries that differ and the paths it lacks.
+2. ``POST /sync/{team_id}/chunks/missing`` with the chunk hashes of the files
+   to push, then ``PUT /sync/{team_id}/chunks/{sha256}`` for each missing one
+   (zlib-compressed body).
+3. ``POST /sync/{team_id}/commit`` to publish the new versions in one batch.
+4. ``GET /sync/{team_id}/chunks/{sha256}`` to download chunks of changed files.
+"""
+
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+
+from ..models.user import User
+from ..schemas.file_sync import (
+    ChunkQuery,
+    ChunkQueryResponse,
+    ManifestExchangeRequest,
+    ManifestExchangeResponse,
+    SyncCommitRequest,
+    SyncCommitResponse,
+)
+from ..services.file_sync import FileSyncStore, InvalidSyncRequest, get_file_sync_store
+from .auth import get_current_user_or_local
+
+router = APIRouter()
+
+CHUNK_MEDIA_TYPE = "application/zlib"
+
+
+@router.post("/sync/{team_id}/manifest", response_model=ManifestExchangeResponse)
+async def exchange_manifest(
+    team_id: uuid.UUID,
+    request: ManifestExchangeRequest,
+    current_user: User = Depends(get_current_user_or_local),
+    store: FileSyncStore = Depends(get_file_sync_store),
+) -> ManifestExchangeResponse:
+    """Return the server entries that differ from the client's files."""
+    result = await run_in_threadpool(store.exchange, str(team_id), request.files)
+    return ManifestExchangeResponse(**result)
+
+
+@router.post("/sync/{team_id}/chunks/missing", response_model=ChunkQueryResponse)
+async def find_missing_chunks(
+    team_id: uuid.UUID,
+    query: ChunkQuery,
+    current_user: User = Depends(get_current_user_or_local),
+    store: FileSyncStore = Depends(get_file_sync_store),
+) -> ChunkQueryResponse:
+    """Return the chunk hashes the server still needs."""
+    try:
+        missing = await run_in_threadpool(store.missing_chunks, str(team_id), query.chunks)
+    except InvalidSyncRequest as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ChunkQueryResponse(missing=missing)
+
+
+@router.put("/sync/{team_id}/chunks/{chunk_hash}", status_code=status.HTTP_204_NO_CONTENT)
+async def upload_chunk(
+    team_id: uuid.UUID,
+    chunk_hash: str,
+    request: Request,
+    current_user: User = Depends(get_current_user_or_local),
+    store: FileSyncStore = Depends(get_file_sync_store),
+) -> None:
+    """Store one zlib-compressed chunk."""
+    body = await request.body()
+    if len(body) > store.max_chunk_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Chunk exceeds the maximum size"
+        )
+    try:
+        await run_in_threadpool(store.put_chunk, str(team_id), chunk_hash, body)
+    except InvalidSyncRequest as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/sync/{team_id}/chunks/{chunk_hash}")
+async def download_chunk(
+    team_id: uuid.UUID,
+    chunk_hash: str,
+    current_user: User = Depends(get_current_user_or_local),
+    store: FileSyncStore = Depends(get_file_sync_store),
+) -> Response:
+    """Return one zlib-compressed chunk."""
+    try:
+        chunk_path = store.chunk_path(str(team_id), chunk_hash)
+        data = await run_in_threadpool(chunk_path.read_bytes)
+    except InvalidSyncRequest as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chunk not found")
+
+    return Response(
+        content=data,
+        media_type=CHUNK_MEDIA_TYPE,
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
+
+
+@router.post("/sync/{team_id}/commit", response_model=SyncCommitResponse)
+async def commit_files(
+    team_id: uuid.UUID,
+    request: SyncCommitRequest,
+    current_user: User = Depends(get_current_user_or_local),
+    store: FileSyncStore = Depends(get_file_sync_store),
+) -> SyncCommitResponse:
+    """Publish new file versions; stale ones are reported as conflicts."""
+    items = [item.model_dump() for item in request.files]
+    try:
+        revision, committed, conflicts = await run_in_threadpool(store.commit, str(team_id), items)
+    except InvalidSyncRequest as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return SyncCommitResponse(revision=revision, committed=committed, conflicts=conflicts)
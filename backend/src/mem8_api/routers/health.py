@@ -1,15 +1,18 @@
 """Health check router."""
 
+import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from fastapi import APIRouter, Depends
 from sqlalchemy import text, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_db
-from ..models.thought import Thought
 from ..models.team import Team
+from ..services.response_cache import ResponseCache, auth_scope, get_response_cache
+from ..services.team_stats import aggregate_team_stats
+from .sync import connection_manager
 
 router = APIRouter()
 
@@ -51,12 +54,18 @@ async def readiness_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
 
 
 @router.get("/system/stats", response_model=Dict[str, Any])
-async def system_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def system_stats(
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Dict[str, Any]:
     """Get system statistics."""
+    return await cache.get_or_compute("stats", None, auth_scope(None), {}, lambda: _system_stats(db))
+
+
+async def _system_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Compute system statistics from the maintained per-team counters."""
     try:
-        # Get total thoughts count
-        thoughts_result = await db.execute(select(func.count(Thought.id)))
-        total_thoughts = thoughts_result.scalar()
+        totals = await aggregate_team_stats(db)
         
         # Get active teams count  
         teams_result = await db.execute(
@@ -64,14 +73,37 @@ async def system_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
         )
         active_teams = teams_result.scalar()
         
+        sync_status = connection_manager.status()
+        rss_bytes = _process_rss_bytes()
+        
         return {
-            "totalThoughts": total_thoughts,
+            "totalThoughts": totals["thought_count"],
+            "totalWords": totals["word_count"],
+            "archivedThoughts": totals["archived_count"],
+            "lastUpdated": totals["last_updated"].isoformat() if totals["last_updated"] else None,
             "activeTeams": active_teams,
-            # Not yet implemented: return nulls instead of magic numbers
-            "syncStatus": None,
-            "memoryUsage": None,
+            "syncStatus": sync_status["healthy_percent"],
+            "sync": sync_status,
+            "memoryUsage": f"{rss_bytes / (1024 * 1024):.0f}MB" if rss_bytes is not None else None,
+            "memoryBytes": rss_bytes,
         }
     except Exception as e:
         # Prefer explicit error over fabricated fallback values
         from fastapi import HTTPException
         raise HTTPException(status_code=503, detail=f"stats_unavailable: {str(e)}")
+
+
+def _process_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None if the platform doesn't expose it."""
+    try:
+        import psutil
+        
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
@@ -1,93 +1,140 @@
 """Search router."""
 
 import time
+import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
+from ..database import AsyncSessionLocal, get_db
+from ..metrics import SEARCH_CANDIDATES, SEARCH_SECONDS
 from ..models.thought import Thought
 from ..schemas.search import SearchQuery, SearchResponse, SearchResult, SearchType
+from ..services.response_cache import ResponseCache, auth_scope, get_response_cache
 from ..services.search import SearchService
+from ..services.suggestions import SuggestionIndex, get_suggestion_index
+from ..services.tags import has_tags, tag_facets
 
 router = APIRouter()
 
+# Number of tags counted in each search response
+FACET_LIMIT = 20
+
 
 @router.post("/search/", response_model=SearchResponse)
 async def search_thoughts(
     search_query: SearchQuery,
     db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> SearchResponse:
     """Search thoughts using fulltext or experimental semantic search."""
     
     start_time = time.time()
     
-    if search_query.search_type == SearchType.SEMANTIC:
-        # Use semantic search service
-        search_service = SearchService()
-        results = await search_service.semantic_search(
-            query=search_query.query,
-            team_id=search_query.team_id,
-            tags=search_query.tags,
-            path_filter=search_query.path_filter,
-            limit=search_query.limit,
-            offset=search_query.offset,
-            db=db,
+    async def run_search() -> dict:
+        search_started = time.perf_counter()
+        if search_query.search_type == SearchType.SEMANTIC:
+            # Use semantic search service
+            search_service = SearchService()
+            results = await search_service.semantic_search(
+                query=search_query.query,
+                team_id=search_query.team_id,
+                tags=search_query.tags,
+                path_filter=search_query.path_filter,
+                limit=search_query.limit,
+                offset=search_query.offset,
+                db=db,
+            )
+        else:
+            # Use fulltext search
+            results = await _fulltext_search(search_query, db)
+        # Semantic search ranks every candidate, so its facets ignore the text
+        text = search_query.search_type == SearchType.FULLTEXT
+        matches = select(Thought.id).where(*_search_filters(search_query, text=text))
+        facets = await tag_facets(db, matches, FACET_LIMIT)
+        SEARCH_SECONDS.labels(search_type=search_query.search_type.value).observe(
+            time.perf_counter() - search_started
         )
-    else:
-        # Use fulltext search
-        results = await _fulltext_search(search_query, db)
+        return {
+            "results": [result.model_dump(mode="json") for result in results],
+            "facets": facets,
+        }
+    
+    # Fulltext matching and scoring ignore case and surrounding whitespace
+    query_key = search_query.query
+    if search_query.search_type == SearchType.FULLTEXT:
+        query_key = query_key.strip().lower()
+    
+    results = await cache.get_or_compute(
+        "search",
+        search_query.team_id,
+        auth_scope(None),
+        {
+            "query": query_key,
+            "search_type": search_query.search_type.value,
+            "tags": sorted(set(search_query.tags or [])),
+            "path_filter": search_query.path_filter,
+            "limit": search_query.limit,
+            "offset": search_query.offset,
+            "facets": FACET_LIMIT,
+        },
+        run_search,
+    )
     
     # Calculate execution time
     took_ms = (time.time() - start_time) * 1000
     
     return SearchResponse(
-        results=results,
-        total=len(results),  # TODO: Implement proper total counting
+        results=results["results"],
+        total=len(results["results"]),  # TODO: Implement proper total counting
         query=search_query.query,
         search_type=search_query.search_type,
         took_ms=took_ms,
+        facets=results["facets"],
     )
 
 
-async def _fulltext_search(
-    search_query: SearchQuery,
-    db: AsyncSession,
-) -> list[SearchResult]:
-    """Perform fulltext search using PostgreSQL."""
+def _search_filters(search_query: SearchQuery, text: bool = True) -> list:
+    """WHERE clauses selecting the thoughts a search matches."""
     
-    # Build base query
-    query = select(Thought).where(
+    filters = [
         Thought.is_published,
-        not Thought.is_archived,
-    )
+        Thought.is_archived.is_(False),
+    ]
     
     # Apply team filter
     if search_query.team_id:
-        query = query.where(Thought.team_id == search_query.team_id)
+        filters.append(Thought.team_id == str(search_query.team_id))
     
     # Apply tag filters
     if search_query.tags:
-        tag_filters = []
-        for tag in search_query.tags:
-            tag_filters.append(Thought.tags.contains([tag]))
-        query = query.where(and_(*tag_filters))
+        filters.append(has_tags(search_query.tags, search_query.team_id))
     
     # Apply path filter
     if search_query.path_filter:
-        query = query.where(Thought.path.ilike(f"%{search_query.path_filter}%"))
+        filters.append(Thought.path.ilike(f"%{search_query.path_filter}%"))
     
     # Apply text search
     search_terms = search_query.query.strip()
-    if search_terms:
+    if text and search_terms:
         # Simple text search in title and content
-        text_filter = or_(
+        filters.append(or_(
             Thought.title.ilike(f"%{search_terms}%"),
             Thought.content.ilike(f"%{search_terms}%")
-        )
-        query = query.where(text_filter)
+        ))
+    
+    return filters
+
+
+async def _fulltext_search(
+    search_query: SearchQuery,
+    db: AsyncSession,
+) -> list[SearchResult]:
+    """Perform fulltext search using PostgreSQL."""
+    
+    query = select(Thought).where(*_search_filters(search_query))
     
     # Apply pagination
     query = query.offset(search_query.offset).limit(search_query.limit)
@@ -95,6 +142,7 @@ async def _fulltext_search(
     # Execute query
     result = await db.execute(query)
     thoughts = result.scalars().all()
+    SEARCH_CANDIDATES.labels(search_type=SearchType.FULLTEXT.value).observe(len(thoughts))
     
     # Convert to search results
     search_results = []
@@ -195,37 +243,15 @@ def _calculate_relevance_score(thought: Thought, query: str) -> float:
 async def get_search_suggestions(
     query: str = Query(..., min_length=1, description="Partial search query"),
     limit: int = Query(10, ge=1, le=20, description="Number of suggestions"),
-    team_id: Optional[str] = Query(None, description="Team ID to filter by"),
-    db: AsyncSession = Depends(get_db),
+    team_id: Optional[uuid.UUID] = Query(None, description="Team ID to filter by"),
+    index: SuggestionIndex = Depends(get_suggestion_index),
 ) -> list[str]:
-    """Get search suggestions based on partial query."""
-    
-    # Simple implementation: return frequent terms from titles
-    query_filter = Thought.title.ilike(f"%{query}%")
-    
-    if team_id:
-        query_filter = and_(query_filter, Thought.team_id == team_id)
-    
-    result = await db.execute(
-        select(Thought.title)
-        .where(
-            query_filter,
-            Thought.is_published,
-            not Thought.is_archived,
-        )
-        .limit(limit)
-    )
-    
-    titles = result.scalars().all()
-    
-    # Extract unique words that start with the query
-    suggestions = set()
-    query_lower = query.lower()
-    
-    for title in titles:
-        words = title.lower().split()
-        for word in words:
-            if word.startswith(query_lower) and len(word) > len(query):
-                suggestions.add(word)
-    
-    return sorted(list(suggestions))[:limit]
\ No newline at end of file
+    """Complete the last word of a partial query from title words and tags.
+    
+    Suggestions come from the in-memory term index, most used terms first;
+    only a team's first request reads the database.
+    """
+    words = query.lower().split()
+    if not words:
+        return []
+    return await index.suggest(AsyncSessionLocal, words[-1], limit, team_id)
@@ -1,22 +1,179 @@
 """Sync router for WebSocket real-time synchronization."""
 
+import asyncio
 import json
-from typing import Dict, Set
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from ..config import get_settings
+from ..metrics import (
+    WEBSOCKET_CONNECTIONS,
+    WEBSOCKET_MESSAGES_DROPPED,
+    WEBSOCKET_SEND_QUEUE_DEPTH,
+    WEBSOCKET_SEND_SECONDS,
+    WEBSOCKET_SLOW_CONSUMER_DISCONNECTS,
+)
+from ..services.backplane import Backplane, InProcessBackplane
+from ..services.realtime import PathTrie, thought_diff
+
 
 router = APIRouter()
 
+SLOW_CONSUMER_POLICIES = ("drop", "coalesce", "disconnect")
+
+
+class ClientConnection:
+    """A WebSocket client with a bounded send queue drained by its own writer task.
+
+    When the queue is full the slow-consumer policy decides what happens:
+
+    - ``drop``: discard the oldest queued message
+    - ``coalesce``: replace a queued message with the same key (e.g. an older
+      full update of the same thought), otherwise discard the oldest
+    - ``disconnect``: close the connection
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int,
+        policy: str,
+        send_timeout: float,
+    ):
+        self.websocket = websocket
+        self.max_queue = max(1, max_queue)
+        self.policy = policy if policy in SLOW_CONSUMER_POLICIES else "coalesce"
+        self.send_timeout = send_timeout
+        self.closed = False
+        self._queue: Deque[Tuple[Optional[str], str]] = deque()
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of queued messages."""
+        return len(self._queue)
+
+    def start(self, on_failure) -> None:
+        """Start the writer task; ``on_failure(websocket)`` is awaited if sending fails or times out."""
+        self._writer = asyncio.create_task(self._write_loop(on_failure))
+
+    def enqueue(self, message_text: str, key: Optional[str] = None) -> bool:
+        """Queue a message without waiting. Returns False if the client must be dropped."""
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if self.policy == "disconnect":
+                WEBSOCKET_MESSAGES_DROPPED.labels(reason="disconnect").inc()
+                WEBSOCKET_SLOW_CONSUMER_DISCONNECTS.inc()
+                return False
+
+            if self.policy == "coalesce" and key is not None:
+                for index, (queued_key, _) in enumerate(self._queue):
+                    if queued_key == key:
+                        self._queue[index] = (key, message_text)
+                        WEBSOCKET_MESSAGES_DROPPED.labels(reason="coalesce").inc()
+                        return True
+
+            self._queue.popleft()
+            WEBSOCKET_SEND_QUEUE_DEPTH.dec()
+            WEBSOCKET_MESSAGES_DROPPED.labels(reason="drop").inc()
+
+        self._queue.append((key, message_text))
+        WEBSOCKET_SEND_QUEUE_DEPTH.inc()
+        self._ready.set()
+        return True
+
+    async def _write_loop(self, on_failure) -> None:
+        try:
+            while True:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                _, message_text = self._queue.popleft()
+                WEBSOCKET_SEND_QUEUE_DEPTH.dec()
+
+                started = time.perf_counter()
+                await asyncio.wait_for(self.websocket.send_text(message_text), self.send_timeout)
+                WEBSOCKET_SEND_SECONDS.observe(time.perf_counter() - started)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection is dead or too slow; a timed-out send may have left a
+            # partial frame, so the socket has to be closed, not just forgotten
+            await on_failure(self.websocket)
+
+    def close(self) -> None:
+        """Stop the writer task and discard queued messages."""
+        self.closed = True
+        WEBSOCKET_SEND_QUEUE_DEPTH.dec(len(self._queue))
+        self._queue.clear()
+        writer = self._writer
+        if writer is not None and not writer.done() and writer is not asyncio.current_task():
+            writer.cancel()
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for real-time sync."""
+    """Manages WebSocket connections for real-time sync.
+
+    Each connection gets a bounded send queue and a writer task, so a
+    broadcast only enqueues and one slow client cannot stall the others.
+    
+    Connections that subscribe to paths only receive changes under those
+    paths; connections without subscriptions receive every team change.
+    
+    Events go through :meth:`publish`, which delivers to local connections
+    and hands the event to the backplane for the other API workers.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_queue: Optional[int] = None,
+        policy: Optional[str] = None,
+        send_timeout: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.max_queue = max_queue or settings.ws_send_queue_size
+        self.policy = policy or settings.ws_slow_consumer_policy
+        self.send_timeout = send_timeout or settings.ws_send_timeout
         # Store active connections by team_id
         self.team_connections: Dict[str, Set[WebSocket]] = {}
         # Store connection metadata
         self.connection_info: Dict[WebSocket, Dict] = {}
+        # Outgoing queue and writer per connection
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        # Path subscriptions by team_id
+        self.team_subscriptions: Dict[str, PathTrie[WebSocket]] = {}
+        # Relays events to and from other workers
+        self.backplane: Backplane = InProcessBackplane()
+    
+    async def start_backplane(self, backplane: Backplane):
+        """Switch to ``backplane`` and start relaying events from other workers."""
+        await self.backplane.close()
+        self.backplane = backplane
+        await backplane.start(self._relay)
+    
+    async def stop_backplane(self):
+        """Stop relaying and fall back to single-worker delivery."""
+        await self.backplane.close()
+        self.backplane = InProcessBackplane()
+    
+    async def _relay(self, envelope: Dict[str, Any]):
+        """Deliver an event published by another worker to local connections."""
+        await self.broadcast_to_team(
+            str(envelope["team_id"]),
+            envelope["message"],
+            coalesce_key=envelope.get("coalesce_key"),
+            path=envelope.get("path"),
+            previous_path=envelope.get("previous_path"),
+        )
     
     async def connect(self, websocket: WebSocket, team_id: str, user_id: str = None):
         """Accept a new WebSocket connection."""
@@ -31,13 +188,27 @@ class ConnectionManager:
         self.connection_info[websocket] = {
             "team_id": team_id,
             "user_id": user_id,
+            "paths": set(),
         }
+        
+        client = ClientConnection(websocket, self.max_queue, self.policy, self.send_timeout)
+        client.start(self._close)
+        self.clients[websocket] = client
+        WEBSOCKET_CONNECTIONS.inc()
     
     def disconnect(self, websocket: WebSocket):
-        """Remove a WebSocket connection."""
+        """Remove a WebSocket connection; does nothing if it is already gone."""
+        client = self.clients.pop(websocket, None)
+        if client is not None:
+            client.close()
+            WEBSOCKET_CONNECTIONS.dec()
+        
         if websocket in self.connection_info:
             team_id = self.connection_info[websocket]["team_id"]
             
+            for path in list(self.connection_info[websocket]["paths"]):
+                self.unsubscribe(websocket, path)
+            
             # Remove from team connections
             if team_id in self.team_connections:
                 self.team_connections[team_id].discard(websocket)
@@ -47,35 +218,133 @@ class ConnectionManager:
             # Remove connection info
             del self.connection_info[websocket]
     
-    async def broadcast_to_team(self, team_id: str, message: dict, exclude_websocket: WebSocket = None):
-        """Broadcast a message to all connections in a team."""
+    def subscribe(self, websocket: WebSocket, path: str) -> Set[str]:
+        """Limit a connection to changes under ``path``; returns its subscriptions."""
+        info = self.connection_info[websocket]
+        team_id = info["team_id"]
+        self.team_subscriptions.setdefault(team_id, PathTrie()).add(path, websocket)
+        info["paths"].add(path)
+        return info["paths"]
+    
+    def unsubscribe(self, websocket: WebSocket, path: str) -> Set[str]:
+        """Drop one path subscription; returns the remaining ones."""
+        info = self.connection_info[websocket]
+        team_id = info["team_id"]
+        trie = self.team_subscriptions.get(team_id)
+        if trie is not None:
+            trie.remove(path, websocket)
+            if not trie:
+                del self.team_subscriptions[team_id]
+        info["paths"].discard(path)
+        return info["paths"]
+    
+    def recipients(self, team_id: str, *paths: Optional[str]) -> Set[WebSocket]:
+        """Connections of a team interested in a change to any of ``paths``."""
+        connections = self.team_connections.get(team_id, set())
+        trie = self.team_subscriptions.get(team_id)
+        paths = tuple(path for path in paths if path is not None)
+        if not paths or trie is None:
+            return set(connections)
+        
+        matched = {ws for ws in connections if not self.connection_info[ws]["paths"]}
+        for path in paths:
+            matched |= trie.match(path)
+        return matched
+    
+    async def publish(
+        self,
+        team_id: str,
+        message: dict,
+        exclude_websocket: WebSocket = None,
+        coalesce_key: Optional[str] = None,
+        path: Optional[str] = None,
+        previous_path: Optional[str] = None,
+    ):
+        """Broadcast to local connections and to those of every other worker."""
+        await self.broadcast_to_team(
+            team_id, message, exclude_websocket, coalesce_key, path, previous_path
+        )
+        await self.backplane.publish(team_id, {
+            "message": message,
+            "coalesce_key": coalesce_key,
+            "path": path,
+            "previous_path": previous_path,
+        })
+    
+    async def broadcast_to_team(
+        self,
+        team_id: str,
+        message: dict,
+        exclude_websocket: WebSocket = None,
+        coalesce_key: Optional[str] = None,
+        path: Optional[str] = None,
+        previous_path: Optional[str] = None,
+    ):
+        """Broadcast a message to the local connections of a team.
+        
+        With a ``path`` only connections subscribed to it, to
+        ``previous_path`` (for moves) or to nothing receive the message.
+        The message is serialized once and queued for every recipient;
+        delivery happens concurrently in each connection's writer task.
+        """
         if team_id not in self.team_connections:
             return
         
+        recipients = self.recipients(team_id, path, previous_path)
+        if not recipients:
+            return
         message_text = json.dumps(message)
         
-        # Send to all team connections except the excluded one
+        # Queue for all recipients except the excluded one
         connections_to_remove = []
-        for websocket in self.team_connections[team_id]:
+        for websocket in recipients:
             if websocket == exclude_websocket:
                 continue
             
-            try:
-                await websocket.send_text(message_text)
-            except Exception:
-                # Connection is dead, mark for removal
+            client = self.clients.get(websocket)
+            if client is None or not client.enqueue(message_text, coalesce_key):
                 connections_to_remove.append(websocket)
         
-        # Clean up dead connections
+        # Clean up dead and slow connections
         for websocket in connections_to_remove:
-            self.disconnect(websocket)
+            await self._close(websocket)
     
     async def send_to_websocket(self, websocket: WebSocket, message: dict):
         """Send a message to a specific WebSocket."""
+        client = self.clients.get(websocket)
+        if client is None or not client.enqueue(json.dumps(message)):
+            await self._close(websocket)
+    
+    async def _close(self, websocket: WebSocket):
+        """Drop a connection and close the socket if it is still open."""
+        self.disconnect(websocket)
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.close(code=1013)  # Try again later
         except Exception:
-            self.disconnect(websocket)
+            pass
+    
+    def status(self) -> Dict[str, Any]:
+        """Summary of real-time sync health for this worker.
+        
+        A connection counts as healthy while its send queue is under half
+        full; ``healthy_percent`` is 100 when nobody is connected.
+        """
+        depths = [client.depth for client in self.clients.values()]
+        healthy = sum(1 for depth in depths if depth < self.max_queue / 2)
+        return {
+            "connections": len(depths),
+            "teams": len(self.team_connections),
+            "queued_messages": sum(depths),
+            "healthy_percent": round(100 * healthy / len(depths)) if depths else 100,
+            "backplane": self.backplane.name,
+        }
+    
+    def queue_depths(self) -> Dict[str, int]:
+        """Total queued messages per team, for diagnostics."""
+        return {
+            team_id: sum(self.clients[ws].depth for ws in sockets if ws in self.clients)
+            for team_id, sockets in self.team_connections.items()
+        }
 
 
 # Global connection manager
@@ -97,7 +366,7 @@ async def websocket_sync(
         await connection_manager.send_to_websocket(websocket, {
             "type": "connection_established",
             "team_id": team_id,
-            "timestamp": "2025-01-01T00:00:00Z"  # TODO: Use proper timestamp
+            "timestamp": _now(),
         })
         
         while True:
@@ -119,6 +388,9 @@ async def websocket_sync(
                 })
     
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Also covers sockets closed by the writer and failed sends or receives
         connection_manager.disconnect(websocket)
 
 
@@ -134,7 +406,12 @@ async def handle_sync_message(websocket: WebSocket, team_id: str, message: dict)
         await broadcast_thought_change(team_id, "thought_updated", message.get("thought"), websocket)
     
     elif message_type == "thought_deleted":
-        await broadcast_thought_change(team_id, "thought_deleted", {"id": message.get("thought_id")}, websocket)
+        await broadcast_thought_change(
+            team_id,
+            "thought_deleted",
+            {"id": message.get("thought_id"), "path": message.get("path")},
+            websocket,
+        )
     
     elif message_type == "ping":
         await connection_manager.send_to_websocket(websocket, {
@@ -142,11 +419,26 @@ async def handle_sync_message(websocket: WebSocket, team_id: str, message: dict)
             "timestamp": message.get("timestamp")
         })
     
-    elif message_type == "subscribe_to_path":
-        # TODO: Implement path-based subscriptions
+    elif message_type in ("subscribe_to_path", "unsubscribe_from_path"):
+        path = message.get("path")
+        if not isinstance(path, str):
+            await connection_manager.send_to_websocket(websocket, {
+                "type": "error",
+                "error": "Subscription path must be a string"
+            })
+            return
+        
+        if message_type == "subscribe_to_path":
+            paths = connection_manager.subscribe(websocket, path)
+            reply_type = "subscribed"
+        else:
+            paths = connection_manager.unsubscribe(websocket, path)
+            reply_type = "unsubscribed"
+        
         await connection_manager.send_to_websocket(websocket, {
-            "type": "subscribed",
-            "path": message.get("path")
+            "type": reply_type,
+            "path": path,
+            "paths": sorted(paths),
         })
     
     else:
@@ -167,45 +459,103 @@ async def broadcast_thought_change(
     message = {
         "type": change_type,
         "thought": thought_data,
-        "timestamp": "2025-01-01T00:00:00Z"  # TODO: Use proper timestamp
+        "timestamp": _now(),
     }
     
-    await connection_manager.broadcast_to_team(team_id, message, exclude_websocket)
+    await connection_manager.publish(
+        team_id,
+        message,
+        exclude_websocket,
+        coalesce_key=_thought_key(change_type, thought_data),
+        path=_thought_path(thought_data),
+    )
+
+
+def _thought_key(change_type: str, thought_data: Optional[dict]) -> Optional[str]:
+    """Coalescing key so a slow client only keeps the latest event of a type per thought.
+
+    Events of different types never replace each other: a delete taking the
+    queue slot of the create would overtake the updates queued after it.
+    """
+    if isinstance(thought_data, dict) and thought_data.get("id") is not None:
+        return f"{change_type}:{thought_data['id']}"
+    return None
+
+
+def _thought_path(thought_data: Optional[dict]) -> Optional[str]:
+    """Path used to route a change to subscribers; None reaches everyone."""
+    if isinstance(thought_data, dict) and isinstance(thought_data.get("path"), str):
+        return thought_data["path"]
+    return None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 # Utility functions for triggering sync events from other parts of the app
 
 async def notify_thought_created(team_id: str, thought_data: dict):
     """Notify team members about a new thought."""
-    await connection_manager.broadcast_to_team(
+    await connection_manager.publish(
         str(team_id),
         {
             "type": "thought_created",
             "thought": thought_data,
-            "timestamp": "2025-01-01T00:00:00Z"
-        }
+            "timestamp": _now(),
+        },
+        coalesce_key=_thought_key("thought_created", thought_data),
+        path=_thought_path(thought_data),
     )
 
 
-async def notify_thought_updated(team_id: str, thought_data: dict):
-    """Notify team members about an updated thought."""
-    await connection_manager.broadcast_to_team(
+async def notify_thought_updated(
+    team_id: str,
+    thought_data: dict,
+    previous: Optional[Dict[str, Any]] = None,
+):
+    """Notify team members about an updated thought.
+    
+    The event carries only what changed relative to ``previous``. A thought
+    moved to another path is announced to subscribers of both paths.
+    """
+    diff = thought_diff(previous, thought_data)
+    await connection_manager.publish(
         str(team_id),
         {
             "type": "thought_updated",
-            "thought": thought_data,
-            "timestamp": "2025-01-01T00:00:00Z"
-        }
+            "thought": diff,
+            "timestamp": _now(),
+        },
+        # A delta depends on the events before it, so it must never replace one
+        coalesce_key=_thought_key("thought_updated", thought_data) if previous is None else None,
+        path=diff["path"],
+        previous_path=diff.get("previous_path"),
     )
 
 
-async def notify_thought_deleted(team_id: str, thought_id: str):
+async def notify_thought_deleted(team_id: str, thought_id: str, path: Optional[str] = None):
     """Notify team members about a deleted thought."""
-    await connection_manager.broadcast_to_team(
+    await connection_manager.publish(
         str(team_id),
         {
             "type": "thought_deleted",
-            "thought": {"id": thought_id},
-            "timestamp": "2025-01-01T00:00:00Z"
-        }
-    )
\ No newline at end of file
+            "thought": {"id": thought_id, "path": path},
+            "timestamp": _now(),
+        },
+        coalesce_key=_thought_key("thought_deleted", {"id": thought_id}),
+        path=path,
+    )
+
+
+async def notify_thoughts_imported(team_id: str, created: int, updated: int):
+    """Notify team members that a bulk import changed many thoughts at once."""
+    await connection_manager.publish(
+        str(team_id),
+        {
+            "type": "thoughts_imported",
+            "created": created,
+            "updated": updated,
+            "timestamp": _now(),
+        },
+    )
@@ -1,23 +1,41 @@
 """Thoughts router."""
 
+import json
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
 from sqlalchemy import and_, func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import get_settings
 from ..database import get_db
 from ..models.thought import Thought
 from ..models.user import User
 from ..schemas.thought import (
     ThoughtCreate,
+    ThoughtImportError,
+    ThoughtImportItem,
+    ThoughtImportResponse,
     ThoughtListResponse,
     ThoughtResponse,
     ThoughtUpdate,
 )
 from .auth import get_current_user_or_local
+from .sync import (
+    notify_thought_created,
+    notify_thought_deleted,
+    notify_thought_updated,
+    notify_thoughts_imported,
+)
 from ..services.filesystem_thoughts import get_filesystem_thoughts
+from ..services.response_cache import ResponseCache, auth_scope, get_response_cache
+from ..services.suggestions import get_suggestion_index
+from ..services.tags import delete_thought_tags, has_any_tag, has_tags, normalize_tags, set_thought_tags
+from ..services.team_stats import record_thought_change
+from ..services.thought_import import ThoughtImporter
 
 router = APIRouter()
 
@@ -33,24 +51,51 @@ async def list_thoughts(
     page_size: int = Query(20, ge=1, le=100, description="Page size"),
     current_user: User = Depends(get_current_user_or_local),
     db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> ThoughtListResponse:
     """List thoughts with filtering and pagination."""
     
+    return await cache.get_or_compute(
+        "thoughts",
+        team_id,
+        auth_scope(current_user),
+        {
+            "tags": sorted(set(tags or [])),
+            "search": search,
+            "is_published": is_published,
+            "is_archived": is_archived,
+            "page": page,
+            "page_size": page_size,
+        },
+        lambda: _list_thoughts(team_id, tags, search, is_published, is_archived, page, page_size, db),
+    )
+
+
+async def _list_thoughts(
+    team_id: Optional[uuid.UUID],
+    tags: Optional[List[str]],
+    search: Optional[str],
+    is_published: Optional[bool],
+    is_archived: Optional[bool],
+    page: int,
+    page_size: int,
+    db: AsyncSession,
+) -> dict:
+    """Query one page of thoughts as a JSON-ready ThoughtListResponse."""
+    
     # Build query
     query = select(Thought)
     
     # Apply filters
     filters = []
     if team_id:
-        filters.append(Thought.team_id == team_id)
+        filters.append(Thought.team_id == str(team_id))
     if is_published is not None:
         filters.append(Thought.is_published == is_published)
     if is_archived is not None:
         filters.append(Thought.is_archived == is_archived)
     if tags:
-        # Filter by tags (PostgreSQL array contains)
-        for tag in tags:
-            filters.append(Thought.tags.contains([tag]))
+        filters.append(has_tags(tags, team_id))
     if search:
         # Search in title and content
         search_filter = or_(
@@ -86,7 +131,7 @@ async def list_thoughts(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-    )
+    ).model_dump(mode="json")
 
 
 @router.post("/thoughts/", response_model=ThoughtResponse, status_code=status.HTTP_201_CREATED)
@@ -94,6 +139,7 @@ async def create_thought(
     thought_data: ThoughtCreate,
     current_user: User = Depends(get_current_user_or_local),
     db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> ThoughtResponse:
     """Create a new thought."""
     
@@ -107,7 +153,7 @@ async def create_thought(
         path=thought_data.path,
         team_id=thought_data.team_id,
         thought_metadata=thought_data.thought_metadata or {},
-        tags=thought_data.tags or [],
+        tags=normalize_tags(thought_data.tags),
         is_published=thought_data.is_published,
         is_archived=thought_data.is_archived,
         word_count=word_count,
@@ -119,12 +165,101 @@ async def create_thought(
     thought.content_hash = content_hash
     
     db.add(thought)
-    await db.commit()
+    try:
+        await set_thought_tags(db, thought)
+        await record_thought_change(db, thought.team_id, None, thought)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A thought already exists at this path"
+        )
     await db.refresh(thought)
     
+    get_suggestion_index().record(thought.team_id, None, thought)
+    await cache.invalidate(thought.team_id)
+    await notify_thought_created(thought.team_id, _thought_event_data(thought))
+    
     return thought
 
 
+# Stop reporting individual bad lines after this many
+MAX_IMPORT_ERRORS = 100
+
+
+@router.post("/thoughts/import", response_model=ThoughtImportResponse)
+async def import_thoughts(
+    request: Request,
+    team_id: uuid.UUID = Query(..., description="Team to import into"),
+    current_user: User = Depends(get_current_user_or_local),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> ThoughtImportResponse:
+    """Bulk create or update thoughts from an NDJSON stream.
+    
+    Each line is a ThoughtImportItem. Thoughts are matched by path within
+    the team; unchanged content is skipped. Lines are written in batches as
+    they arrive, one transaction per batch, and bad lines are reported
+    without stopping the import.
+    """
+    settings = get_settings()
+    importer = ThoughtImporter(db, team_id, settings.import_batch_size)
+    errors: List[ThoughtImportError] = []
+    # A line holds one thought: its content plus JSON escaping and fields
+    max_line = settings.max_file_size * 2
+    
+    async def handle(line_number: int, line: bytes) -> None:
+        if not line.strip():
+            return
+        data = None
+        try:
+            data = json.loads(line)
+            item = ThoughtImportItem.model_validate(data)
+        except ValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc']) or 'line'}: {err['msg']}"
+                for err in e.errors()
+            )
+        except ValueError as e:
+            error = f"Invalid JSON: {e}"
+        else:
+            await importer.add(item)
+            return
+        
+        if len(errors) < MAX_IMPORT_ERRORS:
+            path = data.get("path") if isinstance(data, dict) else None
+            errors.append(ThoughtImportError(
+                line=line_number,
+                path=path if isinstance(path, str) else None,
+                error=error,
+            ))
+    
+    buffer = b""
+    line_number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            await handle(line_number, line)
+        if len(buffer) > max_line:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Line {line_number + 1} exceeds the maximum size"
+            )
+    await handle(line_number + 1, buffer)
+    
+    result = await importer.finish()
+    result.errors = errors
+    
+    if result.created or result.updated:
+        await cache.invalidate(team_id)
+        await notify_thoughts_imported(team_id, result.created, result.updated)
+    
+    return result
+
+
 @router.get("/thoughts/from-filesystem")
 async def list_filesystem_thoughts(
     search: Optional[str] = Query(None, description="Search in title and content"),
@@ -181,6 +316,7 @@ async def update_thought(
     thought_id: uuid.UUID,
     thought_update: ThoughtUpdate,
     db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> ThoughtResponse:
     """Update a specific thought."""
     
@@ -196,9 +332,13 @@ async def update_thought(
             detail="Thought not found"
         )
     
+    previous = _thought_event_data(thought)
+    
     # Update fields
     update_data = thought_update.dict(exclude_unset=True)
     
+    if "tags" in update_data:
+        update_data["tags"] = normalize_tags(update_data["tags"])
     for field, value in update_data.items():
         setattr(thought, field, value)
     
@@ -210,9 +350,23 @@ async def update_thought(
         import hashlib
         thought.content_hash = hashlib.sha256(thought.content.encode()).hexdigest()
     
-    await db.commit()
+    try:
+        if "tags" in update_data:
+            await set_thought_tags(db, thought)
+        await record_thought_change(db, thought.team_id, previous, thought)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A thought already exists at this path"
+        )
     await db.refresh(thought)
     
+    get_suggestion_index().record(thought.team_id, previous, thought)
+    await cache.invalidate(thought.team_id)
+    await notify_thought_updated(thought.team_id, _thought_event_data(thought), previous)
+    
     return thought
 
 
@@ -220,6 +374,7 @@ async def update_thought(
 async def delete_thought(
     thought_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> None:
     """Delete a specific thought."""
     
@@ -234,8 +389,15 @@ async def delete_thought(
             detail="Thought not found"
         )
     
+    team_id, path = thought.team_id, thought.path
+    await delete_thought_tags(db, thought_id)
     await db.delete(thought)
+    await record_thought_change(db, team_id, thought, None)
     await db.commit()
+    
+    get_suggestion_index().record(team_id, thought, None)
+    await cache.invalidate(team_id)
+    await notify_thought_deleted(team_id, str(thought_id), path)
 
 
 @router.get("/thoughts/{thought_id}/related", response_model=List[ThoughtResponse])
@@ -263,17 +425,12 @@ async def get_related_thoughts(
         Thought.id != thought_id,
         Thought.team_id == source_thought.team_id,
         Thought.is_published,
-        not Thought.is_archived,
+        Thought.is_archived.is_(False),
     ]
     
     # If source thought has tags, prioritize thoughts with shared tags
     if source_thought.tags:
-        tag_filters = []
-        for tag in source_thought.tags:
-            tag_filters.append(Thought.tags.contains([tag]))
-        
-        if tag_filters:
-            filters.append(or_(*tag_filters))
+        filters.append(has_any_tag(source_thought.tags, source_thought.team_id))
     
     query = select(Thought).where(and_(*filters)).limit(limit)
     
@@ -281,3 +438,8 @@ async def get_related_thoughts(
     related_thoughts = result.scalars().all()
     
     return related_thoughts
+
+
+def _thought_event_data(thought: Thought) -> dict:
+    """JSON-ready thought payload for real-time sync events."""
+    return ThoughtResponse.model_validate(thought).model_dump(mode="json")
@@ -6,6 +6,9 @@ from .thought import (
     ThoughtUpdate,
     ThoughtResponse,
     ThoughtListResponse,
+    ThoughtImportItem,
+    ThoughtImportError,
+    ThoughtImportResponse,
 )
 from .team import (
     TeamBase,
@@ -34,6 +37,9 @@ __all__ = [
     "ThoughtUpdate", 
     "ThoughtResponse",
     "ThoughtListResponse",
+    "ThoughtImportItem",
+    "ThoughtImportError",
+    "ThoughtImportResponse",
     # Team schemas
     "TeamBase",
     "TeamCreate",
@@ -0,0 +1,73 @@
+"""HTTP file sync schemas."""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+CHUNK_HASH_PATTERN = r"^[0-9a-f]{64}$"
+
+
+class SyncFileEntry(BaseModel):
+    """A file as recorded in a team's sync manifest."""
+
+    path: str = Field(..., min_length=1, max_length=1000, description="Path relative to memory/")
+    hash: str = Field(..., pattern=CHUNK_HASH_PATTERN, description="SHA-256 of the full content")
+    size: int = Field(..., ge=0, description="Content size in bytes")
+    chunks: List[str] = Field(default_factory=list, description="SHA-256 of each content chunk, in order")
+    mtime: Optional[float] = Field(None, description="Modification time reported by the uploader")
+
+
+class ManifestExchangeRequest(BaseModel):
+    """Client file hashes sent to the manifest exchange endpoint."""
+
+    files: Dict[str, str] = Field(default_factory=dict, description="Path to SHA-256 of local content")
+
+
+class ManifestExchangeResponse(BaseModel):
+    """Server entries the client needs to look at."""
+
+    revision: int = Field(..., description="Manifest revision, bumped on every commit")
+    changed: Dict[str, SyncFileEntry] = Field(
+        default_factory=dict,
+        description="Server entries that differ from, or are unknown to, the client"
+    )
+    missing: List[str] = Field(default_factory=list, description="Client paths the server does not have")
+
+
+class ChunkQuery(BaseModel):
+    """Chunk hashes the client intends to upload."""
+
+    chunks: List[str] = Field(default_factory=list)
+
+
+class ChunkQueryResponse(BaseModel):
+    """Chunk hashes the server does not have yet."""
+
+    missing: List[str] = Field(default_factory=list)
+
+
+class SyncCommitItem(SyncFileEntry):
+    """A file version to publish, guarded by the version it was based on."""
+
+    base_hash: Optional[str] = Field(
+        None,
+        description="Hash the client last saw on the server; null if the file is new"
+    )
+
+
+class SyncCommitRequest(BaseModel):
+    """Batch of file versions to publish in one manifest update."""
+
+    files: List[SyncCommitItem] = Field(default_factory=list)
+
+
+class SyncCommitResponse(BaseModel):
+    """Result of a commit."""
+
+    revision: int
+    committed: List[str] = Field(default_factory=list)
+    conflicts: List[str] = Field(
+        default_factory=list,
+        description="Paths changed on the server since base_hash; not committed"
+    )
@@ -55,3 +55,7 @@ class SearchResponse(BaseModel):
     query: str
     search_type: SearchType
     took_ms: float = Field(..., description="Search execution time in milliseconds")
+    facets: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Most used tags across all matches (not just this page) and their counts",
+    )
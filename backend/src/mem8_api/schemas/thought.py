@@ -60,4 +60,33 @@ class ThoughtListResponse(BaseModel):
     total: int
     page: int
     page_size: int
-    total_pages: int
\ No newline at end of file
+    total_pages: int
+
+
+class ThoughtImportItem(BaseModel):
+    """One NDJSON line of a bulk import; the title defaults to the first heading."""
+    
+    path: str = Field(..., min_length=1, max_length=1000, description="File path")
+    content: str = Field(..., min_length=1, description="Thought content")
+    title: Optional[str] = Field(None, min_length=1, max_length=500, description="Thought title")
+    thought_metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Metadata")
+    tags: Optional[List[str]] = Field(default_factory=list, description="Tags")
+    is_published: bool = Field(default=True, description="Is published")
+    is_archived: bool = Field(default=False, description="Is archived")
+
+
+class ThoughtImportError(BaseModel):
+    """A line that could not be imported."""
+    
+    line: int
+    path: Optional[str] = None
+    error: str
+
+
+class ThoughtImportResponse(BaseModel):
+    """Outcome of a bulk import."""
+    
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: List[ThoughtImportError] = Field(default_factory=list)
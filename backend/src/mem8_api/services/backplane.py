@@ -0,0 +1,177 @@
+"""Pub/sub backplane relaying real-time sync events between API workers.
+
+Every worker delivers an event to its own WebSocket clients directly and
+publishes it to the backplane; the other workers receive it and deliver it
+to theirs. Backends:
+
+- ``inprocess``: single worker, nothing to relay (default)
+- ``redis``: Redis pub/sub on ``settings.redis_url``
+- :class:`InMemoryBackplane`: several "workers" in one process, for tests
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..config import Settings
+
+logger = logging.getLogger(__name__)
+
+Envelope = Dict[str, Any]
+RelayHandler = Callable[[Envelope], Awaitable[None]]
+
+BACKPLANES = ("inprocess", "redis")
+
+
+class Backplane:
+    """Base class: publishes envelopes and feeds remote ones to a handler."""
+
+    name = "none"
+
+    def __init__(self) -> None:
+        # Identifies this worker so it can ignore its own events
+        self.origin = uuid.uuid4().hex
+        self._handler: Optional[RelayHandler] = None
+
+    async def start(self, handler: RelayHandler) -> None:
+        """Begin relaying events published by other workers to ``handler``."""
+        self._handler = handler
+
+    async def publish(self, team_id: str, envelope: Envelope) -> None:
+        """Send an event to the other workers."""
+
+    async def close(self) -> None:
+        """Stop relaying and release connections."""
+        self._handler = None
+
+    async def _deliver(self, envelope: Envelope) -> None:
+        if self._handler is None or envelope.get("origin") == self.origin:
+            return
+        try:
+            await self._handler(envelope)
+        except Exception:
+            logger.exception("Failed to relay sync event for team %s", envelope.get("team_id"))
+
+
+class InProcessBackplane(Backplane):
+    """Single-worker backplane: local delivery already reached everyone."""
+
+    name = "inprocess"
+
+
+class InMemoryHub:
+    """Shared bus connecting :class:`InMemoryBackplane` instances."""
+
+    def __init__(self) -> None:
+        self.members: List["InMemoryBackplane"] = []
+        self.published: List[Envelope] = []
+
+
+class InMemoryBackplane(Backplane):
+    """Backplane whose "workers" are backplanes sharing one :class:`InMemoryHub`."""
+
+    name = "memory"
+
+    def __init__(self, hub: InMemoryHub) -> None:
+        super().__init__()
+        self.hub = hub
+
+    async def start(self, handler: RelayHandler) -> None:
+        await super().start(handler)
+        self.hub.members.append(self)
+
+    async def publish(self, team_id: str, envelope: Envelope) -> None:
+        envelope = dict(envelope, origin=self.origin, team_id=team_id)
+        self.hub.published.append(envelope)
+        for member in list(self.hub.members):
+            await member._deliver(envelope)
+
+    async def close(self) -> None:
+        if self in self.hub.members:
+            self.hub.members.remove(self)
+        await super().close()
+
+
+class RedisBackplane(Backplane):
+    """Redis pub/sub backplane, one channel per team."""
+
+    name = "redis"
+
+    def __init__(self, redis_url: str, channel_prefix: str = "mem8:sync:", max_backoff: float = 30.0):
+        super().__init__()
+        self.redis_url = redis_url
+        self.channel_prefix = channel_prefix
+        self.max_backoff = max_backoff
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, handler: RelayHandler) -> None:
+        import redis.asyncio as redis
+
+        await super().start(handler)
+        self._redis = redis.from_url(self.redis_url)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def publish(self, team_id: str, envelope: Envelope) -> None:
+        if self._redis is None:
+            return
+        payload = json.dumps(dict(envelope, origin=self.origin, team_id=team_id))
+        try:
+            await self._redis.publish(f"{self.channel_prefix}{team_id}", payload)
+        except Exception as e:
+            # Local clients already have the event; remote ones resync on reconnect
+            logger.warning("Failed to publish sync event for team %s: %s", team_id, e)
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{self.channel_prefix}*")
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    try:
+                        envelope = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        logger.warning("Ignoring malformed sync event on %s", message.get("channel"))
+                        continue
+                    await self._deliver(envelope)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Sync backplane connection lost (%s); retrying in %.0fs", e, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        await super().close()
+
+
+def create_backplane(settings: Settings) -> Backplane:
+    """Build the backplane selected by ``settings.sync_backplane``."""
+    if settings.sync_backplane == "redis":
+        return RedisBackplane(settings.redis_url)
+    if settings.sync_backplane == "inprocess":
+        return InProcessBackplane()
+    raise ValueError(
+        f"Unknown sync backplane {settings.sync_backplane!r}; expected one of {', '.join(BACKPLANES)}"
+    )
@@ -0,0 +1,182 @@
+"""Content-addressed file storage for HTTP memory sync."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ..config import get_settings
+
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class InvalidSyncRequest(ValueError):
+    """Raised for malformed paths, hashes or chunk payloads."""
+
+
+def validate_sync_path(path: str) -> str:
+    """Normalize a client path, rejecting anything outside the team root."""
+    if '\\' in path or '\x00' in path:
+        raise InvalidSyncRequest(f"Invalid path: {path!r}")
+
+    pure = PurePosixPath(path)
+    if pure.is_absolute() or not pure.parts or any(part in ('..', '.') for part in pure.parts):
+        raise InvalidSyncRequest(f"Invalid path: {path!r}")
+    return pure.as_posix()
+
+
+def validate_chunk_hash(digest: str) -> str:
+    """Ensure a chunk id is a lowercase SHA-256 hex digest."""
+    if not _HASH_RE.match(digest):
+        raise InvalidSyncRequest(f"Invalid chunk hash: {digest!r}")
+    return digest
+
+
+class FileSyncStore:
+    """Per-team manifests plus zlib-compressed, content-addressed chunks.
+
+    Layout under ``root``::
+
+        teams/<team_id>/manifest.json
+        teams/<team_id>/objects/<hh>/<sha256>
+
+    Chunks are scoped per team so one team cannot probe another's content.
+    """
+
+    def __init__(self, root: Path, max_chunk_size: int):
+        self.root = Path(root)
+        self.max_chunk_size = max_chunk_size
+        self._lock = threading.Lock()
+
+    def _team_dir(self, team_id: str) -> Path:
+        return self.root / "teams" / str(team_id)
+
+    def chunk_path(self, team_id: str, digest: str) -> Path:
+        """Location of a stored chunk."""
+        validate_chunk_hash(digest)
+        return self._team_dir(team_id) / "objects" / digest[:2] / digest
+
+    def _load_manifest(self, team_id: str) -> Dict[str, Any]:
+        manifest_file = self._team_dir(team_id) / "manifest.json"
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"revision": 0, "files": {}}
+
+    def _save_manifest(self, team_id: str, manifest: Dict[str, Any]) -> None:
+        team_dir = self._team_dir(team_id)
+        team_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = team_dir / "manifest.json.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_file, team_dir / "manifest.json")
+
+    def exchange(self, team_id: str, client_files: Dict[str, str]) -> Dict[str, Any]:
+        """Compare client hashes against the team manifest."""
+        manifest = self._load_manifest(team_id)
+        files = manifest["files"]
+
+        changed = {
+            path: entry for path, entry in files.items()
+            if client_files.get(path) != entry["hash"]
+        }
+        missing = [path for path in client_files if path not in files]
+        return {"revision": manifest["revision"], "changed": changed, "missing": missing}
+
+    def missing_chunks(self, team_id: str, digests: Iterable[str]) -> List[str]:
+        """Return the chunk hashes not yet stored for a team."""
+        return [
+            digest for digest in dict.fromkeys(digests)
+            if not self.chunk_path(team_id, digest).exists()
+        ]
+
+    def put_chunk(self, team_id: str, digest: str, compressed: bytes) -> None:
+        """Store a zlib-compressed chunk after verifying its hash."""
+        target = self.chunk_path(team_id, digest)
+        if target.exists():
+            return
+
+        decompressor = zlib.decompressobj()
+        try:
+            raw = decompressor.decompress(compressed, self.max_chunk_size + 1)
+        except zlib.error as e:
+            raise InvalidSyncRequest(f"Chunk is not valid zlib data: {e}")
+        if len(raw) > self.max_chunk_size or decompressor.unconsumed_tail:
+            raise InvalidSyncRequest("Chunk exceeds the maximum size")
+        if hashlib.sha256(raw).hexdigest() != digest:
+            raise InvalidSyncRequest("Chunk content does not match its hash")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{digest}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(compressed)
+        os.replace(tmp_path, target)
+
+    def _verify_content(self, team_id: str, path: str, item: Dict[str, Any]) -> None:
+        """Check that the chunks of an entry add up to its declared hash and size."""
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in item["chunks"]:
+            try:
+                data = zlib.decompress(self.chunk_path(team_id, chunk).read_bytes())
+            except FileNotFoundError:
+                raise InvalidSyncRequest(f"Missing chunk {chunk} for {path}")
+            digest.update(data)
+            size += len(data)
+        if digest.hexdigest() != item["hash"] or size != item["size"]:
+            raise InvalidSyncRequest(f"Content of {path} does not match its hash and size")
+
+    def commit(
+        self, team_id: str, items: Iterable[Dict[str, Any]]
+    ) -> Tuple[int, List[str], List[str]]:
+        """Publish file versions whose base still matches the server.
+
+        Returns ``(revision, committed_paths, conflicting_paths)``. Raises
+        :class:`InvalidSyncRequest`, committing nothing, if a chunk is missing
+        or an entry's hash or size does not match its chunks.
+        """
+        items = list(items)
+        for item in items:
+            self._verify_content(team_id, validate_sync_path(item["path"]), item)
+
+        with self._lock:
+            manifest = self._load_manifest(team_id)
+            files = manifest["files"]
+            committed: List[str] = []
+            conflicts: List[str] = []
+
+            for item in items:
+                path = validate_sync_path(item["path"])
+                current = files.get(path)
+                current_hash = current["hash"] if current else None
+                if current_hash not in (item.get("base_hash"), item["hash"]):
+                    conflicts.append(path)
+                    continue
+
+                files[path] = {
+                    "path": path,
+                    "hash": item["hash"],
+                    "size": item["size"],
+                    "chunks": list(item["chunks"]),
+                    "mtime": item.get("mtime"),
+                }
+                committed.append(path)
+
+            if committed:
+                manifest["revision"] += 1
+                self._save_manifest(team_id, manifest)
+
+            return manifest["revision"], committed, conflicts
+
+
+@lru_cache()
+def get_file_sync_store() -> FileSyncStore:
+    """Get the process-wide file sync store."""
+    settings = get_settings()
+    return FileSyncStore(Path(settings.sync_storage_dir), settings.max_file_size)
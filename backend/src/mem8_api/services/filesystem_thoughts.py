@@ -5,6 +5,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from ..metrics import FILESYSTEM_SCAN_SECONDS
+
 
 def extract_title_from_content(content: str, filename: str) -> str:
     """Extract title from markdown content or filename."""
@@ -108,6 +110,11 @@ def scan_thoughts_directory(thoughts_dir: Path) -> List[Dict[str, Any]]:
 
 def discover_worktree_thoughts(base_dir: Path) -> List[Dict[str, Any]]:
     """Discover thoughts from git worktrees and other repositories."""
+    with FILESYSTEM_SCAN_SECONDS.time():
+        return _discover_worktree_thoughts(base_dir)
+
+
+def _discover_worktree_thoughts(base_dir: Path) -> List[Dict[str, Any]]:
     all_thoughts = []
     
     # Look for thoughts in current directory
@@ -0,0 +1,139 @@
+"""Subscription routing and compact change payloads for real-time sync."""
+
+import difflib
+import hashlib
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+# Fields that change on every write and are implied by the event itself
+_VOLATILE_FIELDS = {"updated_at", "word_count", "content_hash"}
+
+
+def split_path(path: str) -> List[str]:
+    """Split a thought path into segments; ``""`` and ``"/"`` mean the root."""
+    return [part for part in path.replace("\\", "/").split("/") if part and part != "."]
+
+
+class _TrieNode(Generic[T]):
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode[T]"] = {}
+        self.subscribers: Set[T] = set()
+
+
+class PathTrie(Generic[T]):
+    """Prefix trie mapping path prefixes to subscribers.
+
+    A subscriber registered at ``shared/plans`` matches every path under it,
+    so finding the recipients of a change walks one branch of the trie
+    instead of checking every subscription.
+    """
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[T] = _TrieNode()
+
+    def add(self, prefix: str, subscriber: T) -> None:
+        """Subscribe to ``prefix`` and everything below it."""
+        node = self._root
+        for part in split_path(prefix):
+            node = node.children.setdefault(part, _TrieNode())
+        node.subscribers.add(subscriber)
+
+    def remove(self, prefix: str, subscriber: T) -> None:
+        """Remove one subscription, pruning empty branches."""
+        trail = [self._root]
+        parts = split_path(prefix)
+        for part in parts:
+            child = trail[-1].children.get(part)
+            if child is None:
+                return
+            trail.append(child)
+
+        trail[-1].subscribers.discard(subscriber)
+        for depth in range(len(parts), 0, -1):
+            node = trail[depth]
+            if node.subscribers or node.children:
+                break
+            del trail[depth - 1].children[parts[depth - 1]]
+
+    def match(self, path: str) -> Set[T]:
+        """Return subscribers of any prefix of ``path``."""
+        node = self._root
+        matched = set(node.subscribers)
+        for part in split_path(path):
+            node = node.children.get(part)
+            if node is None:
+                break
+            matched |= node.subscribers
+        return matched
+
+    def __bool__(self) -> bool:
+        return bool(self._root.subscribers or self._root.children)
+
+
+def content_hash(content: str) -> str:
+    """Hash used by clients to check a delta applies to their copy."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def content_delta(old: str, new: str) -> List[List[Any]]:
+    """Line-level edit script turning ``old`` into ``new``.
+
+    Each entry is ``[start, end, lines]``: replace ``old`` lines
+    ``start:end`` with ``lines``. Apply entries in reverse order.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    return [
+        [i1, i2, new_lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_content_delta(old: str, delta: Iterable[List[Any]]) -> str:
+    """Inverse of :func:`content_delta`."""
+    lines = old.splitlines(keepends=True)
+    for start, end, replacement in sorted(delta, key=lambda edit: edit[0], reverse=True):
+        lines[start:end] = replacement
+    return "".join(lines)
+
+
+def thought_diff(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact description of a thought change.
+
+    Carries only the fields that changed. Content is sent as a line delta
+    against ``base_hash`` when that is smaller than the full text; clients
+    whose copy does not match ``base_hash`` should refetch the thought.
+    """
+    diff: Dict[str, Any] = {"id": current.get("id"), "path": current.get("path")}
+    if previous is None:
+        diff["changes"] = {k: v for k, v in current.items() if k not in ("id", "path")}
+        return diff
+
+    changes = {
+        key: value for key, value in current.items()
+        if key not in ("id", "path", "content") and key not in _VOLATILE_FIELDS
+        and previous.get(key) != value
+    }
+    if previous.get("path") != current.get("path"):
+        diff["previous_path"] = previous.get("path")
+    if "updated_at" in current:
+        changes["updated_at"] = current["updated_at"]
+
+    old_content = previous.get("content")
+    new_content = current.get("content")
+    if new_content is not None and new_content != old_content:
+        delta = content_delta(old_content or "", new_content) if old_content else None
+        if delta is not None and sum(len(line) for _, _, lines in delta for line in lines) < len(new_content):
+            diff["base_hash"] = content_hash(old_content)
+            diff["content_delta"] = delta
+        else:
+            changes["content"] = new_content
+        diff["content_hash"] = content_hash(new_content)
+
+    diff["changes"] = changes
+    return diff
@@ -0,0 +1,202 @@
+"""Response cache for read-heavy endpoints.
+
+Entries live in Redis (``settings.redis_url``) so every worker shares them,
+with an in-memory LRU used when Redis is disabled or unreachable.
+
+Invalidation is generation based: each key embeds the current generation of
+its team (or the global generation for unscoped queries), and a thought
+write bumps both. Stale entries are never read again and expire by TTL, so
+invalidating costs one increment regardless of how many entries exist.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..config import get_settings
+from ..metrics import RESPONSE_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = "*"
+KEY_PREFIX = "mem8:cache:"
+
+# How long to stay on the in-memory fallback before retrying Redis
+REDIS_RETRY_SECONDS = 30.0
+
+
+class MemoryStore:
+    """Bounded LRU of ``key -> (expires_at, value)`` plus generation counters."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    async def generation(self, scope: str) -> int:
+        return self._generations.get(scope, 0)
+
+    async def bump(self, *scopes: str) -> None:
+        for scope in scopes:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisStore:
+    """Redis-backed store shared by all workers."""
+
+    def __init__(self, redis_url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url)
+
+    async def generation(self, scope: str) -> int:
+        value = await self._redis.get(f"{KEY_PREFIX}gen:{scope}")
+        return int(value) if value is not None else 0
+
+    async def bump(self, *scopes: str) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for scope in scopes:
+                pipe.incr(f"{KEY_PREFIX}gen:{scope}")
+            await pipe.execute()
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._redis.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self._redis.set(key, value, ex=ttl)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class ResponseCache:
+    """Caches JSON-serializable endpoint results."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        ttls: Dict[str, int],
+        max_entries: int = 1024,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.ttls = ttls
+        self.memory = MemoryStore(max_entries)
+        self.redis: Optional[RedisStore] = RedisStore(redis_url) if redis_url and enabled else None
+        self._redis_down_until = 0.0
+
+    def _store(self):
+        if self.redis is not None and time.monotonic() >= self._redis_down_until:
+            return self.redis
+        return self.memory
+
+    def _redis_failed(self, error: Exception) -> None:
+        if time.monotonic() >= self._redis_down_until:
+            logger.warning(
+                "Response cache falling back to memory for %.0fs: %s", REDIS_RETRY_SECONDS, error
+            )
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def _call(self, method: str, *args):
+        store = self._store()
+        if store is self.memory:
+            return await getattr(store, method)(*args)
+        try:
+            return await getattr(store, method)(*args)
+        except Exception as e:
+            self._redis_failed(e)
+            return await getattr(self.memory, method)(*args)
+
+    @staticmethod
+    def make_key(endpoint: str, scope: str, generation: int, auth_scope: str, params: Dict[str, Any]) -> str:
+        """Build a key from the endpoint, team generation, caller and normalized params."""
+        canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+        return f"{KEY_PREFIX}{endpoint}:{scope}:{generation}:{auth_scope}:{digest}"
+
+    async def get_or_compute(
+        self,
+        endpoint: str,
+        team_id: Optional[Any],
+        auth_scope: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached result for these params, computing and storing it on a miss."""
+        if not self.enabled:
+            return await compute()
+
+        scope = str(team_id) if team_id else GLOBAL_SCOPE
+        generation = await self._call("generation", scope)
+        key = self.make_key(endpoint, scope, generation, auth_scope, params)
+
+        cached = await self._call("get", key)
+        if cached is not None:
+            RESPONSE_CACHE_REQUESTS.labels(endpoint=endpoint, result="hit").inc()
+            return json.loads(cached)
+
+        RESPONSE_CACHE_REQUESTS.labels(endpoint=endpoint, result="miss").inc()
+        value = await compute()
+        await self._call("set", key, json.dumps(value), self.ttls.get(endpoint, 30))
+        return value
+
+    async def invalidate(self, team_id: Optional[Any] = None) -> None:
+        """Drop cached results affected by a write to ``team_id``'s thoughts."""
+        if not self.enabled:
+            return
+        scopes = (GLOBAL_SCOPE, str(team_id)) if team_id else (GLOBAL_SCOPE,)
+        # Keep the local fallback coherent too, in case Redis fails later
+        if self._store() is not self.memory:
+            await self.memory.bump(*scopes)
+        await self._call("bump", *scopes)
+
+    async def close(self) -> None:
+        if self.redis is not None:
+            try:
+                await self.redis.close()
+            except Exception:
+                pass
+        await self.memory.close()
+
+
+def auth_scope(user: Optional[Any]) -> str:
+    """Cache partition for the caller, so results never leak between users."""
+    user_id = getattr(user, "id", None)
+    return f"user:{user_id}" if user_id is not None else "anonymous"
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache."""
+    settings = get_settings()
+    return ResponseCache(
+        redis_url=settings.redis_url if settings.response_cache_backend == "redis" else None,
+        ttls=settings.response_cache_ttls,
+        max_entries=settings.response_cache_max_entries,
+        enabled=settings.response_cache_backend != "off",
+    )
@@ -3,14 +3,17 @@
 Semantic search support is experimental.
 """
 
+import time
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import and_
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..metrics import SEARCH_CANDIDATES, SEARCH_EMBEDDING_SECONDS
 from ..models.thought import Thought
 from ..schemas.search import SearchResult
+from .tags import has_tags
 
 
 class SearchService:
@@ -56,30 +59,35 @@ class SearchService:
         if not self._embeddings_model:
             self._embeddings_model = SentenceTransformer("all-MiniLM-L6-v2")
 
+        embedding_started = time.perf_counter()
         query_embedding = self._embeddings_model.encode(query)
+        embedding_seconds = time.perf_counter() - embedding_started
 
         # Base query to fetch candidate thoughts
-        db_query = db.query(Thought).filter(
+        db_query = select(Thought).where(
             Thought.is_published,
-            not Thought.is_archived,
+            Thought.is_archived.is_(False),
         )
 
         if team_id:
-            db_query = db_query.filter(Thought.team_id == team_id)
+            db_query = db_query.where(Thought.team_id == str(team_id))
 
         if tags:
-            tag_filters = [Thought.tags.contains([tag]) for tag in tags]
-            db_query = db_query.filter(and_(*tag_filters))
+            db_query = db_query.where(has_tags(tags, team_id))
 
         if path_filter:
-            db_query = db_query.filter(Thought.path.ilike(f"%{path_filter}%"))
+            db_query = db_query.where(Thought.path.ilike(f"%{path_filter}%"))
 
         result = await db.execute(db_query)
         thoughts = result.scalars().all()
 
+        SEARCH_CANDIDATES.labels(search_type="semantic").observe(len(thoughts))
+
         search_results: List[SearchResult] = []
         for thought in thoughts:
+            embedding_started = time.perf_counter()
             content_embedding = self._embeddings_model.encode(thought.content[:2000])
+            embedding_seconds += time.perf_counter() - embedding_started
             similarity = float(
                 np.dot(query_embedding, content_embedding)
                 / (np.linalg.norm(query_embedding) * np.linalg.norm(content_embedding))
@@ -100,6 +108,7 @@ class SearchService:
                 )
             )
 
+        SEARCH_EMBEDDING_SECONDS.observe(embedding_seconds)
         search_results.sort(key=lambda x: x.score, reverse=True)
 
         return search_results[offset : offset + limit]
@@ -117,32 +126,28 @@ class SearchService:
         """Fallback text search implementation."""
         
         # Build query
-        db_query = db.query(Thought).filter(
+        db_query = select(Thought).where(
             Thought.is_published,
-            not Thought.is_archived,
+            Thought.is_archived.is_(False),
         )
         
         # Apply filters
         if team_id:
-            db_query = db_query.filter(Thought.team_id == team_id)
+            db_query = db_query.where(Thought.team_id == str(team_id))
         
         if tags:
-            tag_filters = []
-            for tag in tags:
-                tag_filters.append(Thought.tags.contains([tag]))
-            db_query = db_query.filter(and_(*tag_filters))
+            db_query = db_query.where(has_tags(tags, team_id))
         
         if path_filter:
-            db_query = db_query.filter(Thought.path.ilike(f"%{path_filter}%"))
+            db_query = db_query.where(Thought.path.ilike(f"%{path_filter}%"))
         
         # Apply text search
         if query.strip():
-            from sqlalchemy import or_
             text_filter = or_(
                 Thought.title.ilike(f"%{query}%"),
                 Thought.content.ilike(f"%{query}%")
             )
-            db_query = db_query.filter(text_filter)
+            db_query = db_query.where(text_filter)
         
         # Apply pagination
         db_query = db_query.offset(offset).limit(limit)
@@ -150,6 +155,7 @@ class SearchService:
         # Execute
         result = await db.execute(db_query)
         thoughts = result.scalars().all()
+        SEARCH_CANDIDATES.labels(search_type="semantic").observe(len(thoughts))
         
         # Convert to search results
         search_results = []
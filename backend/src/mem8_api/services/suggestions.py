@@ -0,0 +1,207 @@
+"""In-memory term dictionary behind search suggestions.
+
+Each team gets a sorted list of the words in its published thought titles
+and its tags, with how many thoughts use each. Suggestions are a binary
+search for the prefix plus a short scan, so autocomplete never touches the
+database once a team is loaded.
+
+A team is loaded from the database on its first suggestion request; a
+keystroke burst during that load waits for the same query instead of
+starting its own. Only the most recently used teams stay loaded. Thought
+writes on this worker update loaded teams directly; writes on other workers
+show up after the periodic rebuild.
+"""
+
+import asyncio
+import heapq
+import logging
+import re
+import uuid
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from ..config import get_settings
+from ..models.thought import Thought
+
+logger = logging.getLogger(__name__)
+
+ALL_TEAMS = "*"
+
+# Prefixes this short match a large share of the terms, so their results are memoized
+MEMO_PREFIX_LENGTH = 2
+
+# Loads retried because writes landed during them; after this the periodic rebuild catches up
+MAX_LOAD_ATTEMPTS = 3
+
+_WORD = re.compile(r"[^\W_][\w\-]*")
+
+
+def thought_terms(thought: Optional[Any]) -> Counter:
+    """Suggestion terms of one thought (model or dict); none unless it is searchable."""
+    if thought is None:
+        return Counter()
+
+    def field(name: str):
+        return thought.get(name) if isinstance(thought, dict) else getattr(thought, name, None)
+
+    if not field("is_published") or field("is_archived"):
+        return Counter()
+    terms = set(_WORD.findall((field("title") or "").lower()))
+    terms.update(str(tag).strip().lower() for tag in field("tags") or [] if str(tag).strip())
+    return Counter(terms)
+
+
+class TermIndex:
+    """Sorted terms with document frequencies."""
+
+    def __init__(self, counts: Optional[Counter] = None):
+        self.counts: Counter = Counter()
+        self.terms: List[str] = []
+        self._memo: Dict[Tuple[str, int], List[str]] = {}
+        if counts:
+            self.counts.update({term: n for term, n in counts.items() if n > 0})
+            self.terms = sorted(self.counts)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def update(self, delta: Counter) -> None:
+        """Apply per-term count changes, adding and removing terms as needed."""
+        self._memo.clear()
+        for term, change in delta.items():
+            if not change:
+                continue
+            count = self.counts.get(term, 0) + change
+            if count > 0:
+                if term not in self.counts:
+                    insort(self.terms, term)
+                self.counts[term] = count
+            elif term in self.counts:
+                del self.counts[term]
+                index = bisect_left(self.terms, term)
+                if index < len(self.terms) and self.terms[index] == term:
+                    del self.terms[index]
+
+    def complete(self, prefix: str, limit: int) -> List[str]:
+        """Most frequent terms that extend ``prefix``, ties broken alphabetically."""
+        memo_key = (prefix, limit)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        start = bisect_left(self.terms, prefix)
+        end = bisect_left(self.terms, prefix + "\U0010ffff", start)
+        candidates = (term for term in self.terms[start:end] if len(term) > len(prefix))
+        result = heapq.nsmallest(limit, candidates, key=lambda term: (-self.counts[term], term))
+        if len(prefix) <= MEMO_PREFIX_LENGTH:
+            self._memo[memo_key] = result
+        return result
+
+
+class SuggestionIndex:
+    """Term indexes per team plus one across all teams, loaded lazily.
+
+    At most ``max_teams`` indexes are kept; the least recently used is
+    dropped, so the periodic rebuild only reloads teams still in use.
+    """
+
+    def __init__(self, max_teams: int = 1000) -> None:
+        self.max_teams = max(1, max_teams)
+        self.indexes: "OrderedDict[str, TermIndex]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._stale: set = set()
+
+    async def suggest(
+        self, session_factory, prefix: str, limit: int, team_id: Optional[uuid.UUID] = None
+    ) -> List[str]:
+        """Suggestions for ``prefix`` in a team (or all teams)."""
+        key = str(team_id) if team_id else ALL_TEAMS
+        index = self.indexes.get(key)
+        if index is None:
+            index = await self._load(session_factory, key)
+        else:
+            self.indexes.move_to_end(key)
+        return index.complete(prefix, limit)
+
+    def record(self, team_id: Any, before: Optional[Any], after: Optional[Any]) -> None:
+        """Account for a thought going from ``before`` to ``after`` (``None`` for create/delete)."""
+        self.record_many(team_id, [(before, after)])
+
+    def record_many(self, team_id: Any, changes: Iterable) -> None:
+        """Account for several thought changes in one team."""
+        delta: Counter = Counter()
+        for before, after in changes:
+            delta.update(thought_terms(after))
+            delta.subtract(thought_terms(before))
+        for key in (str(team_id), ALL_TEAMS):
+            if key in self._loading:
+                # The load may or may not include this write; load again once it finishes
+                self._stale.add(key)
+            elif key in self.indexes:
+                self.indexes[key].update(delta)
+
+    async def rebuild(self, session_factory) -> None:
+        """Reload every loaded index, picking up writes made by other workers."""
+        # The old index keeps answering until its replacement is ready
+        for key in list(self.indexes):
+            await self._load(session_factory, key)
+
+    async def _load(self, session_factory, key: str) -> TermIndex:
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load_until_fresh(session_factory, key))
+            self._loading[key] = task
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load_until_fresh(self, session_factory, key: str) -> TermIndex:
+        for _ in range(MAX_LOAD_ATTEMPTS):
+            self._stale.discard(key)
+            index = await self._query(session_factory, key)
+            if key not in self._stale:
+                break
+        # Under a steady stream of writes keep the last load; it may miss the
+        # newest of them until the next rebuild
+        self._stale.discard(key)
+        self.indexes[key] = index
+        self.indexes.move_to_end(key)
+        while len(self.indexes) > self.max_teams:
+            self.indexes.popitem(last=False)
+        return index
+
+    async def _query(self, session_factory, key: str) -> TermIndex:
+        query = select(Thought.title, Thought.tags, Thought.is_published, Thought.is_archived).where(
+            Thought.is_published,
+            Thought.is_archived.is_(False),
+        )
+        if key != ALL_TEAMS:
+            query = query.where(Thought.team_id == key)
+
+        counts: Counter = Counter()
+        async with session_factory() as db:
+            result = await db.stream(query.execution_options(yield_per=1000))
+            async for row in result:
+                counts.update(thought_terms(row._asdict()))
+        logger.info("Loaded %d suggestion terms for team %s", len(counts), key)
+        return TermIndex(counts)
+
+
+async def run_periodic_rebuild(index: SuggestionIndex, session_factory, interval: float) -> None:
+    """Rebuild loaded indexes every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await index.rebuild(session_factory)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Failed to rebuild suggestion index")
+
+
+@lru_cache()
+def get_suggestion_index() -> SuggestionIndex:
+    """Get the process-wide suggestion index."""
+    return SuggestionIndex(max_teams=get_settings().suggestion_max_teams)
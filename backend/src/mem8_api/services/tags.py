@@ -0,0 +1,153 @@
+"""Normalized thought tags.
+
+Every thought write mirrors ``Thought.tags`` into ``thought_tags`` in the
+same transaction, so filtering by tags and counting them use the
+``(team_id, tag)`` and ``(tag)`` indexes instead of scanning JSON.
+:func:`backfill_thought_tags` fills the table for databases created before
+it existed.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import String, cast, delete, func, insert, select, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.thought import Thought, ThoughtTag
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Stored ``Thought.tags`` values that hold no tags
+_NO_TAGS = ("[]", "{}", "null")
+
+
+def normalize_tags(tags: Optional[Iterable[Any]]) -> List[str]:
+    """Strip, drop empty and de-duplicate tags, keeping their order."""
+    seen: Dict[str, None] = {}
+    for tag in tags or []:
+        tag = str(tag).strip()
+        if tag:
+            seen.setdefault(tag, None)
+    return list(seen)
+
+
+def has_tags(tags: Iterable[str], team_id: Optional[Any] = None):
+    """Clause matching thoughts that carry every one of ``tags``."""
+    tags = normalize_tags(tags)
+    if not tags:
+        return true()
+    matches = select(ThoughtTag.thought_id).where(ThoughtTag.tag.in_(tags))
+    if team_id:
+        matches = matches.where(ThoughtTag.team_id == str(team_id))
+    if len(tags) > 1:
+        matches = matches.group_by(ThoughtTag.thought_id).having(func.count() == len(tags))
+    return Thought.id.in_(matches)
+
+
+def has_any_tag(tags: Iterable[str], team_id: Optional[Any] = None):
+    """Clause matching thoughts that carry at least one of ``tags``."""
+    matches = select(ThoughtTag.thought_id).where(ThoughtTag.tag.in_(normalize_tags(tags)))
+    if team_id:
+        matches = matches.where(ThoughtTag.team_id == str(team_id))
+    return Thought.id.in_(matches)
+
+
+async def tag_facets(db: AsyncSession, thought_ids, limit: int = 20) -> Dict[str, int]:
+    """Count tags across the thoughts selected by ``thought_ids``, most used first.
+
+    ``thought_ids`` is a SELECT of ``Thought.id`` with the caller's filters
+    and no pagination.
+    """
+    count = func.count().label("count")
+    result = await db.execute(
+        select(ThoughtTag.tag, count)
+        .where(ThoughtTag.thought_id.in_(thought_ids))
+        .group_by(ThoughtTag.tag)
+        .order_by(count.desc(), ThoughtTag.tag)
+        .limit(limit)
+    )
+    return {tag: total for tag, total in result.all()}
+
+
+async def set_thought_tags(db: AsyncSession, thought: Thought) -> None:
+    """Replace a thought's tag rows with its current ``tags``. Runs in the caller's transaction."""
+    await db.flush()  # assigns the id of a new thought
+    await replace_tags(db, thought.team_id, {thought.id: thought.tags})
+
+
+async def replace_tags(db: AsyncSession, team_id: Any, tags_by_thought: Dict[Any, Any]) -> None:
+    """Replace the tag rows of several thoughts of one team at once."""
+    if not tags_by_thought:
+        return
+    thought_ids = [str(thought_id) for thought_id in tags_by_thought]
+    await db.execute(delete(ThoughtTag).where(ThoughtTag.thought_id.in_(thought_ids)))
+    rows = [
+        {"thought_id": str(thought_id), "tag": tag, "team_id": str(team_id)}
+        for thought_id, tags in tags_by_thought.items()
+        for tag in normalize_tags(tags)
+    ]
+    if rows:
+        await db.execute(insert(ThoughtTag), rows)
+
+
+async def delete_thought_tags(db: AsyncSession, thought_id: Any) -> None:
+    """Remove a thought's tag rows (SQLite does not enforce the cascade)."""
+    await db.execute(delete(ThoughtTag).where(ThoughtTag.thought_id == str(thought_id)))
+
+
+async def backfill_thought_tags(db: AsyncSession) -> int:
+    """Populate ``thought_tags`` from ``Thought.tags``; returns thoughts migrated.
+
+    Picks up thoughts that have tags but no tag rows yet, so an interrupted
+    backfill resumes where it stopped and a finished one costs a single
+    query that returns nothing. Legacy tag lists with only blank entries are
+    emptied so they are not picked up again. Several workers may run it at
+    once: a batch that collides with another worker's inserts is rolled back
+    and left to that worker.
+    """
+    untagged = ~select(ThoughtTag.thought_id).where(ThoughtTag.thought_id == Thought.id).exists()
+    has_any = cast(Thought.tags, String).not_in(_NO_TAGS)
+    migrated = 0
+    last_id = None
+    while True:
+        query = (
+            select(Thought.id, Thought.team_id, Thought.tags)
+            .where(untagged, has_any)
+            .order_by(Thought.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(Thought.id > last_id)
+        rows = (await db.execute(query)).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        by_team: Dict[str, Dict[Any, Any]] = {}
+        blank = []
+        for row in rows:
+            if normalize_tags(row.tags):
+                by_team.setdefault(str(row.team_id), {})[row.id] = row.tags
+            else:
+                blank.append(row.id)
+        try:
+            for team_id, tags_by_thought in by_team.items():
+                await replace_tags(db, team_id, tags_by_thought)
+            if blank:
+                await db.execute(
+                    update(Thought)
+                    .where(Thought.id.in_(blank))
+                    .values(tags=[], updated_at=Thought.updated_at)
+                )
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            continue
+        migrated += sum(len(tags_by_thought) for tags_by_thought in by_team.values())
+
+    if migrated:
+        logger.info("Migrated tags of %d thoughts to thought_tags", migrated)
+    return migrated
@@ -0,0 +1,146 @@
+"""Per-team aggregate counters backing the dashboard stats.
+
+Thought writes adjust their team's row in the same transaction, so reading
+system totals sums one row per team instead of scanning every thought.
+:func:`refresh_team_stats` recomputes everything from the thoughts table; it
+runs at startup to backfill and periodically to repair any drift.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import upsert_insert
+from ..models.team import TeamStats
+from ..models.thought import Thought
+
+logger = logging.getLogger(__name__)
+
+
+def thought_counters(thought: Optional[Any]) -> Dict[str, int]:
+    """Contribution of one thought (model or dict) to its team's counters."""
+    if thought is None:
+        return {"thought_count": 0, "word_count": 0, "archived_count": 0}
+
+    def field(name: str):
+        return thought.get(name) if isinstance(thought, dict) else getattr(thought, name, None)
+
+    return {
+        "thought_count": 1,
+        "word_count": field("word_count") or 0,
+        "archived_count": 1 if field("is_archived") else 0,
+    }
+
+
+async def record_thought_change(
+    db: AsyncSession,
+    team_id: Any,
+    before: Optional[Any],
+    after: Optional[Any],
+) -> None:
+    """Adjust team counters for a thought going from ``before`` to ``after``.
+
+    Pass ``None`` as ``before`` for a create and as ``after`` for a delete.
+    Runs in the caller's transaction.
+    """
+    old, new = thought_counters(before), thought_counters(after)
+    await apply_team_delta(db, team_id, {name: new[name] - old[name] for name in new})
+
+
+async def apply_team_delta(db: AsyncSession, team_id: Any, delta: Dict[str, int]) -> None:
+    """Add ``delta`` (keyed like :func:`thought_counters`) to a team's counters."""
+    team_id = str(team_id)
+    now = datetime.now(timezone.utc)
+
+    statement = (
+        update(TeamStats)
+        .where(TeamStats.team_id == team_id)
+        .values(
+            thought_count=TeamStats.thought_count + delta["thought_count"],
+            word_count=TeamStats.word_count + delta["word_count"],
+            archived_count=TeamStats.archived_count + delta["archived_count"],
+            last_updated=now,
+        )
+    )
+    result = await db.execute(statement)
+    if result.rowcount:
+        return
+
+    # First write for this team: create its row, unless a concurrent write just did
+    try:
+        async with db.begin_nested():
+            db.add(TeamStats(team_id=team_id, last_updated=now, **{
+                name: max(value, 0) for name, value in delta.items()
+            }))
+    except IntegrityError:
+        await db.execute(statement)
+
+
+async def refresh_team_stats(db: AsyncSession) -> int:
+    """Recompute every team's counters from the thoughts table; returns teams updated.
+
+    The existing counter rows are locked first, so concurrent thought writes
+    wait and then apply their deltas on top of the recount rather than being
+    overwritten by it. The recount itself is one ``INSERT ... SELECT ... ON
+    CONFLICT DO UPDATE``, so workers refreshing at once do not collide on
+    new rows.
+    """
+    await db.execute(select(TeamStats.team_id).order_by(TeamStats.team_id).with_for_update())
+
+    totals = select(
+        Thought.team_id,
+        func.count(Thought.id),
+        func.coalesce(func.sum(Thought.word_count), 0),
+        func.count(Thought.id).filter(Thought.is_archived),
+        func.max(Thought.updated_at),
+    ).where(true()).group_by(Thought.team_id)  # WHERE keeps SQLite from reading ON CONFLICT as a join
+    columns = ["team_id", "thought_count", "word_count", "archived_count", "last_updated"]
+
+    insert = upsert_insert(db)
+    statement = insert(TeamStats).from_select(columns, totals)
+    statement = statement.on_conflict_do_update(
+        index_elements=[TeamStats.team_id],
+        set_={name: statement.excluded[name] for name in columns[1:]},
+    )
+    result = await db.execute(statement)
+
+    await db.execute(delete(TeamStats).where(TeamStats.team_id.not_in(select(Thought.team_id))))
+    await db.commit()
+    return result.rowcount
+
+
+async def aggregate_team_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Totals across all teams."""
+    result = await db.execute(
+        select(
+            func.coalesce(func.sum(TeamStats.thought_count), 0),
+            func.coalesce(func.sum(TeamStats.word_count), 0),
+            func.coalesce(func.sum(TeamStats.archived_count), 0),
+            func.max(TeamStats.last_updated),
+        )
+    )
+    thought_count, word_count, archived_count, last_updated = result.one()
+    return {
+        "thought_count": int(thought_count),
+        "word_count": int(word_count),
+        "archived_count": int(archived_count),
+        "last_updated": last_updated,
+    }
+
+
+async def run_periodic_refresh(session_factory, interval: float) -> None:
+    """Recompute counters every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as db:
+                await refresh_team_stats(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Failed to refresh team stats")
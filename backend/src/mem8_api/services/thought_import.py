@@ -0,0 +1,171 @@
+"""Bulk thought import with batched upserts."""
+
+import hashlib
+import uuid
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import upsert_insert
+from ..models.thought import Thought
+from ..schemas.thought import ThoughtImportItem, ThoughtImportResponse
+from .suggestions import get_suggestion_index
+from .tags import normalize_tags, replace_tags
+from .team_stats import apply_team_delta, thought_counters
+
+# Columns replaced when an imported path already exists
+_UPSERT_COLUMNS = (
+    "title", "content", "thought_metadata", "tags", "is_published",
+    "is_archived", "content_hash", "word_count",
+)
+
+
+def default_title(content: str, path: str) -> str:
+    """First markdown heading, else the file name without extension."""
+    for line in content.splitlines()[:50]:
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            return stripped[2:].strip()[:500] or PurePosixPath(path).stem
+    return PurePosixPath(path).stem[:500] or path[:500]
+
+
+class ThoughtImporter:
+    """Buffers import items and upserts them by ``(team_id, path)`` in batches.
+
+    Each batch is one transaction: a locking SELECT of the existing rows, an
+    ``INSERT ... ON CONFLICT DO NOTHING`` for new paths and an ``INSERT ...
+    ON CONFLICT DO UPDATE`` for changed ones, then one team stats update.
+    Items whose content hash matches the stored thought are skipped.
+
+    Counts, team stats and suggestion changes follow the rows the upserts
+    return, not the SELECT: a new path another writer inserted in the
+    meantime is looked up again and written as an update.
+    """
+
+    def __init__(self, db: AsyncSession, team_id: uuid.UUID, batch_size: int = 500):
+        self.db = db
+        self.team_id = str(team_id)
+        self.batch_size = max(1, batch_size)
+        self.result = ThoughtImportResponse()
+        self._pending: Dict[str, ThoughtImportItem] = {}
+
+    async def add(self, item: ThoughtImportItem) -> None:
+        """Queue one item; a later item with the same path replaces it."""
+        self._pending[item.path] = item
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def finish(self) -> ThoughtImportResponse:
+        """Write any remaining items and return the totals."""
+        await self.flush()
+        return self.result
+
+    async def flush(self) -> None:
+        """Upsert the buffered items in one transaction."""
+        if not self._pending:
+            return
+        items, self._pending = self._pending, {}
+
+        changes: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]] = []
+        while items:
+            conflicts = await self._write(items, changes)
+            items = {path: items[path] for path in conflicts}
+
+        delta = {"thought_count": 0, "word_count": 0, "archived_count": 0}
+        for previous, row in changes:
+            old, new = thought_counters(previous), thought_counters(row)
+            for name in delta:
+                delta[name] += new[name] - old[name]
+        if changes:
+            await apply_team_delta(self.db, self.team_id, delta)
+
+        await self.db.commit()
+        get_suggestion_index().record_many(self.team_id, changes)
+
+    async def _write(self, items: Dict[str, ThoughtImportItem], changes: List) -> List[str]:
+        """Write ``items`` and append ``(previous, row)`` for each written thought.
+
+        Returns the paths of new items that another writer inserted first.
+        """
+        existing = {
+            row.path: row
+            for row in (await self.db.execute(
+                select(
+                    Thought.path, Thought.content_hash, Thought.word_count,
+                    Thought.title, Thought.tags, Thought.is_published, Thought.is_archived,
+                )
+                .where(Thought.team_id == self.team_id, Thought.path.in_(list(items)))
+                .with_for_update()
+            )).all()
+        }
+
+        now = datetime.now(timezone.utc)
+        new_rows: Dict[str, Dict[str, Any]] = {}
+        changed_rows: Dict[str, Dict[str, Any]] = {}
+        for path, item in items.items():
+            content_hash = hashlib.sha256(item.content.encode()).hexdigest()
+            current: Optional[Any] = existing.get(path)
+            if current is not None and current.content_hash == content_hash:
+                self.result.unchanged += 1
+                continue
+            (new_rows if current is None else changed_rows)[path] = {
+                "id": str(uuid.uuid4()),
+                "team_id": self.team_id,
+                "path": path,
+                "title": item.title or default_title(item.content, path),
+                "content": item.content,
+                "thought_metadata": item.thought_metadata or {},
+                "tags": normalize_tags(item.tags),
+                "is_published": item.is_published,
+                "is_archived": item.is_archived,
+                "content_hash": content_hash,
+                "word_count": len(item.content.split()),
+                "updated_at": now,
+            }
+
+        insert = upsert_insert(self.db)
+        written: Dict[Any, Dict[str, Any]] = {}
+        conflicts: List[str] = []
+        if new_rows:
+            statement = insert(Thought).values(list(new_rows.values())).on_conflict_do_nothing(
+                index_elements=[Thought.team_id, Thought.path],
+            ).returning(Thought.id, Thought.path)
+            inserted = {path: thought_id for thought_id, path in (await self.db.execute(statement)).all()}
+            for path, row in new_rows.items():
+                if path not in inserted:
+                    conflicts.append(path)
+                    continue
+                written[inserted[path]] = row
+                changes.append((None, row))
+                self.result.created += 1
+
+        if changed_rows:
+            statement = insert(Thought).values(list(changed_rows.values()))
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=[Thought.team_id, Thought.path],
+                set_={**{name: excluded[name] for name in _UPSERT_COLUMNS}, "updated_at": now},
+                # Another writer may have stored the same content since the SELECT
+                where=Thought.content_hash.is_distinct_from(excluded.content_hash),
+            ).returning(Thought.id, Thought.path)
+            returned = {path: thought_id for thought_id, path in (await self.db.execute(statement)).all()}
+            for path, row in changed_rows.items():
+                if path not in returned:
+                    self.result.unchanged += 1
+                    continue
+                written[returned[path]] = row
+                # Our own id means the row was deleted meanwhile and this inserted it again
+                if returned[path] == row["id"]:
+                    changes.append((None, row))
+                    self.result.created += 1
+                else:
+                    changes.append((existing[path]._asdict(), row))
+                    self.result.updated += 1
+
+        await replace_tags(self.db, self.team_id, {
+            thought_id: row["tags"] for thought_id, row in written.items()
+        })
+        return conflicts
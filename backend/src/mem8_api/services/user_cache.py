@@ -0,0 +1,140 @@
+"""Cache of users resolved from access tokens.
+
+Every authenticated request names its user in the token's ``sub`` claim.
+Caching the user row for a few seconds saves a ``users`` lookup on each
+request; writes to a user call :meth:`UserCache.invalidate`, and the short
+TTL bounds staleness on other workers when the cache is per process.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import get_settings
+from ..metrics import USER_CACHE_REQUESTS
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "mem8:user:"
+
+# Columns kept in the cache; the password hash never leaves the database
+CACHED_FIELDS = ("id", "email", "username", "full_name", "is_active", "is_superuser")
+
+# How long to stay on the in-memory fallback before retrying Redis
+REDIS_RETRY_SECONDS = 30.0
+
+
+def user_snapshot(user: Any) -> Dict[str, Any]:
+    """Plain, JSON-ready copy of a user row or model."""
+    return {name: getattr(user, name) for name in CACHED_FIELDS}
+
+
+def user_from_snapshot(snapshot: Dict[str, Any]) -> User:
+    """Detached :class:`User` built from a cached snapshot."""
+    user = User(**{name: value for name, value in snapshot.items() if name != "id"})
+    user.id = snapshot["id"]
+    return user
+
+
+class UserCache:
+    """TTL cache of user snapshots keyed by user id, in memory or Redis."""
+
+    def __init__(self, ttl: int, max_entries: int = 10000, redis_url: Optional[str] = None, enabled: bool = True):
+        self.ttl = ttl
+        self.enabled = enabled and ttl > 0
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._redis = None
+        self._redis_down_until = 0.0
+        if redis_url and self.enabled:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(redis_url)
+
+    def _use_redis(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, error: Exception) -> None:
+        if time.monotonic() >= self._redis_down_until:
+            logger.warning("User cache falling back to memory for %.0fs: %s", REDIS_RETRY_SECONDS, error)
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def get(self, user_id: str) -> Optional[User]:
+        """Cached user for ``user_id``, or None on a miss."""
+        if not self.enabled:
+            return None
+        snapshot = None
+        if self._use_redis():
+            try:
+                value = await self._redis.get(f"{KEY_PREFIX}{user_id}")
+                snapshot = json.loads(value) if value is not None else None
+            except Exception as e:
+                self._redis_failed(e)
+                snapshot = self._memory_get(user_id)
+        else:
+            snapshot = self._memory_get(user_id)
+
+        USER_CACHE_REQUESTS.labels(result="hit" if snapshot is not None else "miss").inc()
+        return user_from_snapshot(snapshot) if snapshot is not None else None
+
+    async def set(self, user: Any) -> None:
+        """Cache a user loaded from the database."""
+        if not self.enabled:
+            return
+        snapshot = user_snapshot(user)
+        user_id = str(snapshot["id"])
+        if self._use_redis():
+            try:
+                await self._redis.set(f"{KEY_PREFIX}{user_id}", json.dumps(snapshot, default=str), ex=self.ttl)
+                return
+            except Exception as e:
+                self._redis_failed(e)
+        self._entries[user_id] = (time.monotonic() + self.ttl, snapshot)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: Any) -> None:
+        """Forget a user after it was changed or deleted."""
+        user_id = str(user_id)
+        self._entries.pop(user_id, None)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(f"{KEY_PREFIX}{user_id}")
+            except Exception as e:
+                self._redis_failed(e)
+
+    async def close(self) -> None:
+        self._entries.clear()
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                pass
+
+    def _memory_get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return snapshot
+
+
+@lru_cache()
+def get_user_cache() -> UserCache:
+    """Get the process-wide user cache."""
+    settings = get_settings()
+    return UserCache(
+        ttl=settings.user_cache_ttl,
+        max_entries=settings.user_cache_max_entries,
+        redis_url=settings.redis_url if settings.user_cache_backend == "redis" else None,
+        enabled=settings.user_cache_backend != "off",
+    )
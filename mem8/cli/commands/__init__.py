@@ -3,17 +3,33 @@
 CLI command modules for mem8.
 """
 
-from .find import find_app
-from .team import team_app
-from .deploy import deploy_app
-from .core import register_core_commands
-# Init command removed - use plugin installation instead
-# from .init import register_init_command
-from .worktree import worktree_app
-from .metadata import metadata_app
-# Templates removed - use plugin system instead
-# from .templates import templates_app
-from .utilities import gh_app, register_tools_command, register_ports_command
+import importlib
+
+# Command modules are heavy; load them on first attribute access
+_EXPORTS = {
+    "find_app": ".find",
+    "team_app": ".team",
+    "deploy_app": ".deploy",
+    "register_core_commands": ".core",
+    # Init command removed - use plugin installation instead
+    # "register_init_command": ".init",
+    "worktree_app": ".worktree",
+    "metadata_app": ".metadata",
+    "daemon_app": ".daemon",
+    # Templates removed - use plugin system instead
+    # "templates_app": ".templates",
+    "gh_app": ".utilities",
+    "register_tools_command": ".utilities",
+    "register_ports_command": ".utilities",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 
 __all__ = [
     "find_app",
@@ -23,6 +39,7 @@ __all__ = [
     # "register_init_command",  # Removed - use plugin installation
     "worktree_app",
     "metadata_app",
+    "daemon_app",
     # "templates_app",  # Removed - use plugin system
     "gh_app",
     "register_tools_command",
@@ -307,11 +307,6 @@ def register_core_commands(app: typer.Typer):
                 console.print(instructions)
             return
 
-        # Traditional CLI search - initialize state now
-        set_app_state(verbose=verbose)
-        state = get_state()
-        memory_manager = state.memory_manager
-
         # Determine content type and path based on category
         content_type = ContentType.ALL
         path_filter = path
@@ -344,13 +339,21 @@ def register_core_commands(app: typer.Typer):
                 console.print("Install with: [dim]pip install 'mem8[semantic]'[/dim]")
 
         try:
-            results = memory_manager.search_content(
+            search_params = dict(
                 query=query,
                 limit=limit,
                 content_type=content_type.value,
                 search_method=method.value,
-                path_filter=path_filter
+                path_filter=path_filter,
             )
+            # A running `mem8 daemon` answers from warm indexes; otherwise search in-process
+            from ...core import daemon
+            results = daemon.request("search", search_params)
+            if results is None:
+                set_app_state(verbose=verbose)
+                state = get_state()
+                daemon.autostart(state.config)
+                results = state.memory_manager.search_content(**search_params)
 
             if results['matches']:
                 # Display results with snippets
@@ -411,6 +414,12 @@ def register_core_commands(app: typer.Typer):
         dry_run: Annotated[bool, typer.Option(
             "--dry-run", help="Show what would be synced without making changes"
         )] = False,
+        watch: Annotated[bool, typer.Option(
+            "--watch", help="Keep running: push local edits as they happen and poll the shared side"
+        )] = False,
+        interval: Annotated[Optional[int], typer.Option(
+            "--interval", help="Seconds between shared-side polls (default: workspace.sync_interval)"
+        )] = None,
         verbose: Annotated[bool, typer.Option(
             "--verbose", "-v", help="Enable verbose output"
         )] = False
@@ -420,6 +429,13 @@ def register_core_commands(app: typer.Typer):
         state = get_state()
         sync_manager = state.sync_manager
 
+        if watch:
+            if dry_run:
+                console.print("❌ [red]--watch cannot be combined with --dry-run[/red]")
+                raise typer.Exit(1)
+            _watch_sync(sync_manager, direction, interval, verbose)
+            return
+
         action = "Dry run:" if dry_run else "Syncing"
         console.print(f"[bold blue]{action} memory ({direction.value})...[/bold blue]")
 
@@ -428,10 +444,8 @@ def register_core_commands(app: typer.Typer):
 
             if result['success']:
                 console.print("✅ [green]Sync completed successfully[/green]")
-                if 'stats' in result:
-                    stats = result['stats']
-                    console.print(f"📊 [dim]Files synced: {stats.get('files_synced', 0)}, "
-                                f"Conflicts: {stats.get('conflicts', 0)}[/dim]")
+                if 'summary' in result:
+                    _print_sync_summary(result['summary'])
             else:
                 console.print("❌ [red]Sync failed[/red]")
                 if 'error' in result:
@@ -439,3 +453,45 @@ def register_core_commands(app: typer.Typer):
 
         except Exception as e:
             handle_command_error(e, verbose, "sync")
+
+
+def _print_sync_summary(summary: dict, prefix: str = "📊") -> None:
+    """Print the counters returned by SyncManager.sync_memory."""
+    console.print(f"{prefix} [dim]Pulled: {summary.get('pulled', 0)}, "
+                  f"Pushed: {summary.get('pushed', 0)}, "
+                  f"Merged: {summary.get('merged', 0)}, "
+                  f"Conflicts: {summary.get('conflicts', 0)}[/dim]")
+
+
+def _watch_sync(sync_manager, direction: SyncDirection, interval: Optional[int], verbose: bool) -> None:
+    """Run the background sync loop until interrupted."""
+    from datetime import datetime
+    from ...core.sync_watch import SyncWatcher
+
+    def report(trigger: str, result: dict) -> None:
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        if not result.get('success'):
+            console.print(f"[dim]{timestamp}[/dim] ❌ [red]{result.get('error', 'Sync failed')}[/red]")
+            return
+        summary = result.get('summary', {})
+        changed = sum(summary.get(key, 0) for key in ('pulled', 'pushed', 'merged', 'conflicts'))
+        if changed or verbose:
+            _print_sync_summary(summary, prefix=f"[dim]{timestamp} ({trigger})[/dim]")
+
+    watcher = SyncWatcher(
+        sync_manager,
+        direction=direction.value,
+        interval=interval,
+        on_result=report,
+    )
+
+    if not sync_manager.config.get('workspace.auto_sync', True):
+        console.print("ℹ️  [yellow]workspace.auto_sync is disabled; watching because --watch was given[/yellow]")
+    console.print(f"👀 [bold blue]Watching memory ({direction.value}), "
+                  f"polling shared every {int(watcher.interval)}s. Press Ctrl+C to stop.[/bold blue]")
+
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
+        console.print("\n👋 [yellow]Sync watcher stopped[/yellow]")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Commands for the optional mem8 query daemon.
+"""
+
+import typer
+from typing import Annotated, Optional
+
+from ...core import daemon
+from ..utils import get_console
+
+# Get console instance
+console = get_console()
+
+# Create daemon subapp
+daemon_app = typer.Typer(
+    name="daemon",
+    help="Keep a warm mem8 process running so search and find answer faster"
+)
+
+
+@daemon_app.command()
+def start(
+    idle_timeout: Annotated[int, typer.Option(
+        "--idle-timeout", help="Exit after this many seconds without a query"
+    )] = daemon.DEFAULT_IDLE_TIMEOUT,
+    foreground: Annotated[bool, typer.Option(
+        "--foreground", help="Run in this terminal instead of in the background"
+    )] = False,
+):
+    """Start the daemon; search and find use it automatically while it runs."""
+    if not daemon.supported():
+        console.print("❌ [red]The mem8 daemon needs Unix domain sockets, which this platform lacks.[/red]")
+        raise typer.Exit(1)
+    if foreground:
+        daemon.Daemon(idle_timeout=idle_timeout).serve()
+        return
+
+    running = daemon.start(idle_timeout=idle_timeout)
+    if not running:
+        log = daemon.default_config_dir() / daemon.LOG_NAME
+        console.print(f"❌ [red]Daemon did not come up; see {log}[/red]")
+        raise typer.Exit(1)
+    console.print(f"✅ [green]mem8 daemon running[/green] [dim](pid {running['pid']}, {daemon.socket_path()})[/dim]")
+
+
+@daemon_app.command()
+def stop():
+    """Stop the running daemon."""
+    if daemon.stop():
+        console.print("✅ [green]mem8 daemon stopped[/green]")
+    else:
+        console.print("[yellow]mem8 daemon is not running[/yellow]")
+
+
+@daemon_app.command()
+def status():
+    """Show whether the daemon is running and what it has loaded."""
+    running: Optional[dict] = daemon.status()
+    if not running:
+        console.print("[yellow]mem8 daemon is not running[/yellow]")
+        console.print("💡 [dim]Start it with 'mem8 daemon start', or set daemon.auto_start: true in config.yaml[/dim]")
+        return
+
+    console.print(f"✅ [green]mem8 daemon {running['version']} running[/green] [dim](pid {running['pid']})[/dim]")
+    console.print(f"   [dim]Socket:[/dim] {daemon.socket_path()}")
+    console.print(f"   [dim]Uptime:[/dim] {running['uptime']:.0f}s  [dim]Queries:[/dim] {running['requests']}")
+    for workspace in running['workspaces']:
+        console.print(f"   [dim]Workspace:[/dim] {workspace}")
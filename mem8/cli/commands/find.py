@@ -6,9 +6,9 @@ Find commands for thought discovery and management.
 import typer
 from typing import Annotated, Optional
 from pathlib import Path
-import re
 from rich.table import Table
 
+from ...core import daemon
 from ..types import ActionType
 from ..state import get_state, set_app_state
 from ..actions import execute_action as _execute_action, preview_action as _preview_action
@@ -35,44 +35,23 @@ def _find_memory_new(
     verbose: bool = False
 ):
     """Core find logic used by all subcommands."""
-    set_app_state(verbose=verbose)
-    state = get_state()
-    discovery = state.memory_manager.thought_discovery
-
-    # Get filtered memory using existing methods
-    if filter_type == "type":
-        results = discovery.find_by_type(filter_value)
-    elif filter_type == "scope":
-        results = discovery.find_by_scope(filter_value)
-    elif filter_type == "status":
-        results = discovery.find_by_status(filter_value)
-    else:
-        results = discovery.discover_all_memory()
-
-    # Apply keyword filter if provided
-    if keywords and keywords.strip():
-        keyword_results = []
-        # Split keywords by spaces, treat each as regex pattern
-        patterns = [re.compile(k.strip(), re.IGNORECASE) for k in keywords.split() if k.strip()]
-
-        for entity in results:
-            # Search in content, title, tags
-            searchable_text = (
-                entity.content + ' ' +
-                str(entity.metadata.get('topic', '')) + ' ' +
-                ' '.join(entity.metadata.get('tags', []))
-            )
-
-            # Match if ANY pattern matches (OR logic)
-            if any(pattern.search(searchable_text) for pattern in patterns):
-                keyword_results.append(entity)
-
-        results = keyword_results
-
-    # Limit results
-    results = results[:limit]
-
-    if not results:
+    results = None
+    rows = None
+    if not action:
+        # Listing only: a running `mem8 daemon` answers from its warm index
+        rows = daemon.request("find", dict(
+            filter_type=filter_type, filter_value=filter_value, keywords=keywords, limit=limit,
+        ))
+
+    if rows is None:
+        set_app_state(verbose=verbose)
+        state = get_state()
+        daemon.autostart(state.config)
+        discovery = state.memory_manager.thought_discovery
+        results = discovery.filter_memory(filter_type, filter_value, keywords)[:limit]
+        rows = [entity.to_dict() for entity in results]
+
+    if not rows:
         console.print("[yellow]❌ No memory found[/yellow]")
         return
 
@@ -88,30 +67,31 @@ def _find_memory_new(
         console.print(f"[bold {action_color}]Action: {action.value}{dry_run_text}[/bold {action_color}]")
 
     # Display results table
-    table = Table(title=f"Found {len(results)} memory")
+    table = Table(title=f"Found {len(rows)} memory")
     table.add_column("Type", style="cyan", width=10)
     table.add_column("Title", style="green")
     table.add_column("Status", style="yellow", width=12)
     table.add_column("Scope", style="blue", width=10)
     table.add_column("Path", style="dim")
 
-    for entity in results:
+    for row in rows:
+        path = Path(row['path'])
         # Extract title from metadata or content
-        title = entity.metadata.get('topic', entity.path.stem)
+        title = row['metadata'].get('topic', path.stem)
         if len(title) > 40:
             title = title[:37] + "..."
 
         # Format path relative to workspace
         try:
-            rel_path = entity.path.relative_to(Path.cwd())
+            rel_path = path.relative_to(Path.cwd())
         except ValueError:
-            rel_path = entity.path
+            rel_path = path
 
         table.add_row(
-            entity.type.title(),
+            row['type'].title(),
             title,
-            entity.lifecycle_state or "Unknown",
-            entity.scope or "Unknown",
+            row['lifecycle_state'] or "Unknown",
+            row['scope'] or "Unknown",
             str(rel_path)
         )
 
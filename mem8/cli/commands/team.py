@@ -6,7 +6,7 @@ Team collaboration commands (experimental).
 import typer
 from typing import Annotated, Optional
 
-from ..state import set_app_state
+from ..state import get_state, set_app_state
 from ..utils import get_console
 
 # Get console instance
@@ -54,3 +54,38 @@ def join(
 
     console.print(f"[bold blue]Joining team: {team_name}[/bold blue]")
     console.print("[yellow]⚠️  Team features require backend API (Phase 2)[/yellow]")
+
+
+@team_app.command(name="import")
+def import_thoughts(
+    server: Annotated[Optional[str], typer.Option("--server", help="mem8 API server URL (defaults to sync.server_url)")] = None,
+    team: Annotated[Optional[str], typer.Option("--team", help="Team ID (defaults to sync.team_id)")] = None,
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Count the files that would be imported")] = False,
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Enable verbose output")] = False
+):
+    """Bulk-import local memory into a team's thoughts on the server."""
+    set_app_state(verbose=verbose)
+    state = get_state()
+    config = state.config
+
+    team_id = team or config.get('sync.team_id')
+    console.print(f"[bold blue]Importing {config.memory_dir} into team {team_id}...[/bold blue]")
+    result = state.sync_manager.import_to_server(dry_run=dry_run, server_url=server, team_id=team)
+
+    if not result['success']:
+        console.print(f"❌ [red]Import failed: {result['error']}[/red]")
+        raise typer.Exit(1)
+
+    if result['dry_run']:
+        console.print(f"Would import {result['files']} files")
+        return
+
+    console.print(
+        f"✅ Created {result['created']}, updated {result['updated']}, "
+        f"unchanged {result['unchanged']}"
+    )
+    errors = result.get('errors', [])
+    for error in errors:
+        console.print(f"[yellow]  line {error['line']}: {error.get('path') or '?'}: {error['error']}[/yellow]")
+    if errors:
+        raise typer.Exit(1)
@@ -107,6 +107,7 @@ def register_ports_command(app: typer.Typer):
         release: Annotated[bool, typer.Option("--release", help="Release this project's port lease")] = False,
         list_all: Annotated[bool, typer.Option("--list-all", help="List all port leases across all projects")] = False,
         check_conflicts: Annotated[bool, typer.Option("--check-conflicts", help="Check for port conflicts")] = False,
+        prune: Annotated[bool, typer.Option("--prune", help="Release leases of projects whose directory was deleted")] = False,
         kill: Annotated[Optional[int], typer.Option("--kill", help="Kill process using specified port")] = None,
         force: Annotated[bool, typer.Option("--force", help="Force kill port outside project range")] = False,
         show: Annotated[bool, typer.Option("--show", help="Show current project's port assignments")] = True,
@@ -144,13 +145,23 @@ def register_ports_command(app: typer.Typer):
                 console.print("[yellow]No active lease for this project[/yellow]")
             return
 
+        # Release leases of deleted projects
+        if prune:
+            stale = manager.prune_stale_leases()
+            for lease_info in stale:
+                console.print(f"[green]✓ Released {lease_info['port_range']}[/green] [dim]({lease_info['project_path']})[/dim]")
+            if not stale:
+                console.print("[green]✓ No stale port leases[/green]")
+            return
+
         # Check conflicts
         if check_conflicts:
             conflicts = manager.check_conflicts()
             if conflicts:
                 console.print(f"[red]Found {len(conflicts)} port conflicts:[/red]")
                 for conflict in conflicts:
-                    console.print(f"  Port {conflict['port']}: {conflict['project1']} ⚠️  {conflict['project2']}")
+                    ports = conflict['port_range'] if conflict['end_port'] > conflict['start_port'] else conflict['port']
+                    console.print(f"  Port {ports}: {conflict['project1']} ⚠️  {conflict['project2']}")
             else:
                 console.print("[green]✓ No port conflicts detected[/green]")
             return
@@ -59,28 +59,45 @@ def worktree_create(
 
 @worktree_app.command("list")
 def worktree_list(
+    show_status: Annotated[bool, typer.Option(
+        "--status", help="Show branch tracking and uncommitted changes for each worktree"
+    )] = False,
+    json_output: Annotated[bool, typer.Option(
+        "--json", help="Output worktrees as JSON for agent consumption"
+    )] = False,
     verbose: Annotated[bool, typer.Option(
         "--verbose", "-v", help="Enable verbose output"
     )] = False
 ):
     """List existing worktrees."""
-    from ...core.worktree import list_worktrees
-    from rich.table import Table
+    from ...core.worktree import collect_worktree_statuses, list_worktrees
 
     set_app_state(verbose=verbose)
 
     try:
         worktrees = list_worktrees()
+        if show_status:
+            worktrees = collect_worktree_statuses(worktrees)
+
+        if json_output:
+            import json
+            print(json.dumps(worktrees, indent=2))
+            return
 
         if not worktrees:
             console.print("[yellow]No worktrees found[/yellow]")
             return
 
+        from rich.table import Table
+
         table = Table(title=f"Git Worktrees ({len(worktrees)} found)")
         table.add_column("Path", style="cyan")
         table.add_column("Branch", style="green")
         table.add_column("Commit", style="dim", width=12)
         table.add_column("Status", style="yellow")
+        if show_status:
+            table.add_column("Changes", justify="right")
+            table.add_column("Ahead/Behind", justify="right", style="dim")
 
         for wt in worktrees:
             path = wt.get('path', 'Unknown')
@@ -94,11 +111,28 @@ def worktree_list(
             else:
                 status = "active"
 
-            table.add_row(path, branch, commit, status)
+            row = [path, branch, commit, status]
+            if show_status:
+                details = wt.get('status', {})
+                if not details:
+                    row += ["", ""]
+                elif not details.get('exists'):
+                    row += ["[red]missing[/red]", ""]
+                elif not details.get('valid'):
+                    row += ["[red]error[/red]", ""]
+                else:
+                    changes = "[green]clean[/green]" if details['is_clean'] else str(details['changes'])
+                    tracking = f"+{details['ahead']}/-{details['behind']}" if details.get('upstream') else ""
+                    row += [changes, tracking]
+            table.add_row(*row)
 
         console.print(table)
 
     except Exception as e:
+        if json_output:
+            import json
+            print(json.dumps({"error": str(e)}))
+            raise typer.Exit(1)
         console.print(f"❌ [bold red]Error listing worktrees: {e}[/bold red]")
         if verbose:
             console.print_exception()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Lazily loaded CLI commands.
+
+Command modules pull in most of mem8 (config, sync, search, rich tables),
+so importing them all would make every invocation, including ``--version``
+and shell completion, pay for the whole CLI. :class:`LazyTyperGroup` lists
+commands from a static table and imports a command's module only when that
+command is resolved.
+"""
+
+import importlib
+from typing import Dict, List, NamedTuple, Optional
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """Where to find a top-level command and how to describe it in help.
+
+    ``target`` is ``"module:attribute"``. The attribute is either a
+    ``typer.Typer`` sub-app or a ``register_*(app)`` function that adds
+    ``name`` as a command.
+    """
+
+    name: str
+    target: str
+    help: str
+
+    def load(self):
+        module_name, attribute = self.target.split(":")
+        obj = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(obj, typer.Typer):
+            group = typer.main.get_group(obj)
+            group.name = self.name
+            return group
+
+        app = typer.Typer()
+        obj(app)
+        return typer.main.get_group(app).commands[self.name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group whose commands are imported on first use."""
+
+    lazy_commands: Dict[str, LazyCommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listing = False
+
+    def list_commands(self, ctx) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in self.lazy_commands if name not in self.commands]
+
+    def get_command(self, ctx, cmd_name: str):
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        lazy = self.lazy_commands.get(cmd_name)
+        if lazy is None:
+            return None
+        if self._listing:
+            # Help only needs the name and summary
+            return TyperCommand(cmd_name, help=lazy.help)
+        command = lazy.load()
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+
+def lazy_group(commands: List[LazyCommand], base: Optional[type] = None) -> type:
+    """Build a group class serving ``commands`` in the given order."""
+    return type(
+        "LazyMem8Group",
+        (base or LazyTyperGroup,),
+        {"lazy_commands": {command.name: command for command in commands}},
+    )
@@ -8,30 +8,52 @@ import typer
 
 from .. import __version__
 
-# Import types and utils from CLI package
-from .utils import get_console
-
-# Import state management and actions
-
-# Import template management
-
-# Import command modules
-from .commands import (
-    find_app, team_app, deploy_app,
-    register_core_commands,
-    worktree_app, metadata_app,
-    gh_app, register_tools_command, register_ports_command
-)
-
-# Create console instance
-console = get_console()
+from .lazy import LazyCommand, lazy_group
+
+# Commands are imported only when invoked; see lazy.py. Help text here is
+# what `mem8 --help` shows and must match the command's own docstring.
+COMMANDS = [
+    # Core commands: status, doctor, serve, search, sync
+    LazyCommand("status", "mem8.cli.commands.core:register_core_commands",
+                "Show mem8 workspace status."),
+    LazyCommand("doctor", "mem8.cli.commands.core:register_core_commands",
+                "Diagnose and fix mem8 workspace issues."),
+    LazyCommand("serve", "mem8.cli.commands.core:register_core_commands",
+                "Start the mem8 API server (FastAPI backend)."),
+    LazyCommand("search", "mem8.cli.commands.core:register_core_commands",
+                "Full-text content search with context snippets."),
+    LazyCommand("sync", "mem8.cli.commands.core:register_core_commands",
+                "Synchronize local and shared memory."),
+    # Utility commands
+    LazyCommand("tools", "mem8.cli.commands.utilities:register_tools_command",
+                "List toolbelt CLI tools and OS details for AI system prompts."),
+    LazyCommand("ports", "mem8.cli.commands.utilities:register_ports_command",
+                "Manage project port assignments to prevent conflicts across projects."),
+    # Subcommand groups (templates_app removed - use plugin system instead)
+    LazyCommand("find", "mem8.cli.commands.find:find_app",
+                "Browse/filter memory by type, status, or metadata. "
+                "For content search, use 'mem8 search <query>' instead."),
+    LazyCommand("team", "mem8.cli.commands.team:team_app",
+                "Experimental team collaboration commands"),
+    LazyCommand("deploy", "mem8.cli.commands.deploy:deploy_app",
+                "Experimental deployment commands"),
+    LazyCommand("worktree", "mem8.cli.commands.worktree:worktree_app",
+                "Git worktree management for development workflows"),
+    LazyCommand("metadata", "mem8.cli.commands.metadata:metadata_app",
+                "Repository metadata management and research tools"),
+    LazyCommand("gh", "mem8.cli.commands.utilities:gh_app",
+                "GitHub CLI integration helpers"),
+    LazyCommand("daemon", "mem8.cli.commands.daemon:daemon_app",
+                "Keep a warm mem8 process running so search and find answer faster"),
+]
 
 # Create Typer app
 typer_app = typer.Typer(
     name="mem8",
     help="Memory management CLI for team collaboration",
     add_completion=False,  # We'll manage this ourselves
-    rich_markup_mode="rich"
+    rich_markup_mode="rich",
+    cls=lazy_group(COMMANDS),
 )
 
 # ============================================================================
@@ -40,7 +62,7 @@ typer_app = typer.Typer(
 
 def version_callback(value: bool):
     if value:
-        console.print(f"mem8 version {__version__}")
+        typer.echo(f"mem8 version {__version__}")
         raise typer.Exit()
 
 
@@ -57,32 +79,6 @@ def main_callback(
     pass
 
 
-# ============================================================================
-# Register Core Commands
-# ============================================================================
-
-# Register core commands: status, doctor, serve, search, sync
-register_core_commands(typer_app)
-
-
-# ============================================================================
-# Register Command Groups and Commands
-# ============================================================================
-
-# Register subcommand groups
-typer_app.add_typer(find_app, name="find")
-typer_app.add_typer(team_app, name="team")
-typer_app.add_typer(deploy_app, name="deploy")
-typer_app.add_typer(worktree_app, name="worktree")
-typer_app.add_typer(metadata_app, name="metadata")
-# templates_app removed - use plugin system instead
-typer_app.add_typer(gh_app, name="gh")
-
-# Register utility commands
-register_tools_command(typer_app)
-register_ports_command(typer_app)
-
-
 # ============================================================================
 # Shell Completion (Using Typer's built-in system)
 # ============================================================================
@@ -3,18 +3,18 @@
 Application state management for mem8 CLI.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
 
-from ..core.config import Config
-from ..core.memory import MemoryManager
-from ..core.sync import SyncManager
-from ..core.intelligent_query import IntelligentQueryEngine
-from ..core.thought_actions import ThoughtActionEngine
-from ..core.utils import setup_logging
-
 from .utils import get_console
 
+if TYPE_CHECKING:
+    from ..core.config import Config
+    from ..core.intelligent_query import IntelligentQueryEngine
+    from ..core.memory import MemoryManager
+    from ..core.sync import SyncManager
+    from ..core.thought_actions import ThoughtActionEngine
+
 # Create console instance for error handling
 console = get_console()
 
@@ -31,49 +31,59 @@ class AppState:
         self._initialized = False
 
     def initialize(self, verbose: bool = False, config_dir: Optional[Path] = None):
-        """Initialize state with parameters. Only initializes once."""
+        """Initialize state with parameters. Only initializes once.
+
+        Only the config is created here; managers are imported and built on
+        first access, so commands that never touch them skip loading them.
+        """
         if self._initialized:
             return  # Already initialized, skip re-initialization
 
+        from ..core.config import Config
+        from ..core.utils import setup_logging
+
         if verbose:
             setup_logging(True)
 
-        # Initialize components
         self._config = Config(config_dir)
-        self._memory_manager = MemoryManager(self._config)
-        self._sync_manager = SyncManager(self._config)
-        self._query_engine = IntelligentQueryEngine(self._memory_manager.thought_discovery)
-        self._action_engine = ThoughtActionEngine(self._config)
         self._initialized = True
 
     @property
-    def config(self) -> Config:
+    def config(self) -> "Config":
         if not self._config:
             self.initialize()
         return self._config
 
     @property
-    def memory_manager(self) -> MemoryManager:
+    def memory_manager(self) -> "MemoryManager":
         if not self._memory_manager:
-            self.initialize()
+            from ..core.memory import MemoryManager
+
+            self._memory_manager = MemoryManager(self.config)
         return self._memory_manager
 
     @property
-    def sync_manager(self) -> SyncManager:
+    def sync_manager(self) -> "SyncManager":
         if not self._sync_manager:
-            self.initialize()
+            from ..core.sync import SyncManager
+
+            self._sync_manager = SyncManager(self.config)
         return self._sync_manager
 
     @property
-    def query_engine(self) -> IntelligentQueryEngine:
+    def query_engine(self) -> "IntelligentQueryEngine":
         if not self._query_engine:
-            self.initialize()
+            from ..core.intelligent_query import IntelligentQueryEngine
+
+            self._query_engine = IntelligentQueryEngine(self.memory_manager.thought_discovery)
         return self._query_engine
 
     @property
-    def action_engine(self) -> ThoughtActionEngine:
+    def action_engine(self) -> "ThoughtActionEngine":
         if not self._action_engine:
-            self.initialize()
+            from ..core.thought_actions import ThoughtActionEngine
+
+            self._action_engine = ThoughtActionEngine(self.config)
         return self._action_engine
 
 
@@ -87,27 +97,27 @@ def get_state() -> AppState:
 
 
 # Dependency injection helpers
-def get_memory_manager() -> MemoryManager:
+def get_memory_manager() -> "MemoryManager":
     """Get memory manager instance."""
     return app_state.memory_manager
 
 
-def get_query_engine() -> IntelligentQueryEngine:
+def get_query_engine() -> "IntelligentQueryEngine":
     """Get query engine instance."""
     return app_state.query_engine
 
 
-def get_action_engine() -> ThoughtActionEngine:
+def get_action_engine() -> "ThoughtActionEngine":
     """Get action engine instance."""
     return app_state.action_engine
 
 
-def get_sync_manager() -> SyncManager:
+def get_sync_manager() -> "SyncManager":
     """Get sync manager instance."""
     return app_state.sync_manager
 
 
-def get_config() -> Config:
+def get_config() -> "Config":
     """Get configuration instance."""
     return app_state.config
 
@@ -1,12 +1,213 @@
 """AI-powered completion analysis for thought entities."""
 
+import datetime
+import hashlib
+import json
+import os
 import re
 import subprocess
 import string
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from .config import Config
 from .thought_entity import ThoughtEntity
+from .utils import ensure_directory_exists
+
+# How far back git commits count as implementation evidence
+GIT_LOG_SINCE = '30 days ago'
+
+# File references in plan content: in backticks, in quotes, and bare
+FILE_REFERENCE_PATTERNS = [
+    re.compile(r'`([^`]+\.(py|js|ts|md|json|yaml|yml|txt))`'),
+    re.compile(r'"([^"]+\.(py|js|ts|md|json|yaml|yml|txt))"'),
+    re.compile(r'([A-Za-z0-9/_.-]+\.(py|js|ts|md|json|yaml|yml|txt))'),
+]
+
+# Bump when the analysis changes so cached results are recomputed
+ANALYSIS_VERSION = 1
+
+# Below this many uncached entities a process pool costs more than it saves
+PARALLEL_MIN_ENTITIES = 2000
+
+
+class WorkspaceFiles:
+    """Every file under the workspace, from a single directory walk.
+
+    Answers the "does this mentioned file exist" checks for a whole batch
+    without a ``stat`` per candidate. Paths outside the workspace, or under
+    directories the walk does not enter (dependency and VCS folders,
+    symlinked directories), are checked on disk instead.
+    """
+
+    SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', '.pytest_cache'}
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._prefix = os.path.join(os.path.normpath(self.root), '')
+        self.files = set()
+        self._unwalked = set()
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            relative_dir = os.path.relpath(dirpath, self.root)
+            prefix = '' if relative_dir == '.' else relative_dir.replace(os.sep, '/') + '/'
+            for name in list(dirnames):
+                if name in self.SKIP_DIRS or os.path.islink(os.path.join(dirpath, name)):
+                    dirnames.remove(name)
+                    self._unwalked.add(prefix + name)
+            self.files.update(prefix + name for name in filenames)
+
+    def fingerprint(self) -> str:
+        """Digest of the file list; changes when files are added or removed."""
+        digest = hashlib.sha1()
+        for path in sorted(self.files):
+            digest.update(path.encode('utf-8', 'surrogateescape') + b'\0')
+        return digest.hexdigest()
+
+    def find(self, file_ref: str, base_dir: Path) -> Optional[str]:
+        """Workspace-relative path of the first existing reading of ``file_ref``.
+
+        Tries it relative to the workspace, its bare name at the workspace
+        root, then relative to ``base_dir`` (the thought's folder). Works on
+        strings: this runs for every file mentioned in every entity.
+        """
+        root = str(self.root)
+        for candidate in (
+            os.path.join(root, file_ref),
+            os.path.join(root, os.path.basename(file_ref)),
+            os.path.join(str(base_dir), file_ref),
+        ):
+            normalized = os.path.normpath(candidate)
+            if normalized.startswith(self._prefix):
+                native = normalized[len(self._prefix):]
+                relative = native.replace(os.sep, '/')
+                if not self._in_unwalked(relative):
+                    if relative in self.files:
+                        return native
+                    continue
+            path = Path(candidate)
+            if path.is_file():
+                return str(path.relative_to(self.root))
+        return None
+
+    def _in_unwalked(self, relative: str) -> bool:
+        parent = relative.rpartition('/')[0]
+        while parent:
+            if parent in self._unwalked:
+                return True
+            parent = parent.rpartition('/')[0]
+        return False
+
+
+class CompletionCache:
+    """Completion analyses persisted in the data dir between runs.
+
+    Entries are keyed by a hash of the entity (path, content, metadata,
+    status). The whole cache is dropped when its *state* changes: HEAD, the
+    day (the git evidence window is relative to today) and the workspace
+    file list (artifact evidence). Re-running on an unchanged repo only
+    hashes entities.
+    """
+
+    def __init__(self, data_dir: Path, workspace_dir: Path, state: str):
+        workspace_id = hashlib.sha1(str(Path(workspace_dir).resolve()).encode('utf-8')).hexdigest()[:16]
+        self.cache_file = data_dir / "completion_cache" / f"{workspace_id}.json"
+        self.state = state
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('state') == state:
+                self._results = data.get('results', {})
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def entity_key(entity: ThoughtEntity) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            str(entity.path),
+            entity.type,
+            entity.lifecycle_state or '',
+            json.dumps(entity.metadata, sort_keys=True, default=str),
+            entity.content,
+        ):
+            digest.update(part.encode('utf-8', 'surrogateescape') + b'\0')
+        return digest.hexdigest()
+
+    def get(self, entity: ThoughtEntity) -> Optional[Dict[str, Any]]:
+        return self._results.get(self.entity_key(entity))
+
+    def put(self, entity: ThoughtEntity, analysis: Dict[str, Any]) -> None:
+        self._results[self.entity_key(entity)] = analysis
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        ensure_directory_exists(self.cache_file.parent)
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'state': self.state, 'results': self._results}, f, default=str)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            return  # The cache is an optimization; the results are still valid
+        self._dirty = False
+
+
+# Engine of a pool worker process, set by _init_worker
+_worker_engine = None
+
+
+def _init_worker(engine: 'CompletionAnalysisEngine') -> None:
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _analyze_in_worker(entity: ThoughtEntity) -> Dict[str, Any]:
+    return _worker_engine.analyze_completion(entity)
+
+
+def git_head(workspace_dir: Path) -> Optional[str]:
+    """Commit checked out in ``workspace_dir``, or None outside a git repo."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=workspace_dir)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+class GitLogIndex:
+    """Recent commit messages from a single ``git log`` run, searchable by term.
+
+    Stands in for running ``git log --oneline --grep <term>`` once per term:
+    a term matches a commit when it occurs in the full message (matched as
+    a fixed string, case-sensitive), and lookups are memoized per term.
+    """
+
+    def __init__(self, workspace_dir: Path, since: str = GIT_LOG_SINCE):
+        self.commits: List[Tuple[str, str]] = []  # (oneline, full message)
+        self._matches: Dict[str, List[str]] = {}
+        try:
+            result = subprocess.run(
+                ['git', 'log', f'--since={since}', '--format=%h %s%x00%B%x00'],
+                capture_output=True, text=True, encoding='utf-8', errors='replace', cwd=workspace_dir,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return  # No git, no evidence
+        if result.returncode != 0:
+            return
+
+        fields = result.stdout.split('\0')
+        for oneline, message in zip(fields[0::2], fields[1::2]):
+            self.commits.append((oneline.strip(), message))
+
+    def grep(self, term: str) -> List[str]:
+        """One-line summaries of commits whose message contains ``term``."""
+        matches = self._matches.get(term)
+        if matches is None:
+            matches = self._matches[term] = [oneline for oneline, message in self.commits if term in message]
+        return matches
 
 
 class CompletionAnalysisEngine:
@@ -14,6 +215,15 @@ class CompletionAnalysisEngine:
     
     def __init__(self, config: Config):
         self.config = config
+        self._git_log: Optional[GitLogIndex] = None
+        # Set during analyze_batch; single analyses check files on disk
+        self._workspace_files: Optional[WorkspaceFiles] = None
+
+    def _git_log_index(self) -> GitLogIndex:
+        """Recent commits, read once per engine (and once per batch)."""
+        if self._git_log is None:
+            self._git_log = GitLogIndex(self.config.workspace_dir)
+        return self._git_log
         
     def analyze_completion(self, entity: ThoughtEntity) -> Dict[str, Any]:
         """Comprehensively analyze if a thought entity is complete."""
@@ -159,20 +369,11 @@ class CompletionAnalysisEngine:
             # Search for commits mentioning the topic
             search_terms = self._extract_search_terms(topic)
             
+            git_log = self._git_log_index()
             related_commits = []
             for term in search_terms:
-                # Search git log for commits mentioning this term
-                try:
-                    result = subprocess.run([
-                        'git', 'log', '--oneline', '--grep', term, '--since=30 days ago'
-                    ], capture_output=True, text=True, cwd=self.config.workspace_dir)
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        commits = result.stdout.strip().split('\n')
-                        related_commits.extend(commits)
-                        
-                except subprocess.SubprocessError:
-                    continue
+                # Commits mentioning this term
+                related_commits.extend(git_log.grep(term))
                     
             if related_commits:
                 return {
@@ -195,15 +396,9 @@ class CompletionAnalysisEngine:
         content = entity.content
         
         # Look for file references in the content
-        file_patterns = [
-            r'`([^`]+\.(py|js|ts|md|json|yaml|yml|txt))`',  # Files in backticks
-            r'"([^"]+\.(py|js|ts|md|json|yaml|yml|txt))"',  # Files in quotes
-            r'([A-Za-z0-9/_.-]+\.(py|js|ts|md|json|yaml|yml|txt))',  # File patterns
-        ]
-        
         mentioned_files = set()
-        for pattern in file_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in FILE_REFERENCE_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 if isinstance(match, tuple):
                     mentioned_files.add(match[0])
@@ -218,6 +413,12 @@ class CompletionAnalysisEngine:
         workspace_dir = self.config.workspace_dir
         
         for file_ref in mentioned_files:
+            if self._workspace_files:
+                found = self._workspace_files.find(file_ref, entity.path.parent)
+                if found:
+                    existing_files.append(found)
+                continue
+
             # Try various interpretations of the file path
             possible_paths = [
                 workspace_dir / file_ref,
@@ -260,6 +461,19 @@ class CompletionAnalysisEngine:
         # Also include the original topic for exact matches
         return meaningful_words + [topic]
     
+    def _analyze_many(self, entities: List[ThoughtEntity], workers: Optional[int]) -> List[Dict[str, Any]]:
+        """Analyze ``entities`` in order, on a process pool when there are enough of them."""
+        if workers is None:
+            workers = min(8, os.cpu_count() or 1)
+        if workers <= 1 or len(entities) < PARALLEL_MIN_ENTITIES:
+            return [self.analyze_completion(entity) for entity in entities]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(entities) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+            return list(pool.map(_analyze_in_worker, entities, chunksize=chunksize))
+
     def _calculate_confidence(self, evidence: List[Dict]) -> float:
         """Calculate overall completion confidence from evidence."""
         if not evidence:
@@ -308,13 +522,44 @@ class CompletionAnalysisEngine:
             
         return recommendations
     
-    def analyze_batch(self, entities: List[ThoughtEntity]) -> Dict[str, Any]:
-        """Analyze multiple entities and provide batch insights."""
-        results = []
-        
-        for entity in entities:
-            analysis = self.analyze_completion(entity)
-            results.append(analysis)
+    def analyze_batch(
+        self,
+        entities: List[ThoughtEntity],
+        use_cache: bool = True,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Analyze multiple entities and provide batch insights.
+
+        The workspace is walked and the commit log read once for the whole
+        batch, and results are reused from the completion cache for entities
+        unchanged since an earlier run against the same repository state.
+        Large batches are analyzed on a pool of ``workers`` processes
+        (default: one per CPU, up to 8).
+        """
+        workspace_dir = self.config.workspace_dir
+        self._git_log = GitLogIndex(workspace_dir)
+        self._workspace_files = WorkspaceFiles(workspace_dir)
+        cache = None
+        if use_cache:
+            state = json.dumps([
+                ANALYSIS_VERSION,
+                git_head(workspace_dir),
+                datetime.date.today().isoformat(),
+                self._workspace_files.fingerprint(),
+            ])
+            cache = CompletionCache(self.config.data_dir, workspace_dir, state)
+
+        results: List[Optional[Dict[str, Any]]] = [cache.get(entity) if cache else None for entity in entities]
+        pending = [i for i, analysis in enumerate(results) if analysis is None]
+        try:
+            for i, analysis in zip(pending, self._analyze_many([entities[i] for i in pending], workers)):
+                results[i] = analysis
+                if cache:
+                    cache.put(entities[i], analysis)
+        finally:
+            self._workspace_files = None
+        if cache:
+            cache.save()
         
         # Aggregate insights
         high_confidence_complete = [r for r in results if r['completion_confidence'] >= 0.8]
@@ -4,7 +4,8 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 import yaml
-from platformdirs import user_config_dir, user_data_dir
+
+from .frontmatter import safe_load
 
 
 class Config:
@@ -20,8 +21,14 @@ class Config:
         env_config_dir = os.environ.get("MEM8_CONFIG_DIR")
         env_data_dir = os.environ.get("MEM8_DATA_DIR")
 
-        self.config_dir = Path(config_dir or env_config_dir or user_config_dir("mem8"))
-        self.data_dir = Path(env_data_dir or user_data_dir("mem8"))
+        config_dir = config_dir or env_config_dir
+        if not (config_dir and env_data_dir):
+            from platformdirs import user_config_dir, user_data_dir
+
+            config_dir = config_dir or user_config_dir("mem8")
+            env_data_dir = env_data_dir or user_data_dir("mem8")
+        self.config_dir = Path(config_dir)
+        self.data_dir = Path(env_data_dir)
         self.config_file = self.config_dir / "config.yaml"
         
         # Ensure directories exist
@@ -36,7 +43,7 @@ class Config:
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
+                    return safe_load(f) or {}
             except (yaml.YAMLError, IOError):
                 pass
         
@@ -75,6 +82,7 @@ class Config:
                 'memory_hierarchy': ['enterprise', 'project', 'user', 'local'],
             },
             'sync': {
+                'transport': 'filesystem',  # filesystem (shared.default_location) or http
                 'conflict_resolution': 'prompt',  # prompt, local, shared, newest
                 'backup_before_sync': True,
                 'exclude_patterns': ['.git', '__pycache__', '*.pyc', '.DS_Store'],
@@ -84,6 +92,10 @@ class Config:
                 'index_content': True,
                 'index_metadata': True,
             },
+            'daemon': {
+                'auto_start': False,  # start `mem8 daemon` on the first search/find
+                'idle_timeout': 1800,
+            },
         }
     
     def _get_default_shared_location(self) -> Path:
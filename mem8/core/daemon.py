@@ -0,0 +1,312 @@
+"""Optional local daemon that keeps mem8 search state warm between CLI calls.
+
+Each ``mem8 search`` / ``mem8 find`` is otherwise a fresh process that
+rebuilds the config, rescans and reparses every memory file and, for
+semantic search, reloads the embedding model. The daemon holds those in
+memory behind a Unix socket in the config directory; the CLI forwards
+queries to it when it is running and runs them in-process when it is not.
+
+The protocol is one JSON object per line in each direction::
+
+    -> {"op": "search", "cwd": "/repo", "version": "x.y.z", "params": {...}}
+    <- {"ok": true, "result": {...}}
+
+Requests are served one at a time, so the daemon can ``chdir`` into the
+caller's workspace (``Config.workspace_dir`` is the working directory).
+Files are re-stat'ed on every request and reparsed only when they changed,
+so answers are as fresh as an in-process run.
+
+This module is imported on the CLI fast path; keep its top-level imports
+to the standard library.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .. import __version__
+
+SOCKET_NAME = "mem8d.sock"
+LOCK_NAME = "mem8d.lock"
+LOG_NAME = "mem8d.log"
+
+# Exit after this long without a request
+DEFAULT_IDLE_TIMEOUT = 1800
+
+CONNECT_TIMEOUT = 0.5
+# First queries load the workspace (and possibly an embedding model)
+REQUEST_TIMEOUT = 300
+
+
+class DaemonError(RuntimeError):
+    """The daemon received the request but could not answer it."""
+
+
+def supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_config_dir() -> Path:
+    """Config directory as :class:`~mem8.core.config.Config` resolves it, without loading it."""
+    env_config_dir = os.environ.get("MEM8_CONFIG_DIR")
+    if env_config_dir:
+        return Path(env_config_dir)
+    from platformdirs import user_config_dir
+
+    return Path(user_config_dir("mem8"))
+
+
+def socket_path(config_dir: Optional[Path] = None) -> Path:
+    return Path(config_dir or default_config_dir()) / SOCKET_NAME
+
+
+def enabled() -> bool:
+    """Whether the CLI should try the daemon (``MEM8_DAEMON=off`` disables it)."""
+    return supported() and os.environ.get("MEM8_DAEMON", "").lower() not in ("0", "off", "false", "no")
+
+
+def _call(path: Path, message: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+    """Send one request; None when nothing is listening on ``path``."""
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    return json.loads(line) if line else None
+
+
+def request(op: str, params: Optional[Dict[str, Any]] = None, config_dir: Optional[Path] = None,
+            timeout: float = REQUEST_TIMEOUT) -> Optional[Any]:
+    """Run ``op`` in the daemon and return its result.
+
+    Returns None when the daemon is disabled, not running or from another
+    mem8 version, so callers fall back to running in-process. Raises
+    :class:`DaemonError` when the daemon ran the query and it failed.
+    """
+    if not enabled():
+        return None
+    response = _call(
+        socket_path(config_dir),
+        {"op": op, "cwd": os.getcwd(), "version": __version__, "params": params or {}},
+        timeout,
+    )
+    if response is None or response.get("stale"):
+        return None
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "daemon request failed"))
+    return response.get("result")
+
+
+def status(config_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """``{"pid", "version", "uptime", "requests", "workspaces"}`` of the running daemon, or None."""
+    if not supported():
+        return None
+    response = _call(socket_path(config_dir), {"op": "ping", "version": __version__}, CONNECT_TIMEOUT * 4)
+    return response.get("result") if response and response.get("ok") else None
+
+
+def stop(config_dir: Optional[Path] = None) -> bool:
+    """Ask the running daemon to exit; False if none was running."""
+    if not supported():
+        return False
+    response = _call(socket_path(config_dir), {"op": "stop"}, CONNECT_TIMEOUT * 4)
+    return bool(response and response.get("ok"))
+
+
+def start(config_dir: Optional[Path] = None, idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+          wait: float = 5.0) -> Optional[Dict[str, Any]]:
+    """Start the daemon in the background and wait up to ``wait`` seconds for it to answer."""
+    if not supported():
+        raise DaemonError("mem8 daemon needs Unix domain sockets, which this platform lacks")
+    running = status(config_dir)
+    if running:
+        return running
+
+    config_dir = Path(config_dir or default_config_dir())
+    config_dir.mkdir(parents=True, exist_ok=True)
+    env = os.environ.copy()
+    env["MEM8_CONFIG_DIR"] = str(config_dir)
+    with open(config_dir / LOG_NAME, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "mem8.core.daemon", "--idle-timeout", str(idle_timeout)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            env=env,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        running = status(config_dir)
+        if running:
+            return running
+        time.sleep(0.05)
+    return None
+
+
+def autostart(config) -> None:
+    """Start the daemon in the background if ``daemon.auto_start`` is set and it is not running."""
+    if not enabled() or not config.get("daemon.auto_start", False):
+        return
+    if socket_path(config.config_dir).exists() and status(config.config_dir):
+        return
+    try:
+        start(config.config_dir, int(config.get("daemon.idle_timeout", DEFAULT_IDLE_TIMEOUT)), wait=0)
+    except (OSError, DaemonError):
+        pass
+
+
+class Daemon:
+    """Serves queries from warm, per-workspace memory managers."""
+
+    def __init__(self, config_dir: Optional[Path] = None, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+        self.config_dir = Path(config_dir or default_config_dir())
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.requests = 0
+        self.stopping = False
+        self._config = None
+        self._config_stamp = None
+        self._managers: Dict[str, Any] = {}
+
+    def _manager(self, workspace: str):
+        """Memory manager for ``workspace``; all are rebuilt when config.yaml changes."""
+        from .config import Config
+        from .memory import MemoryManager
+
+        config_file = self.config_dir / "config.yaml"
+        stamp = config_file.stat().st_mtime_ns if config_file.exists() else None
+        if self._config is None or stamp != self._config_stamp:
+            self._config = Config(str(self.config_dir))
+            self._config_stamp = stamp
+            self._managers.clear()
+        manager = self._managers.get(workspace)
+        if manager is None:
+            manager = self._managers[workspace] = MemoryManager(self._config)
+        return manager
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "result": {
+                "pid": os.getpid(),
+                "version": __version__,
+                "uptime": time.time() - self.started_at,
+                "requests": self.requests,
+                "workspaces": sorted(self._managers),
+            }}
+        if op == "stop":
+            self.stopping = True
+            return {"ok": True, "result": None}
+        if message.get("version") != __version__:
+            # The CLI was upgraded underneath us; make way for a fresh daemon
+            self.stopping = True
+            return {"ok": False, "stale": True}
+
+        self.requests += 1
+        params = message.get("params") or {}
+        try:
+            workspace = str(Path(message["cwd"]).resolve())
+            os.chdir(workspace)
+            manager = self._manager(workspace)
+            if op == "search":
+                result = manager.search_content(**params)
+            elif op == "find":
+                limit = params.pop("limit", None)
+                entities = manager.thought_discovery.filter_memory(force_rescan=True, **params)
+                result = [entity.to_dict() for entity in entities[:limit]]
+            else:
+                return {"ok": False, "error": f"unknown operation {op!r}"}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": True, "result": result}
+
+    def serve(self) -> None:
+        import fcntl
+
+        path = socket_path(self.config_dir)
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Held while serving, so of several daemons started at once (e.g. by
+        # concurrent autostarts) only one unlinks and binds the socket
+        with open(self.config_dir / LOCK_NAME, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                running = status(self.config_dir) is not None
+            except OSError:
+                running = True
+            if running:
+                print(f"mem8 daemon already running on {path}", file=sys.stderr)
+                return
+            self._serve(path)
+
+    def _serve(self, path: Path) -> None:
+        import socketserver
+
+        path.unlink(missing_ok=True)
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                if not line:
+                    return
+                try:
+                    response = daemon.handle(json.loads(line))
+                except ValueError:
+                    response = {"ok": False, "error": "malformed request"}
+                self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+        # Only the owning user may connect
+        old_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(str(path), Handler)
+        finally:
+            os.umask(old_umask)
+        server.timeout = min(5.0, self.idle_timeout)
+        print(f"mem8 daemon {__version__} (pid {os.getpid()}) listening on {path}", file=sys.stderr, flush=True)
+
+        last_request = time.monotonic()
+        try:
+            while not self.stopping:
+                served = self.requests
+                server.handle_request()
+                if self.requests != served:
+                    last_request = time.monotonic()
+                elif time.monotonic() - last_request > self.idle_timeout:
+                    break
+        finally:
+            server.server_close()
+            path.unlink(missing_ok=True)
+
+
+def main(argv=None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="mem8 query daemon")
+    parser.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Exit after this many seconds without a request")
+    args = parser.parse_args(argv)
+    Daemon(idle_timeout=args.idle_timeout).serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Gitignore-style exclude patterns for sync."""
+
+import os
+import re
+from pathlib import Path, PurePath
+from typing import Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+
+
+def _translate(glob: str) -> str:
+    """Translate a gitignore glob (without anchors) into a regex fragment."""
+    parts: List[str] = []
+    i, n = 0, len(glob)
+
+    while i < n:
+        c = glob[i]
+        if c == '*':
+            if glob.startswith('**', i):
+                i += 2
+                if i < n and glob[i] == '/':
+                    # '**/' matches zero or more leading directories
+                    parts.append('(?:.*/)?')
+                    i += 1
+                else:
+                    parts.append('.*')
+                continue
+            parts.append('[^/]*')
+        elif c == '?':
+            parts.append('[^/]')
+        elif c == '[':
+            end = glob.find(']', i + 2 if glob.startswith('[!', i) else i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                body = glob[i + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append('[' + body + ']')
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            parts.append(re.escape(glob[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+
+    return ''.join(parts)
+
+
+class ExcludeMatcher:
+    """Exclude patterns compiled once, with gitignore matching semantics.
+
+    - ``name`` or ``*.ext`` match a file or directory name at any depth
+    - patterns containing a ``/`` are anchored to the sync root
+    - a trailing ``/`` only matches directories
+    - ``**`` matches across directory levels
+    - ``!pattern`` re-includes paths excluded by an earlier pattern
+
+    A matching directory excludes everything below it, so walks can prune it.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the given patterns."""
+        self.patterns = tuple(patterns)
+        # (file_regex, dir_regex, negated) in declaration order
+        self._rules: List[Tuple[Pattern[str], Pattern[str], bool]] = []
+
+        for raw in self.patterns:
+            rule = self._compile(raw)
+            if rule:
+                self._rules.append(rule)
+
+        # Without negations a single alternation answers every query
+        self._combined: Optional[Tuple[Pattern[str], Pattern[str]]] = None
+        if self._rules and not any(negated for _, _, negated in self._rules):
+            self._combined = (
+                re.compile('|'.join(f"(?:{r.pattern})" for r, _, _ in self._rules), re.DOTALL),
+                re.compile('|'.join(f"(?:{r.pattern})" for _, r, _ in self._rules), re.DOTALL),
+            )
+
+    @staticmethod
+    def _compile(raw: str) -> Optional[Tuple[Pattern[str], Pattern[str], bool]]:
+        pattern = raw.strip()
+        if not pattern or pattern.startswith('#'):
+            return None
+
+        negated = pattern.startswith('!')
+        if negated:
+            pattern = pattern[1:]
+        elif pattern.startswith('\\!') or pattern.startswith('\\#'):
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        if not pattern:
+            return None
+
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        prefix = '' if anchored else '(?:.*/)?'
+        body = prefix + _translate(pattern)
+
+        # A match on an ancestor directory also covers everything beneath it
+        dir_regex = re.compile(f"^{body}(?:/.*)?$", re.DOTALL)
+        file_regex = re.compile(f"^{body}/.*$", re.DOTALL) if dir_only else dir_regex
+        return file_regex, dir_regex, negated
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def matches(self, relative_path: Union[str, PurePath], is_dir: bool = False) -> bool:
+        """Check whether a path relative to the sync root is excluded."""
+        if not self._rules:
+            return False
+
+        path = relative_path if isinstance(relative_path, str) else relative_path.as_posix()
+
+        if self._combined:
+            regex = self._combined[1] if is_dir else self._combined[0]
+            return regex.match(path) is not None
+
+        for file_regex, dir_regex, negated in reversed(self._rules):
+            regex = dir_regex if is_dir else file_regex
+            if regex.match(path):
+                return not negated
+        return False
+
+    def walk(self, root: Path, suffix: Optional[str] = None) -> Iterator[Tuple[Path, Path]]:
+        """Yield ``(absolute_path, relative_path)`` for every non-excluded file.
+
+        Excluded directories are pruned, so their contents are never listed.
+        Symlinked directories are not followed.
+        """
+        stack = [(str(root), '')]
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in sorted(entries, key=lambda e: e.name):
+                rel = rel_prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self.matches(rel, is_dir=True):
+                            subdirs.append((entry.path, rel + '/'))
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                if suffix and not entry.name.endswith(suffix):
+                    continue
+                if self.matches(rel):
+                    continue
+                yield Path(entry.path), Path(rel)
+
+            stack.extend(reversed(subdirs))
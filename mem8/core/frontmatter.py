@@ -0,0 +1,78 @@
+"""Fast YAML loading for frontmatter and mem8's own YAML files.
+
+Uses libyaml's ``CSafeLoader`` when PyYAML was built with it, and falls back
+to the pure-Python ``SafeLoader`` otherwise; results are the same.
+
+Frontmatter goes through :func:`parse_frontmatter`, which adds two shortcuts:
+headers made only of ``key: plain text`` lines are split directly, and parsed
+headers are cached by their text, so identical headers (common for generated
+research docs) are parsed once.
+"""
+
+import copy
+import datetime
+from functools import lru_cache
+from typing import Any
+
+import yaml
+
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+FRONTMATTER_CACHE_SIZE = 4096
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+_resolver = yaml.resolver.Resolver()
+# Characters that give a plain scalar special meaning when they come first
+_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+_IMMUTABLE = (str, int, float, bool, type(None), datetime.date)
+
+
+def safe_load(stream: Any) -> Any:
+    """``yaml.safe_load`` using the libyaml loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _plain_string(text: str) -> bool:
+    """Whether YAML reads ``text`` as an unquoted string, unchanged."""
+    return (
+        text.isprintable()
+        and text[0] not in _INDICATORS
+        and text == text.strip()
+        and ': ' not in text
+        and ' #' not in text
+        and not text.endswith(':')
+        and _resolver.resolve(yaml.ScalarNode, text, (True, False)) == _STR_TAG
+    )
+
+
+def _parse_simple(text: str) -> Any:
+    """Parse frontmatter made only of ``key: plain text`` lines; None if it is anything else."""
+    result = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        key, sep, value = line.partition(': ')
+        if not sep or not key or not value or not _plain_string(key) or not _plain_string(value):
+            return None
+        result[key] = value
+    return result or None
+
+
+@lru_cache(maxsize=FRONTMATTER_CACHE_SIZE)
+def _parse(text: str) -> Any:
+    simple = _parse_simple(text)
+    if simple is not None:
+        return simple
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def parse_frontmatter(text: str) -> Any:
+    """Parse the YAML of a frontmatter block, like ``yaml.safe_load``.
+
+    Raises ``yaml.YAMLError`` for invalid YAML. Callers get their own copy
+    of cached results and may modify it.
+    """
+    result = _parse(text)
+    if isinstance(result, dict) and all(isinstance(value, _IMMUTABLE) for value in result.values()):
+        return dict(result)
+    return copy.deepcopy(result)
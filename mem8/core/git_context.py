@@ -0,0 +1,204 @@
+"""Git repository facts for the current working directory, with few git processes.
+
+Branch and HEAD commit come straight from ``.git`` (``HEAD``, loose refs and
+``packed-refs``), worktrees included. Commit history facts (last commit
+date, commit count, contributors, first commit) come from one ``git log``
+pass, made only when asked for. Working-tree cleanliness still needs
+``git status``.
+
+:func:`git_context` memoizes the context per repository until ``HEAD``,
+the index, ``packed-refs`` or the current branch's ref changes, so commands
+that ask for git details from several places share one lookup.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_contexts: Dict[str, Tuple[tuple, 'GitContext']] = {}
+
+
+def _git(args: List[str], cwd: Path) -> Optional[str]:
+    """Output of a git command, or None if git is missing or the command failed."""
+    try:
+        result = subprocess.run(['git', *args], capture_output=True, text=True, encoding='utf-8',
+                                errors='replace', cwd=cwd, stdin=subprocess.DEVNULL)
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding='utf-8').strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def find_git_dir(start: Path) -> Optional[Tuple[Path, Path]]:
+    """``(worktree root, git dir)`` of the repository containing ``start``."""
+    for directory in (start, *start.parents):
+        dot_git = directory / '.git'
+        if dot_git.is_dir():
+            return directory, dot_git
+        if dot_git.is_file():
+            # Linked worktrees and submodules: ".git" names the real git dir
+            content = _read(dot_git) or ''
+            if content.startswith('gitdir:'):
+                git_dir = Path(content[len('gitdir:'):].strip())
+                return directory, (directory / git_dir).resolve()
+    return None
+
+
+class GitContext:
+    """Lazily computed facts about one git repository."""
+
+    def __init__(self, root: Path, git_dir: Path):
+        self.root = root
+        self.git_dir = git_dir
+        common = _read(git_dir / 'commondir')
+        self.common_dir = (git_dir / common).resolve() if common else git_dir
+        self._packed_refs: Optional[Dict[str, str]] = None
+        self._history: Optional[Dict[str, Any]] = None
+        self._last_commit_date: Optional[str] = None
+        self._head_ref, self._head_commit = self._read_head()
+
+    def _read_head(self) -> Tuple[Optional[str], Optional[str]]:
+        """``(symbolic ref, commit)`` of HEAD; either may be None."""
+        if (self.common_dir / 'reftable').is_dir():
+            # Refs are not plain files in reftable repositories; ask git
+            ref = (_git(['symbolic-ref', '-q', 'HEAD'], self.root) or '').strip()
+            commit = (_git(['rev-parse', '-q', '--verify', 'HEAD'], self.root) or '').strip()
+            return ref or None, commit or None
+
+        head = _read(self.git_dir / 'HEAD') or ''
+        if not head.startswith('ref:'):
+            return None, head or None  # Detached
+        ref = head[len('ref:'):].strip()
+        for _ in range(5):  # Follow symbolic refs
+            value = _read(self.git_dir / ref) or _read(self.common_dir / ref) or self.packed_refs().get(ref)
+            if value and value.startswith('ref:'):
+                ref = value[len('ref:'):].strip()
+                continue
+            return ref, value
+        return ref, None
+
+    def packed_refs(self) -> Dict[str, str]:
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            for line in (_read(self.common_dir / 'packed-refs') or '').splitlines():
+                if line and line[0] not in '#^':
+                    sha, _, name = line.partition(' ')
+                    self._packed_refs[name] = sha
+        return self._packed_refs
+
+    def stamp(self) -> tuple:
+        """Changes whenever HEAD, the index or the refs behind HEAD change."""
+        paths = [self.git_dir / 'HEAD', self.git_dir / 'index', self.common_dir / 'packed-refs']
+        if self._head_ref:
+            paths.append(self.common_dir / self._head_ref)
+        return tuple(_mtime(path) for path in paths)
+
+    @property
+    def branch(self) -> str:
+        """Current branch name; empty when HEAD is detached (like ``git branch --show-current``)."""
+        if self._head_ref and self._head_ref.startswith('refs/heads/'):
+            return self._head_ref[len('refs/heads/'):]
+        return ''
+
+    @property
+    def head_commit(self) -> Optional[str]:
+        """Full hash of HEAD; None on a branch without commits."""
+        return self._head_commit
+
+    @property
+    def last_commit_date(self) -> Optional[str]:
+        """Committer date of HEAD (``%ci``)."""
+        if self._history is not None:
+            return self._history['last_commit_date']
+        if self._last_commit_date is None and self._head_commit:
+            output = _git(['log', '-1', '--format=%ci'], self.root)
+            self._last_commit_date = output.strip() if output else None
+        return self._last_commit_date
+
+    def history(self) -> Dict[str, Any]:
+        """Commit count and first commit date of HEAD, and contributors on all refs.
+
+        Read from a single ``git log --all``; commits reachable from HEAD are
+        found by walking parent links.
+        """
+        if self._history is not None:
+            return self._history
+        history = {'total_commits': 0, 'contributors': 0, 'first_commit': None, 'last_commit_date': None}
+        output = _git(['log', '--all', '--format=%H%x1f%P%x1f%ci%x1f%aN'], self.root) if self._head_commit else None
+        if output:
+            commits = {}
+            authors = set()
+            for line in output.splitlines():
+                sha, parents, date, author = line.split('\x1f')
+                commits[sha] = (parents.split(), date)
+                authors.add(author)
+
+            reachable, stack = set(), [self._head_commit]
+            while stack:
+                sha = stack.pop()
+                if sha in reachable or sha not in commits:
+                    continue
+                reachable.add(sha)
+                stack.extend(commits[sha][0])
+
+            dates = [commits[sha][1] for sha in reachable]
+            history.update(
+                total_commits=len(reachable),
+                contributors=len(authors),
+                # %ci strings share a timezone-suffixed format; compare parsed instants
+                first_commit=min(dates, key=_commit_instant) if dates else None,
+                last_commit_date=commits.get(self._head_commit, (None, None))[1],
+            )
+        self._history = history
+        return history
+
+    def is_clean(self) -> bool:
+        """Whether ``git status`` reports nothing; checked on every call."""
+        output = _git(['status', '--porcelain'], self.root)
+        return not (output or '').strip()
+
+
+def _commit_instant(date: str):
+    import datetime
+
+    return datetime.datetime.strptime(date, '%Y-%m-%d %H:%M:%S %z')
+
+
+def git_context(path: Optional[Path] = None) -> Optional[GitContext]:
+    """Git context of the repository containing ``path`` (default: cwd), or None."""
+    start = Path(path or Path.cwd()).resolve()
+    if 'GIT_DIR' in os.environ or 'GIT_WORK_TREE' in os.environ:
+        # Let git resolve overridden locations
+        toplevel = _git(['rev-parse', '--show-toplevel', '--absolute-git-dir'], start)
+        if not toplevel:
+            return None
+        root, git_dir = toplevel.splitlines()[:2]
+        found = (Path(root), Path(git_dir))
+    else:
+        found = find_git_dir(start)
+        if not found or not (found[1] / 'HEAD').is_file():
+            return None
+
+    key = str(found[0])
+    cached = _contexts.get(key)
+    if cached:
+        stamp, context = cached
+        if context.git_dir == found[1] and context.stamp() == stamp:
+            return context
+    context = GitContext(*found)
+    _contexts[key] = (context.stamp(), context)
+    return context
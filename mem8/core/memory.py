@@ -20,6 +20,21 @@ from .utils import (
 from .thought_entity import ThoughtEntity
 from .thought_discovery import ThoughtDiscoveryService
 
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Loading a model takes seconds; keep it for the life of the process
+_embedding_models: Dict[str, Any] = {}
+
+
+def _get_embedding_model(name: str = EMBEDDING_MODEL):
+    """Load (once) and return a sentence-transformers model."""
+    model = _embedding_models.get(name)
+    if model is None:
+        from sentence_transformers import SentenceTransformer
+
+        model = _embedding_models[name] = SentenceTransformer(name)
+    return model
+
 
 class MemoryManager:
     """Manages AI memory workspace and shared memory integration."""
@@ -28,6 +43,9 @@ class MemoryManager:
         """Initialize memory manager."""
         self.config = config
         self.thought_discovery = ThoughtDiscoveryService(config)
+        # path -> ((mtime, size), content, embedding); lets a long-lived
+        # process (the daemon) skip rereading and re-embedding unchanged files
+        self._file_cache: Dict[str, tuple] = {}
     
     def initialize_workspace(
         self, 
@@ -434,6 +452,8 @@ Use `mem8 search` to find relevant content across all memories.
                 else:
                     matches = self._search_file(memory_file, query, 'memory')
                 results.extend(matches)
+            if not path_filter:
+                self._forget_files({str(path) for path in memory_files}, memory_dir, inside=False)
         
         # Sort by relevance (simplified scoring)
         results.sort(key=lambda x: x['score'], reverse=True)
@@ -449,38 +469,40 @@ Use `mem8 search` to find relevant content across all memories.
         """Search files in a directory."""
         results = []
         query_lower = query.lower()
+        walked = set()
 
         for file_path in directory.rglob("*.md"):
             if file_path.is_file():
+                walked.add(str(file_path))
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        content_lower = content.lower()
-
-                        if query_lower in content_lower:
-                            # Simple scoring based on frequency and position
-                            score = content_lower.count(query_lower)
-                            if content_lower.startswith(query_lower):
-                                score += 5
-
-                            # Get title from first line or filename
-                            lines = content.strip().split('\n')
-                            title = lines[0].strip('# ') if lines and lines[0].startswith('#') else file_path.stem
-
-                            # Extract context snippet around first match
-                            snippet = self._extract_context_snippet(content, query, lines_before=2, lines_after=2)
-
-                            results.append({
-                                'type': content_type,
-                                'title': title,
-                                'path': str(file_path),
-                                'score': score,
-                                'snippet': snippet,
-                                'match_count': score,
-                            })
+                    content = self._read_file(file_path)
                 except (IOError, UnicodeDecodeError):
                     continue
-
+                content_lower = content.lower()
+
+                if query_lower in content_lower:
+                    # Simple scoring based on frequency and position
+                    score = content_lower.count(query_lower)
+                    if content_lower.startswith(query_lower):
+                        score += 5
+
+                    # Get title from first line or filename
+                    lines = content.strip().split('\n')
+                    title = lines[0].strip('# ') if lines and lines[0].startswith('#') else file_path.stem
+
+                    # Extract context snippet around first match
+                    snippet = self._extract_context_snippet(content, query, lines_before=2, lines_after=2)
+
+                    results.append({
+                        'type': content_type,
+                        'title': title,
+                        'path': str(file_path),
+                        'score': score,
+                        'snippet': snippet,
+                        'match_count': score,
+                    })
+
+        self._forget_files(walked, directory)
         return results
     
     def _extract_context_snippet(self, content: str, query: str, lines_before: int = 2, lines_after: int = 2, max_line_length: int = 100) -> str:
@@ -516,18 +538,44 @@ Use `mem8 search` to find relevant content across all memories.
 
         return "\n".join(context_lines)
 
+    def _read_file(self, file_path: Path) -> str:
+        """Contents of ``file_path``, reread only when its mtime or size changed."""
+        stat = file_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = str(file_path)
+        cached = self._file_cache.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        content = file_path.read_text(encoding='utf-8')
+        self._file_cache[key] = (stamp, content, None)
+        return content
+
+    def _forget_files(self, walked: set, directory: Path, inside: bool = True) -> None:
+        """Drop cached files that a walk of ``directory`` (or of everything outside it) no longer found."""
+        prefix = os.path.join(str(directory), '')
+        for key in [key for key in self._file_cache if key not in walked and key.startswith(prefix) == inside]:
+            del self._file_cache[key]
+
+    def _file_embedding(self, file_path: Path, model):
+        """Embedding of a file's first 2000 characters, cached with its contents."""
+        content = self._read_file(file_path)
+        stamp, _, embedding = self._file_cache[str(file_path)]
+        if embedding is None:
+            embedding = model.encode(content[:2000])  # Limit content for performance
+            self._file_cache[str(file_path)] = (stamp, content, embedding)
+        return embedding
+
     def _search_file(self, file_path: Path, query: str, content_type: str) -> List[Dict[str, Any]]:
         """Search a single file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_file(file_path)
 
             if query.lower() in content.lower():
                 snippet = self._extract_context_snippet(content, query, lines_before=2, lines_after=2)
                 return [{
                     'type': content_type,
                     'title': f"Memory: {file_path.name}",
-                    'path': file_path,
+                    'path': str(file_path),
                     'score': content.lower().count(query.lower()),
                     'snippet': snippet,
                     'match_count': content.lower().count(query.lower()),
@@ -540,21 +588,19 @@ Use `mem8 search` to find relevant content across all memories.
     def _semantic_search_directory(self, directory: Path, query: str, content_type: str) -> List[Dict[str, Any]]:
         """Semantic search files in a directory using sentence transformers."""
         try:
-            from sentence_transformers import SentenceTransformer
             import numpy as np
             
-            model = SentenceTransformer('all-MiniLM-L6-v2')
+            model = _get_embedding_model()
             query_embedding = model.encode(query)
             
             results = []
+            walked = set()
             for file_path in directory.rglob("*.md"):
                 if file_path.is_file():
+                    walked.add(str(file_path))
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        # Get content embedding
-                        content_embedding = model.encode(content[:2000])  # Limit content for performance
+                        content = self._read_file(file_path)
+                        content_embedding = self._file_embedding(file_path, model)
                         
                         # Calculate similarity
                         similarity = np.dot(query_embedding, content_embedding) / (
@@ -574,6 +620,7 @@ Use `mem8 search` to find relevant content across all memories.
                     except (IOError, UnicodeDecodeError):
                         continue
             
+            self._forget_files(walked, directory)
             return results
             
         except ImportError:
@@ -583,16 +630,12 @@ Use `mem8 search` to find relevant content across all memories.
     def _semantic_search_file(self, file_path: Path, query: str, content_type: str) -> List[Dict[str, Any]]:
         """Semantic search a single file."""
         try:
-            from sentence_transformers import SentenceTransformer
             import numpy as np
             
-            model = SentenceTransformer('all-MiniLM-L6-v2')
+            model = _get_embedding_model()
             query_embedding = model.encode(query)
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            content_embedding = model.encode(content[:2000])
+            content_embedding = self._file_embedding(file_path, model)
             similarity = np.dot(query_embedding, content_embedding) / (
                 np.linalg.norm(query_embedding) * np.linalg.norm(content_embedding)
             )
@@ -617,31 +660,28 @@ Use `mem8 search` to find relevant content across all memories.
 
     def _get_command_version(self, command: str) -> Optional[str]:
         """Get the version of a command if available."""
-        import subprocess
+        return self._get_command_versions([command])[command]
+
+    def _get_command_versions(self, commands: List[str]) -> Dict[str, Optional[str]]:
+        """Get the versions of several commands, probing them concurrently."""
         import re
+        from .toolbelt import probe_commands
 
-        try:
-            # Try common version flags
-            for flag in ['--version', '-v', 'version']:
-                try:
-                    result = subprocess.run(
-                        [command, flag],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    output = result.stdout + result.stderr
-
-                    # Extract version number (e.g., "2.60.1", "v1.2.3")
-                    version_match = re.search(r'v?(\d+\.\d+(?:\.\d+)?)', output)
-                    if version_match:
-                        return version_match.group(1)
-                except (subprocess.TimeoutExpired, FileNotFoundError):
+        versions: Dict[str, Optional[str]] = {command: None for command in commands}
+        # Try common version flags; each round only re-probes commands without a version yet
+        for flag in ['--version', '-v', 'version']:
+            remaining = [command for command, found in versions.items() if not found]
+            if not remaining:
+                break
+            results = probe_commands([[command, flag] for command in remaining], self.config.data_dir)
+            for command, result in zip(remaining, results):
+                if result is None:
                     continue
-        except Exception:
-            pass
-
-        return None
+                # Extract version number (e.g., "2.60.1", "v1.2.3")
+                version_match = re.search(r'v?(\d+\.\d+(?:\.\d+)?)', result.stdout + result.stderr)
+                if version_match:
+                    versions[command] = version_match.group(1)
+        return versions
 
     def _compare_versions(self, current: str, required: str) -> bool:
         """
@@ -815,6 +855,14 @@ Use `mem8 search` to find relevant content across all memories.
 
             platform_key = self._get_platform_key()
 
+            # Probe the versions of every available tool up front, all at once
+            versioned = {
+                tool.get('command', '')
+                for tool in toolbelt_data.get('required', []) + toolbelt_data.get('optional', [])
+                if tool.get('version') and self._check_command_available(tool.get('command', ''))
+            }
+            versions = self._get_command_versions(sorted(versioned))
+
             # Check required tools
             missing_required = []
             for tool in toolbelt_data.get('required', []):
@@ -825,7 +873,7 @@ Use `mem8 search` to find relevant content across all memories.
                 if is_available:
                     # Check version if required
                     if tool.get('version'):
-                        current_version = self._get_command_version(tool.get('command', ''))
+                        current_version = versions.get(tool.get('command', ''))
                         if current_version:
                             version_ok = self._compare_versions(current_version, tool.get('version', ''))
                         else:
@@ -870,7 +918,7 @@ Use `mem8 search` to find relevant content across all memories.
                 if is_available:
                     # Check version if specified
                     if tool.get('version'):
-                        current_version = self._get_command_version(tool.get('command', ''))
+                        current_version = versions.get(tool.get('command', ''))
                         if current_version:
                             version_ok = self._compare_versions(current_version, tool.get('version', ''))
                         else:
@@ -0,0 +1,205 @@
+"""Three-way merge helpers for synchronizing markdown memory files."""
+
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from .frontmatter import parse_frontmatter
+
+
+_MISSING = object()
+
+
+def split_frontmatter(text: str) -> Tuple[Optional[str], str]:
+    """Split a markdown document into raw YAML frontmatter and body.
+
+    Returns ``(None, text)`` when the document has no frontmatter block.
+    """
+    if not text.startswith('---'):
+        return None, text
+
+    end = text.find('\n---', 3)
+    if end == -1:
+        return None, text
+
+    body_start = text.find('\n', end + 4)
+    body = '' if body_start == -1 else text[body_start + 1:]
+    return text[4:end + 1], body
+
+
+def _change_hunks(base: List[str], other: List[str]) -> List[Tuple[int, int, List[str]]]:
+    """Return ``(base_start, base_end, replacement)`` for every change vs. base."""
+    matcher = SequenceMatcher(None, base, other, autojunk=False)
+    return [
+        (i1, i2, other[j1:j2])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != 'equal'
+    ]
+
+
+def _apply_hunks(
+    base: List[str], lo: int, hi: int, hunks: List[Tuple[int, int, List[str]]]
+) -> List[str]:
+    """Render base[lo:hi] with one side's hunks applied."""
+    result: List[str] = []
+    pos = lo
+    for i1, i2, lines in hunks:
+        result.extend(base[pos:i1])
+        result.extend(lines)
+        pos = i2
+    result.extend(base[pos:hi])
+    return result
+
+
+def merge_lines(base: List[str], ours: List[str], theirs: List[str]) -> Optional[List[str]]:
+    """Line-based three-way merge.
+
+    Changes from both sides are combined when they touch disjoint regions of
+    the base. Overlapping or adjacent edits that differ are treated as a
+    conflict and ``None`` is returned.
+    """
+    if ours == theirs:
+        return list(ours)
+    if ours == base:
+        return list(theirs)
+    if theirs == base:
+        return list(ours)
+
+    tagged = sorted(
+        [(h, 0) for h in _change_hunks(base, ours)]
+        + [(h, 1) for h in _change_hunks(base, theirs)],
+        key=lambda item: (item[0][0], item[0][1]),
+    )
+
+    # Group hunks whose base ranges overlap or touch
+    clusters: List[Dict[str, Any]] = []
+    for hunk, side in tagged:
+        i1, i2, _ = hunk
+        if clusters and i1 <= clusters[-1]['hi']:
+            cluster = clusters[-1]
+            cluster['hi'] = max(cluster['hi'], i2)
+        else:
+            cluster = {'lo': i1, 'hi': i2, 'sides': ([], [])}
+            clusters.append(cluster)
+        cluster['sides'][side].append(hunk)
+
+    merged: List[str] = []
+    pos = 0
+    for cluster in clusters:
+        lo, hi = cluster['lo'], cluster['hi']
+        ours_hunks, theirs_hunks = cluster['sides']
+        merged.extend(base[pos:lo])
+
+        if not theirs_hunks:
+            merged.extend(_apply_hunks(base, lo, hi, ours_hunks))
+        elif not ours_hunks:
+            merged.extend(_apply_hunks(base, lo, hi, theirs_hunks))
+        else:
+            ours_text = _apply_hunks(base, lo, hi, ours_hunks)
+            theirs_text = _apply_hunks(base, lo, hi, theirs_hunks)
+            if ours_text != theirs_text:
+                return None
+            merged.extend(ours_text)
+        pos = hi
+
+    merged.extend(base[pos:])
+    return merged
+
+
+def merge_frontmatter(
+    base: Dict[str, Any], ours: Dict[str, Any], theirs: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Key-wise three-way merge of frontmatter mappings.
+
+    A key changed (or removed) on only one side takes that side's value.
+    Returns ``None`` if both sides changed the same key differently.
+    """
+    merged: Dict[str, Any] = {}
+    keys = list(ours) + [k for k in theirs if k not in ours]
+    keys += [k for k in base if k not in ours and k not in theirs]
+
+    for key in keys:
+        b = base.get(key, _MISSING)
+        o = ours.get(key, _MISSING)
+        t = theirs.get(key, _MISSING)
+
+        if o == t:
+            value = o
+        elif o == b:
+            value = t
+        elif t == b:
+            value = o
+        else:
+            return None
+
+        if value is not _MISSING:
+            merged[key] = value
+
+    return merged
+
+
+def _load_mapping(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    if raw is None:
+        return {}
+    try:
+        data = parse_frontmatter(raw)
+    except yaml.YAMLError:
+        return None
+    if data is None:
+        return {}
+    return data if isinstance(data, dict) else None
+
+
+def three_way_merge(base: str, ours: str, theirs: str) -> Optional[str]:
+    """Merge two edited versions of a markdown document against their base.
+
+    Frontmatter is merged key by key and the body line by line. Returns the
+    merged document, or ``None`` if the edits overlap and need a human.
+    """
+    if ours == theirs:
+        return ours
+
+    base_fm, base_body = split_frontmatter(base)
+    ours_fm, ours_body = split_frontmatter(ours)
+    theirs_fm, theirs_body = split_frontmatter(theirs)
+
+    base_meta = _load_mapping(base_fm)
+    ours_meta = _load_mapping(ours_fm)
+    theirs_meta = _load_mapping(theirs_fm)
+
+    if base_meta is None or ours_meta is None or theirs_meta is None:
+        # Unparseable frontmatter - fall back to merging the whole text
+        merged = merge_lines(
+            base.splitlines(keepends=True),
+            ours.splitlines(keepends=True),
+            theirs.splitlines(keepends=True),
+        )
+        return ''.join(merged) if merged is not None else None
+
+    merged_body = merge_lines(
+        base_body.splitlines(keepends=True),
+        ours_body.splitlines(keepends=True),
+        theirs_body.splitlines(keepends=True),
+    )
+    if merged_body is None:
+        return None
+
+    merged_meta = merge_frontmatter(base_meta, ours_meta, theirs_meta)
+    if merged_meta is None:
+        return None
+
+    # Keep the original formatting when one side's frontmatter wins outright
+    if merged_meta == ours_meta:
+        frontmatter = ours_fm
+    elif merged_meta == theirs_meta:
+        frontmatter = theirs_fm
+    else:
+        frontmatter = yaml.safe_dump(
+            merged_meta, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
+
+    body = ''.join(merged_body)
+    if frontmatter is None:
+        return body
+    return f"---\n{frontmatter}---\n{body}"
@@ -7,32 +7,19 @@ from typing import Dict, Any, Optional
 
 def get_git_metadata() -> Dict[str, Any]:
     """Get current git repository metadata."""
-    from .utils import get_git_info
-    
-    git_info = get_git_info()
-    
-    if not git_info['is_git_repo']:
+    from .git_context import git_context
+
+    context = git_context()
+    if context is None:
         raise ValueError("Not in a git repository")
-    
-    # Get current commit hash
-    commit_result = subprocess.run(
-        ["git", "rev-parse", "HEAD"], 
-        capture_output=True, text=True
-    )
-    
-    # Get commit timestamp
-    timestamp_result = subprocess.run(
-        ["git", "log", "-1", "--format=%ci"],
-        capture_output=True, text=True
-    )
-    
+
     return {
-        "git_commit": commit_result.stdout.strip() if commit_result.returncode == 0 else "unknown",
-        "branch": git_info['current_branch'],
-        "repository": git_info['repo_root'].name,
-        "repo_path": str(git_info['repo_root']),
-        "is_clean": _check_git_status(),
-        "last_commit_date": timestamp_result.stdout.strip() if timestamp_result.returncode == 0 else None
+        "git_commit": context.head_commit or "unknown",
+        "branch": context.branch,
+        "repository": context.root.name,
+        "repo_path": str(context.root),
+        "is_clean": context.is_clean(),
+        "last_commit_date": context.last_commit_date,
     }
 
 
@@ -69,15 +56,14 @@ def generate_research_metadata(topic: str, researcher: Optional[str] = None) ->
 
 def generate_project_metadata() -> Dict[str, Any]:
     """Generate metadata about the current project context."""
+    # Statistics first: the history pass they read also supplies the last commit date
+    stats = _get_repository_stats()
     git_metadata = get_git_metadata()
     current_time = datetime.datetime.now().astimezone()
     
     # Detect project type based on files
     project_type = _detect_project_type()
     
-    # Get repository statistics
-    stats = _get_repository_stats()
-    
     return {
         "timestamp": current_time.isoformat(),
         "project_type": project_type,
@@ -105,16 +91,6 @@ def format_frontmatter(metadata: Dict[str, Any]) -> str:
     return f"---\n{yaml_content}---\n"
 
 
-def _check_git_status() -> bool:
-    """Check if git working directory is clean."""
-    status_result = subprocess.run(
-        ["git", "status", "--porcelain"], 
-        capture_output=True, text=True
-    )
-    
-    return len(status_result.stdout.strip()) == 0
-
-
 def _detect_project_type() -> str:
     """Detect the type of project based on files present."""
     current_dir = Path.cwd()
@@ -139,39 +115,15 @@ def _detect_project_type() -> str:
 
 def _get_repository_stats() -> Dict[str, Any]:
     """Get basic repository statistics."""
-    try:
-        # Count commits
-        commit_count_result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD"],
-            capture_output=True, text=True
-        )
-        commit_count = int(commit_count_result.stdout.strip()) if commit_count_result.returncode == 0 else 0
-        
-        # Count contributors
-        contributors_result = subprocess.run(
-            ["git", "shortlog", "-sn", "--all"],
-            capture_output=True, text=True
-        )
-        contributor_count = len(contributors_result.stdout.strip().split('\n')) if contributors_result.returncode == 0 and contributors_result.stdout.strip() else 0
-        
-        # Get repository age (first commit date)
-        first_commit_result = subprocess.run(
-            ["git", "log", "--reverse", "--format=%ci", "-1"],
-            capture_output=True, text=True
-        )
-        first_commit_date = first_commit_result.stdout.strip() if first_commit_result.returncode == 0 else None
-        
-        return {
-            "total_commits": commit_count,
-            "contributors": contributor_count,
-            "first_commit": first_commit_date
-        }
-    except Exception:
-        return {
-            "total_commits": 0,
-            "contributors": 0,
-            "first_commit": None
-        }
+    from .git_context import git_context
+
+    context = git_context()
+    history = context.history() if context else {}
+    return {
+        "total_commits": history.get("total_commits", 0),
+        "contributors": history.get("contributors", 0),
+        "first_commit": history.get("first_commit"),
+    }
 
 
 def generate_filename_timestamp() -> str:
@@ -1,11 +1,57 @@
 """Port management and leasing system for mem8."""
 
+import os
 import socket
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import accumulate
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 import yaml
-import psutil
+
+from .frontmatter import safe_load
+
+# A lease as an inclusive port interval: (start_port, end_port, project_id)
+Interval = Tuple[int, int, str]
+
+
+class LeaseIndex:
+    """Port leases as sorted intervals, without expanding them into single ports.
+
+    Intervals are sorted by start port alongside a running maximum of end
+    ports, so finding the lease that covers a port is a binary search that
+    stops as soon as no earlier lease can reach it.
+    """
+
+    def __init__(self, leases: Dict[str, Dict[str, Any]]):
+        self.intervals: List[Interval] = sorted(
+            (lease['start_port'], lease['start_port'] + lease['port_count'] - 1, project_id)
+            for project_id, lease in leases.items()
+            if lease.get('start_port') and lease.get('port_count')
+        )
+        self._starts = [interval[0] for interval in self.intervals]
+        self._max_ends = list(accumulate((interval[1] for interval in self.intervals), max))
+
+    def covering(self, port: int, exclude: Optional[str] = None) -> Optional[Interval]:
+        """A lease containing ``port`` that is not held by project ``exclude``."""
+        i = bisect_right(self._starts, port) - 1
+        while i >= 0 and self._max_ends[i] >= port:
+            interval = self.intervals[i]
+            if interval[1] >= port and interval[2] != exclude:
+                return interval
+            i -= 1
+        return None
+
+    def overlaps(self) -> List[Tuple[Interval, Interval]]:
+        """Every pair of leases that share at least one port, by sweeping start ports."""
+        pairs = []
+        active: List[Interval] = []
+        for interval in self.intervals:
+            active = [other for other in active if other[1] >= interval[0]]
+            pairs.extend((other, interval) for other in active)
+            active.append(interval)
+        return pairs
 
 
 class PortManager:
@@ -39,19 +85,60 @@ class PortManager:
 
         try:
             with open(self.registry_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {'leases': {}, 'last_updated': datetime.now().isoformat()}
+                return safe_load(f) or {'leases': {}, 'last_updated': datetime.now().isoformat()}
         except (yaml.YAMLError, IOError):
             return {'leases': {}, 'last_updated': datetime.now().isoformat()}
 
     def _save_registry(self) -> None:
-        """Save global port registry."""
+        """Save global port registry.
+
+        The file is replaced atomically, so readers never see a partial write.
+        """
         self.leases['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        tmp_file = self.registry_file.with_name(f"{self.registry_file.name}.{os.getpid()}.tmp")
         try:
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 yaml.dump(self.leases, f, default_flow_style=False, sort_keys=False)
+            os.replace(tmp_file, self.registry_file)
         except (yaml.YAMLError, IOError) as e:
             print(f"Warning: Could not save port registry: {e}")
 
+    @contextmanager
+    def _locked_registry(self) -> Iterator[None]:
+        """Hold an exclusive lock on the registry and reload it for a read-modify-write.
+
+        Other mem8 processes block here until the lock is released, so
+        concurrent leases from parallel worktrees neither lose each other's
+        changes nor hand out the same ports.
+        """
+        lock_file = self.registry_file.with_name(self.registry_file.name + '.lock')
+        with open(lock_file, 'a+b') as lock:
+            _lock_file(lock)
+            try:
+                self.leases = self._load_registry()
+                self.leases.setdefault('leases', {})
+                yield
+            finally:
+                _unlock_file(lock)
+
+    def prune_stale_leases(self) -> List[Dict[str, Any]]:
+        """Release leases of projects whose directory was deleted; returns the released leases.
+
+        A lease is only stale when its project is gone but the parent
+        directory still exists, so projects on unmounted drives usually keep
+        theirs. A drive unmounted below a mount point that stays in place
+        looks deleted, which is why this only runs on explicit request.
+        """
+        stale = []
+        with self._locked_registry():
+            for project_id, lease in list(self.leases['leases'].items()):
+                project = Path(lease.get('project_path') or project_id)
+                if project.is_absolute() and not project.exists() and project.parent.exists():
+                    stale.append(self.leases['leases'].pop(project_id))
+            if stale:
+                self._save_registry()
+        return [self._enrich_lease(lease) for lease in stale]
+
     def get_project_id(self) -> str:
         """Get unique identifier for current project."""
         cwd = Path.cwd()
@@ -68,6 +155,22 @@ class PortManager:
         except socket.error:
             return False
 
+    def listening_ports(self) -> Optional[Set[int]]:
+        """Ports with a listening socket, from one snapshot of the system's connections.
+
+        Returns None when the system does not allow listing connections
+        (macOS without elevated privileges, for instance).
+        """
+        import psutil
+
+        try:
+            return {
+                conn.laddr.port for conn in psutil.net_connections(kind='inet')
+                if conn.laddr and conn.status == psutil.CONN_LISTEN
+            }
+        except (psutil.AccessDenied, PermissionError, OSError):
+            return None
+
     def find_available_ports(self, start: int, count: int, service_type: Optional[str] = None) -> List[int]:
         """Find available ports starting from a base port.
 
@@ -89,26 +192,29 @@ class PortManager:
             current = max(start, min_range)
             max_port = max_range
 
+        project_id = self.get_project_id()
+        index = self._lease_index()
+        listening = self.listening_ports()
+
         # Find available ports
         while len(available) < count and current <= max_port:
-            if self.is_port_available(current) and not self._is_port_leased_elsewhere(current):
+            leased = index.covering(current, exclude=project_id)
+            if leased:
+                current = leased[1] + 1  # Skip the rest of that lease
+                continue
+            in_use = current in listening if listening is not None else not self.is_port_available(current)
+            if not in_use:
                 available.append(current)
             current += 1
 
         return available
 
+    def _lease_index(self) -> LeaseIndex:
+        return LeaseIndex(self.leases.get('leases', {}))
+
     def _is_port_leased_elsewhere(self, port: int) -> bool:
         """Check if port is leased to another project."""
-        project_id = self.get_project_id()
-        for proj, lease in self.leases.get('leases', {}).items():
-            if proj != project_id:
-                start = lease.get('start_port')
-                count = lease.get('port_count')
-                if start and count:
-                    end = start + count - 1
-                    if start <= port <= end:
-                        return True
-        return False
+        return self._lease_index().covering(port, exclude=self.get_project_id()) is not None
 
     def lease_ports(self, start: Optional[int] = None, count: int = 5) -> Dict[str, Any]:
         """Lease ports for the current project.
@@ -123,28 +229,29 @@ class PortManager:
         project_id = self.get_project_id()
         project_name = Path.cwd().name
 
-        # Auto-assign starting port if not provided
-        if start is None:
-            start = self._find_best_starting_port(count)
+        with self._locked_registry():
+            # Auto-assign starting port if not provided
+            if start is None:
+                start = self._find_best_starting_port(count)
 
-        # Find available ports
-        available = self.find_available_ports(start, count)
+            # Find available ports
+            available = self.find_available_ports(start, count)
 
-        if len(available) < count:
-            raise ValueError(f"Could not find {count} available ports starting from {start}")
+            if len(available) < count:
+                raise ValueError(f"Could not find {count} available ports starting from {start}")
 
-        # Create lease - only store essential fields (end_port and port_range are calculated)
-        lease = {
-            'project_name': project_name,
-            'project_path': project_id,
-            'start_port': available[0],
-            'port_count': len(available),
-            'leased_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        }
+            # Create lease - only store essential fields (end_port and port_range are calculated)
+            lease = {
+                'project_name': project_name,
+                'project_path': project_id,
+                'start_port': available[0],
+                'port_count': len(available),
+                'leased_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
 
-        # Update registry
-        self.leases['leases'][project_id] = lease
-        self._save_registry()
+            # Update registry
+            self.leases['leases'][project_id] = lease
+            self._save_registry()
 
         # Return enriched lease with calculated fields
         return self._enrich_lease(lease)
@@ -174,11 +281,12 @@ class PortManager:
     def release_lease(self) -> bool:
         """Release current project's port lease."""
         project_id = self.get_project_id()
-        if project_id in self.leases.get('leases', {}):
+        with self._locked_registry():
+            if project_id not in self.leases['leases']:
+                return False
             del self.leases['leases'][project_id]
             self._save_registry()
-            return True
-        return False
+        return True
 
     def list_all_leases(self) -> Dict[str, Any]:
         """List all port leases across all projects with calculated fields."""
@@ -186,24 +294,22 @@ class PortManager:
         return {proj: self._enrich_lease(lease) for proj, lease in leases.items()}
 
     def check_conflicts(self) -> List[Dict[str, Any]]:
-        """Check for port conflicts across all leases."""
-        conflicts = []
-        all_ports = {}
-
-        for project_id, lease in self.leases.get('leases', {}).items():
-            start = lease.get('start_port')
-            count = lease.get('port_count')
-            if start and count:
-                for port in range(start, start + count):
-                    if port in all_ports:
-                        conflicts.append({
-                            'port': port,
-                            'project1': all_ports[port],
-                            'project2': project_id
-                        })
-                    else:
-                        all_ports[port] = project_id
+        """Check for port conflicts across all leases.
 
+        Returns one entry per pair of overlapping leases, with the shared
+        port range; ``port`` is the first shared port.
+        """
+        conflicts = []
+        for first, second in self._lease_index().overlaps():
+            start, end = second[0], min(first[1], second[1])
+            conflicts.append({
+                'port': start,
+                'start_port': start,
+                'end_port': end,
+                'port_range': f"{start}-{end}",
+                'project1': first[2],
+                'project2': second[2],
+            })
         return conflicts
 
     def is_port_in_project_range(self, port: int) -> bool:
@@ -234,6 +340,8 @@ class PortManager:
                 return False, "No port lease for this project. Use --force to kill anyway."
 
         # Find and kill process using psutil
+        import psutil
+
         try:
             for conn in psutil.net_connections(kind='inet'):
                 if conn.laddr.port == port and conn.status == 'LISTEN':
@@ -258,6 +366,31 @@ class PortManager:
             return False, f"Error: {e}"
 
 
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(f) -> None:
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # Retries for ~10s before raising
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def generate_ports_markdown(lease: Dict[str, Any]) -> str:
     """Generate ports.md content from lease information.
 
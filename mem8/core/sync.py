@@ -1,12 +1,17 @@
 """Synchronization functionality for mem8."""
 
+import json
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, List, Any
-import filecmp
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
 from .config import Config
+from .exclude import ExcludeMatcher
+from .merge import split_frontmatter, three_way_merge
+from .sync_manifest import SyncManifest, hash_file
+from .sync_transport import DEFAULT_CHUNK_SIZE, HttpSyncTransport, SyncTransportError
 from .utils import ensure_directory_exists
 
 
@@ -17,6 +22,10 @@ class SyncManager:
         """Initialize sync manager."""
         self.config = config
         self.sync_metadata_file = config.data_dir / "sync_metadata.json"
+        self._manifest: Optional[SyncManifest] = None
+        self._exclude_matcher: Optional[ExcludeMatcher] = None
+        # Files the last sync wrote, with the (mtime_ns, size) it left them at
+        self.written_files: Dict[Path, Tuple[int, int]] = {}
     
     def sync_memory(
         self, 
@@ -24,7 +33,11 @@ class SyncManager:
         dry_run: bool = False
     ) -> Dict[str, Any]:
         """Synchronize memory between local and shared locations."""
+        self.written_files = {}
         try:
+            if self.config.get('sync.transport', 'filesystem') == 'http':
+                return self._sync_http(direction, dry_run)
+            
             if not self.config.shared_dir or not self.config.shared_dir.exists():
                 return {
                     'success': False,
@@ -40,9 +53,12 @@ class SyncManager:
             if not shared_memory.exists():
                 ensure_directory_exists(shared_memory)
             
+            self._manifest = SyncManifest(self.config.data_dir, local_memory, shared_memory)
+            
             summary = {
                 'pulled': 0,
                 'pushed': 0,
+                'merged': 0,
                 'conflicts': 0,
                 'errors': 0,
             }
@@ -53,6 +69,7 @@ class SyncManager:
                     shared_memory, local_memory, 'pull', dry_run
                 )
                 summary['pulled'] = pull_result['count']
+                summary['merged'] += pull_result['merged']
                 summary['conflicts'] += pull_result['conflicts']
                 summary['errors'] += pull_result['errors']
             
@@ -61,11 +78,13 @@ class SyncManager:
                     local_memory, shared_memory, 'push', dry_run
                 )
                 summary['pushed'] = push_result['count']
+                summary['merged'] += push_result['merged']
                 summary['conflicts'] += push_result['conflicts']
                 summary['errors'] += push_result['errors']
             
             # Update sync metadata
             if not dry_run:
+                self._manifest.save()
                 self._update_sync_metadata()
             
             return {
@@ -80,6 +99,239 @@ class SyncManager:
                 'error': f"Sync failed: {e}"
             }
     
+    def _get_transport(
+        self, server_url: Optional[str] = None, team_id: Optional[str] = None
+    ) -> HttpSyncTransport:
+        """Build the HTTP transport from the ``sync.server_*`` settings."""
+        server_url = server_url or self.config.get('sync.server_url')
+        team_id = team_id or self.config.get('sync.team_id')
+        if not server_url or not team_id:
+            raise SyncTransportError(
+                "HTTP sync requires sync.server_url and sync.team_id to be configured"
+            )
+        
+        return HttpSyncTransport(
+            server_url,
+            team_id,
+            token=os.environ.get('MEM8_SYNC_TOKEN') or self.config.get('sync.token'),
+            chunk_size=self.config.get('sync.chunk_size', DEFAULT_CHUNK_SIZE),
+        )
+    
+    def _sync_http(self, direction: str, dry_run: bool) -> Dict[str, Any]:
+        """Synchronize memory with a mem8 API server.
+        
+        Local hashes are exchanged for the server's changed entries, so only
+        files that differ are transferred. Each side's change is judged
+        against the last-synced hash in the manifest, and conflicts follow
+        ``sync.conflict_resolution`` just like filesystem sync.
+        """
+        try:
+            transport = self._get_transport()
+        except SyncTransportError as e:
+            return {'success': False, 'error': str(e)}
+        
+        local_memory = self.config.memory_dir
+        if not local_memory.exists():
+            ensure_directory_exists(local_memory)
+        
+        self._manifest = manifest = SyncManifest(self.config.data_dir, local_memory, transport.remote_id)
+        pull = direction in ['pull', 'both']
+        push = direction in ['push', 'both']
+        conflict_resolution = self.config.get('sync.conflict_resolution', 'prompt')
+        
+        summary = {
+            'pulled': 0,
+            'pushed': 0,
+            'merged': 0,
+            'conflicts': 0,
+            'errors': 0,
+        }
+        
+        local_files: Dict[str, Path] = {}
+        local_hashes: Dict[str, str] = {}
+        for local_file, relative_path in self._get_exclude_matcher().walk(local_memory):
+            key = SyncManifest.key(relative_path)
+            local_files[key] = local_file
+            local_hashes[key] = self._file_hash(local_file, relative_path, 'local')
+        
+        exchange = transport.exchange_manifest(local_hashes)
+        changed: Dict[str, Dict[str, Any]] = exchange.get('changed', {})
+        
+        uploads: List[Dict[str, Any]] = []
+        pushed_data: Dict[str, bytes] = {}
+        
+        def queue_push(key: str, data: bytes, base_hash: Optional[str]) -> None:
+            if dry_run:
+                summary['pushed'] += 1
+                return
+            uploads.append(transport.upload(key, data, base_hash, local_files[key].stat().st_mtime))
+            pushed_data[key] = data
+        
+        def write_local(key: str, data: bytes, synced: bool = True) -> None:
+            local_file = local_files.get(key) or local_memory / key
+            if not dry_run:
+                ensure_directory_exists(local_file.parent)
+                if local_file.exists():
+                    self._backup_file(local_file)
+                local_file.write_bytes(data)
+                self._note_written(local_file)
+                if synced:
+                    self._record_synced(Path(key), data)
+        
+        # Files the server has never seen
+        missing = [key for key in exchange.get('missing', []) if key in local_files]
+        if push:
+            for key in missing:
+                try:
+                    queue_push(key, local_files[key].read_bytes(), None)
+                except Exception as e:
+                    summary['errors'] += 1
+                    print(f"Error syncing {key}: {e}")
+        
+        for key, entry in changed.items():
+            try:
+                relative_path = Path(key)
+                if relative_path.is_absolute() or '..' in relative_path.parts or self.is_excluded(relative_path):
+                    continue
+                
+                remote_hash = entry['hash']
+                local_hash = local_hashes.get(key)
+                base_hash = manifest.base_hash(relative_path)
+                
+                if local_hash is None:
+                    # New on the server
+                    if pull:
+                        write_local(key, transport.download(entry))
+                        summary['pulled'] += 1
+                elif remote_hash == base_hash:
+                    # Only the local copy changed
+                    if push:
+                        queue_push(key, local_files[key].read_bytes(), remote_hash)
+                elif local_hash == base_hash:
+                    # Only the server copy changed
+                    if pull:
+                        write_local(key, transport.download(entry))
+                        summary['pulled'] += 1
+                elif conflict_resolution == 'local' or (
+                    conflict_resolution == 'newest'
+                    and local_files[key].stat().st_mtime > (entry.get('mtime') or 0)
+                ):
+                    if push:
+                        queue_push(key, local_files[key].read_bytes(), remote_hash)
+                elif conflict_resolution in ('shared', 'newest'):
+                    if pull:
+                        write_local(key, transport.download(entry))
+                        summary['pulled'] += 1
+                else:  # 'prompt' or unknown
+                    local_data = local_files[key].read_bytes()
+                    remote_data = transport.download(entry)
+                    merged_data = self._merge_contents(relative_path, local_data, remote_data)
+                    if merged_data is None:
+                        summary['conflicts'] += 1
+                        continue
+                    if pull:
+                        # Record the server version as base so the merged push is not stale
+                        if not dry_run:
+                            manifest.record(relative_path, remote_data)
+                        write_local(key, merged_data, synced=False)
+                    if push:
+                        queue_push(key, merged_data, remote_hash)
+                        if not pull and key in pushed_data:
+                            # The local file keeps its content, so that is the base the
+                            # next sync compares against; it then pulls the merge
+                            pushed_data[key] = local_data
+                    summary['merged'] += 1
+            except Exception as e:
+                summary['errors'] += 1
+                print(f"Error syncing {key}: {e}")
+        
+        if not dry_run:
+            result = transport.commit(uploads)
+            for key in result.get('committed', []):
+                summary['pushed'] += 1
+                if key in pushed_data:
+                    self._record_synced(Path(key), pushed_data[key])
+            summary['conflicts'] += len(result.get('conflicts', []))
+        
+        # Unchanged files still need a merge base for future conflicts
+        if not dry_run:
+            skip = set(changed) | set(missing)
+            for key, local_hash in local_hashes.items():
+                if key not in skip and self._needs_base(Path(key), local_hash):
+                    self._record_synced(Path(key), local_files[key].read_bytes())
+            manifest.save()
+            self._update_sync_metadata()
+        
+        return {
+            'success': True,
+            'summary': summary,
+            'dry_run': dry_run,
+        }
+    
+    def import_to_server(
+        self,
+        dry_run: bool = False,
+        server_url: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Bulk-load every markdown file in memory into the server's thoughts.
+        
+        Files are streamed to the import endpoint one record at a time and
+        upserted by path, so re-running an import only writes what changed.
+        Unlike sync, nothing is pulled back or recorded in the manifest.
+        """
+        try:
+            transport = self._get_transport(server_url, team_id)
+        except SyncTransportError as e:
+            return {'success': False, 'error': str(e)}
+        
+        records = self._iter_import_records(self.config.memory_dir)
+        if dry_run:
+            return {'success': True, 'dry_run': True, 'files': sum(1 for _ in records)}
+        
+        try:
+            result = transport.import_thoughts(records)
+        except SyncTransportError as e:
+            return {'success': False, 'error': str(e)}
+        return {'success': True, 'dry_run': False, **result}
+    
+    def _iter_import_records(self, memory_dir: Path) -> Iterator[Dict[str, Any]]:
+        """Yield one import record per markdown file under ``memory_dir``."""
+        if not memory_dir.exists():
+            return
+        for file_path, relative_path in self._get_exclude_matcher().walk(memory_dir):
+            if file_path.suffix.lower() != '.md':
+                continue
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Skipping {relative_path}: {e}")
+                continue
+            
+            record: Dict[str, Any] = {'path': relative_path.as_posix(), 'content': content}
+            tags = self._frontmatter_tags(content)
+            if tags:
+                record['tags'] = tags
+            yield record
+    
+    @staticmethod
+    def _frontmatter_tags(content: str) -> List[str]:
+        """Tags listed in a document's YAML frontmatter, if any."""
+        frontmatter, _ = split_frontmatter(content)
+        if not frontmatter:
+            return []
+        try:
+            from .frontmatter import parse_frontmatter
+            metadata = parse_frontmatter(frontmatter)
+        except Exception:
+            return []
+        tags = metadata.get('tags') if isinstance(metadata, dict) else None
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(',')]
+        if not isinstance(tags, list):
+            return []
+        return [str(tag) for tag in tags if str(tag).strip()]
+    
     def _sync_direction(
         self, 
         source_dir: Path, 
@@ -89,39 +341,35 @@ class SyncManager:
     ) -> Dict[str, Any]:
         """Sync files in one direction."""
         count = 0
+        merged = 0
         conflicts = 0
         errors = 0
         
         try:
-            # Get exclude patterns
-            exclude_patterns = self.config.get('sync.exclude_patterns', [])
-            
-            # Walk through source directory
-            for source_file in source_dir.rglob("*"):
-                if source_file.is_file():
-                    # Check if file should be excluded
-                    relative_path = source_file.relative_to(source_dir)
-                    if self._should_exclude_file(relative_path, exclude_patterns):
-                        continue
-                    
-                    target_file = target_dir / relative_path
+            # Walk through source directory, skipping excluded subtrees
+            for source_file, relative_path in self._get_exclude_matcher().walk(source_dir):
+                target_file = target_dir / relative_path
+                
+                try:
+                    result = self._sync_file(
+                        source_file, target_file, direction, dry_run,
+                        relative_path=relative_path
+                    )
                     
-                    try:
-                        result = self._sync_file(
-                            source_file, target_file, direction, dry_run
-                        )
+                    if result['synced']:
+                        count += 1
+                    if result.get('merged'):
+                        merged += 1
+                    if result['conflict']:
+                        conflicts += 1
                         
-                        if result['synced']:
-                            count += 1
-                        if result['conflict']:
-                            conflicts += 1
-                            
-                    except Exception as e:
-                        errors += 1
-                        print(f"Error syncing {source_file}: {e}")
+                except Exception as e:
+                    errors += 1
+                    print(f"Error syncing {source_file}: {e}")
             
             return {
                 'count': count,
+                'merged': merged,
                 'conflicts': conflicts, 
                 'errors': errors,
             }
@@ -129,6 +377,7 @@ class SyncManager:
         except Exception:
             return {
                 'count': count,
+                'merged': merged,
                 'conflicts': conflicts,
                 'errors': errors + 1,
             }
@@ -138,10 +387,12 @@ class SyncManager:
         source_file: Path,
         target_file: Path,
         direction: str,
-        dry_run: bool
+        dry_run: bool,
+        relative_path: Optional[Path] = None
     ) -> Dict[str, Any]:
         """Sync a single file."""
         synced = False
+        merged = False
         conflict = False
         
         # Ensure target directory exists
@@ -152,64 +403,156 @@ class SyncManager:
             # Simple copy - no conflict
             if not dry_run:
                 shutil.copy2(source_file, target_file)
+                self._note_written(target_file)
+                self._record_synced(relative_path, source_file.read_bytes())
             synced = True
         else:
-            # File exists - check for conflicts
-            if not filecmp.cmp(source_file, target_file, shallow=False):
+            # File exists - compare cached hashes before touching the content
+            source_side, target_side = ('shared', 'local') if direction == 'pull' else ('local', 'shared')
+            source_hash = self._file_hash(source_file, relative_path, source_side)
+            target_hash = self._file_hash(target_file, relative_path, target_side)
+            
+            if source_hash == target_hash:
+                if not dry_run and self._needs_base(relative_path, source_hash):
+                    self._record_synced(relative_path, source_file.read_bytes())
+            else:
                 # Files are different - handle conflict
+                source_data = source_file.read_bytes()
+                target_data = target_file.read_bytes()
                 conflict_resolution = self.config.get('sync.conflict_resolution', 'prompt')
+                copy_source = False
                 
                 if conflict_resolution == 'newest':
                     source_mtime = source_file.stat().st_mtime
                     target_mtime = target_file.stat().st_mtime
                     
-                    if source_mtime > target_mtime:
-                        if not dry_run:
-                            self._backup_file(target_file)
-                            shutil.copy2(source_file, target_file)
-                        synced = True
-                    else:
-                        # Target is newer, don't sync
-                        pass
+                    # Only sync if the source is newer
+                    copy_source = source_mtime > target_mtime
                         
                 elif conflict_resolution == 'shared':
-                    if direction == 'pull':  # Prefer shared version
-                        if not dry_run:
-                            self._backup_file(target_file)
-                            shutil.copy2(source_file, target_file)
-                        synced = True
+                    copy_source = direction == 'pull'  # Prefer shared version
                         
                 elif conflict_resolution == 'local':
-                    if direction == 'push':  # Prefer local version
-                        if not dry_run:
-                            self._backup_file(target_file)
-                            shutil.copy2(source_file, target_file)
-                        synced = True
+                    copy_source = direction == 'push'  # Prefer local version
                         
                 else:  # 'prompt' or unknown
-                    # For CLI, we'll mark as conflict and let user handle
-                    conflict = True
+                    # Try an automatic three-way merge against the last-synced
+                    # version; only overlapping edits are left for the user
+                    if direction == 'pull':
+                        local_data, shared_data = target_data, source_data
+                    else:
+                        local_data, shared_data = source_data, target_data
+                    
+                    merged_data = self._merge_contents(relative_path, local_data, shared_data)
+                    if merged_data is not None:
+                        if not dry_run:
+                            self._write_merged(source_file, target_file, merged_data)
+                            self._record_synced(relative_path, merged_data)
+                        synced = True
+                        merged = True
+                    else:
+                        # For CLI, we'll mark as conflict and let user handle
+                        conflict = True
+                
+                if copy_source:
+                    if not dry_run:
+                        self._backup_file(target_file)
+                        shutil.copy2(source_file, target_file)
+                        self._note_written(target_file)
+                        self._record_synced(relative_path, source_data)
+                    synced = True
         
         return {
             'synced': synced,
+            'merged': merged,
             'conflict': conflict,
         }
     
-    def _should_exclude_file(self, relative_path: Path, exclude_patterns: List[str]) -> bool:
-        """Check if file should be excluded from sync."""
-        path_str = str(relative_path)
+    def _get_manifest(self) -> Optional[SyncManifest]:
+        """Get the sync manifest for the configured local/shared pair."""
+        if self._manifest is None and self.config.shared_dir:
+            self._manifest = SyncManifest(
+                self.config.data_dir,
+                self.config.memory_dir,
+                self.config.shared_dir / "memory"
+            )
+        return self._manifest
+    
+    def _file_hash(self, file_path: Path, relative_path: Optional[Path], side: str) -> str:
+        """Hash a file, reusing the manifest's cached hash if it is unchanged."""
+        if relative_path is None or self._get_manifest() is None:
+            return hash_file(file_path)
+        return self._hash_with_stat(file_path, file_path.stat(), relative_path, side)
+    
+    def _needs_base(self, relative_path: Optional[Path], digest: str) -> bool:
+        """Check whether the manifest's merge base is missing or outdated."""
+        manifest = self._get_manifest()
+        if relative_path is None or manifest is None:
+            return False
+        return manifest.base_hash(relative_path) != digest
+    
+    def _record_synced(self, relative_path: Optional[Path], data: bytes) -> None:
+        """Record content that is now identical on both sides."""
+        manifest = self._get_manifest()
+        if relative_path is None or manifest is None:
+            return
+        try:
+            manifest.record(relative_path, data)
+        except OSError:
+            pass  # Losing a merge base only disables auto-merge for this file
+    
+    def _merge_contents(
+        self,
+        relative_path: Optional[Path],
+        local_data: bytes,
+        shared_data: bytes
+    ) -> Optional[bytes]:
+        """Three-way merge local and shared content against the last-synced base.
         
-        for pattern in exclude_patterns:
-            if pattern in path_str or relative_path.name == pattern:
-                return True
-            
-            # Handle glob patterns (simplified)
-            if pattern.startswith('*.'):
-                extension = pattern[2:]
-                if path_str.endswith(extension):
-                    return True
+        Returns the merged bytes, or None if the file is not a markdown text
+        file, has no recorded base, or the edits overlap.
+        """
+        if relative_path is None or Path(relative_path).suffix.lower() != '.md':
+            return None
+        
+        manifest = self._get_manifest()
+        base_data = manifest.load_base(relative_path) if manifest else None
+        if base_data is None:
+            return None
+        
+        try:
+            merged = three_way_merge(
+                base_data.decode('utf-8'),
+                local_data.decode('utf-8'),
+                shared_data.decode('utf-8'),
+            )
+        except UnicodeDecodeError:
+            return None
         
-        return False
+        return merged.encode('utf-8') if merged is not None else None
+    
+    def _write_merged(self, first: Path, second: Path, data: bytes) -> None:
+        """Write merged content to both sides, backing up the originals."""
+        for file_path in (first, second):
+            self._backup_file(file_path)
+            file_path.write_bytes(data)
+            self._note_written(file_path)
+
+    def _note_written(self, file_path: Path) -> None:
+        """Remember how a sync left ``file_path``, so watchers can tell it from an edit."""
+        stat = file_path.stat()
+        self.written_files[file_path] = (stat.st_mtime_ns, stat.st_size)
+    
+    def is_excluded(self, relative_path: Path, is_dir: bool = False) -> bool:
+        """Check whether a path relative to the memory directory is excluded."""
+        return self._get_exclude_matcher().matches(relative_path, is_dir=is_dir)
+    
+    def _get_exclude_matcher(self) -> ExcludeMatcher:
+        """Get the compiled exclude matcher, recompiling if the patterns changed."""
+        patterns = tuple(self.config.get('sync.exclude_patterns', []) or [])
+        if self._exclude_matcher is None or self._exclude_matcher.patterns != patterns:
+            self._exclude_matcher = ExcludeMatcher(patterns)
+        return self._exclude_matcher
     
     def _backup_file(self, file_path: Path) -> None:
         """Create a backup of the file before overwriting."""
@@ -236,7 +579,6 @@ class SyncManager:
         }
         
         try:
-            import json
             with open(self.sync_metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, indent=2)
         except Exception:
@@ -245,7 +587,6 @@ class SyncManager:
     def _get_sync_count(self) -> int:
         """Get the current sync count."""
         try:
-            import json
             if self.sync_metadata_file.exists():
                 with open(self.sync_metadata_file, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
@@ -258,7 +599,6 @@ class SyncManager:
     def get_sync_status(self) -> Dict[str, Any]:
         """Get current synchronization status."""
         try:
-            import json
             if self.sync_metadata_file.exists():
                 with open(self.sync_metadata_file, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
@@ -283,47 +623,70 @@ class SyncManager:
             'has_synced': False,
         }
     
-    def detect_conflicts(self) -> List[Dict[str, Any]]:
-        """Detect sync conflicts that need manual resolution."""
-        conflicts = []
+    def iter_conflicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield sync conflicts that need manual resolution as they are found.
         
+        Files are compared by content hash; hashes of files whose size and
+        mtime are unchanged come from the sync manifest instead of being read.
+        """
         if not self.config.shared_dir or not self.config.shared_dir.exists():
-            return conflicts
+            return
         
         local_memory = self.config.memory_dir
         shared_memory = self.config.shared_dir / "memory"
         
         if not local_memory.exists() or not shared_memory.exists():
-            return conflicts
+            return
         
-        # Check for conflicting files
-        exclude_patterns = self.config.get('sync.exclude_patterns', [])
+        manifest = self._get_manifest()
         
-        for local_file in local_memory.rglob("*.md"):
-            if local_file.is_file():
-                relative_path = local_file.relative_to(local_memory)
+        try:
+            for local_file, relative_path in self._get_exclude_matcher().walk(local_memory, suffix=".md"):
+                shared_file = shared_memory / relative_path
                 
-                if self._should_exclude_file(relative_path, exclude_patterns):
+                try:
+                    shared_stat = shared_file.stat()
+                except OSError:
                     continue
                 
-                shared_file = shared_memory / relative_path
+                local_stat = local_file.stat()
+                local_hash = self._hash_with_stat(local_file, local_stat, relative_path, 'local')
+                shared_hash = self._hash_with_stat(shared_file, shared_stat, relative_path, 'shared')
                 
-                if shared_file.exists():
-                    if not filecmp.cmp(local_file, shared_file, shallow=False):
-                        # Files are different
-                        local_mtime = local_file.stat().st_mtime
-                        shared_mtime = shared_file.stat().st_mtime
-                        
-                        conflicts.append({
-                            'file': str(relative_path),
-                            'local_path': local_file,
-                            'shared_path': shared_file,
-                            'local_modified': datetime.fromtimestamp(local_mtime).isoformat(),
-                            'shared_modified': datetime.fromtimestamp(shared_mtime).isoformat(),
-                            'newer': 'local' if local_mtime > shared_mtime else 'shared',
-                        })
-        
-        return conflicts
+                if local_hash != shared_hash:
+                    # Files are different
+                    local_mtime = local_stat.st_mtime
+                    shared_mtime = shared_stat.st_mtime
+                    
+                    yield {
+                        'file': str(relative_path),
+                        'local_path': local_file,
+                        'shared_path': shared_file,
+                        'local_hash': local_hash,
+                        'shared_hash': shared_hash,
+                        'local_modified': datetime.fromtimestamp(local_mtime).isoformat(),
+                        'shared_modified': datetime.fromtimestamp(shared_mtime).isoformat(),
+                        'newer': 'local' if local_mtime > shared_mtime else 'shared',
+                    }
+        finally:
+            if manifest:
+                manifest.save()
+    
+    def detect_conflicts(self) -> List[Dict[str, Any]]:
+        """Detect sync conflicts that need manual resolution."""
+        return list(self.iter_conflicts())
+    
+    def _hash_with_stat(
+        self, file_path: Path, stat: os.stat_result, relative_path: Path, side: str
+    ) -> str:
+        """Hash a file whose stat is already known, using the manifest cache."""
+        manifest = self._get_manifest()
+        digest = manifest.cached_hash(relative_path, side, stat) if manifest else None
+        if digest is None:
+            digest = hash_file(file_path)
+            if manifest:
+                manifest.remember_hash(relative_path, side, stat, digest)
+        return digest
     
     def resolve_conflict(
         self, 
@@ -331,27 +694,129 @@ class SyncManager:
         resolution: str
     ) -> bool:
         """Resolve a specific conflict."""
+        result = self.resolve_conflicts([conflict], resolution)
+        return bool(result['resolved'])
+    
+    def resolve_conflicts(
+        self,
+        conflicts: Iterable[Dict[str, Any]],
+        resolution: str
+    ) -> Dict[str, Any]:
+        """Resolve a batch of conflicts in one pass.
+        
+        Every file about to be overwritten is first copied into a single
+        backup set, which is committed once at the end together with the
+        manifest. A conflict whose backup fails is left untouched.
+        
+        Resolutions: ``use_local``, ``use_shared``, ``use_newer``, ``merge``.
+        """
+        resolved: List[str] = []
+        failed: List[str] = []
+        
+        backup = BackupSet(
+            self.config.data_dir / "backups",
+            enabled=self.config.get('sync.backup_before_sync', True)
+        )
+        
+        for conflict in conflicts:
+            try:
+                ok = self._resolve_one(conflict, resolution, backup)
+            except Exception:
+                ok = False
+            (resolved if ok else failed).append(conflict['file'])
+        
+        backup_dir = None
         try:
-            local_path = Path(conflict['local_path'])
-            shared_path = Path(conflict['shared_path'])
-            
-            if resolution == 'use_local':
-                self._backup_file(shared_path)
-                shutil.copy2(local_path, shared_path)
-            elif resolution == 'use_shared':
-                self._backup_file(local_path)
-                shutil.copy2(shared_path, local_path)
-            elif resolution == 'use_newer':
-                if conflict['newer'] == 'local':
-                    self._backup_file(shared_path)
-                    shutil.copy2(local_path, shared_path)
-                else:
-                    self._backup_file(local_path)
-                    shutil.copy2(shared_path, local_path)
-            else:
+            backup_dir = backup.commit()
+        except OSError:
+            pass  # Backup index failed, but the files were already copied
+        
+        manifest = self._get_manifest()
+        if manifest:
+            manifest.save()
+        
+        return {
+            'resolved': resolved,
+            'failed': failed,
+            'backup_dir': backup_dir,
+        }
+    
+    def _resolve_one(
+        self,
+        conflict: Dict[str, Any],
+        resolution: str,
+        backup: 'BackupSet'
+    ) -> bool:
+        """Resolve one conflict, staging backups in ``backup``."""
+        local_path = Path(conflict['local_path'])
+        shared_path = Path(conflict['shared_path'])
+        relative_path = Path(conflict['file'])
+        
+        if resolution == 'use_newer':
+            resolution = 'use_local' if conflict['newer'] == 'local' else 'use_shared'
+        
+        if resolution == 'use_local':
+            data = local_path.read_bytes()
+            writes = [(shared_path, 'shared')]
+        elif resolution == 'use_shared':
+            data = shared_path.read_bytes()
+            writes = [(local_path, 'local')]
+        elif resolution == 'merge':
+            data = self._merge_contents(
+                relative_path, local_path.read_bytes(), shared_path.read_bytes()
+            )
+            if data is None:
                 return False
-            
-            return True
-            
-        except Exception:
-            return False
\ No newline at end of file
+            writes = [(local_path, 'local'), (shared_path, 'shared')]
+        else:
+            return False
+        
+        # Back up everything first so a failed backup leaves the files alone
+        for file_path, side in writes:
+            backup.add(file_path, side, relative_path)
+        for file_path, _ in writes:
+            file_path.write_bytes(data)
+        
+        self._record_synced(relative_path, data)
+        return True
+
+
+class BackupSet:
+    """Backups taken for one batch operation and committed together.
+    
+    Files are staged in a hidden directory and renamed into place as
+    ``backups/batch_<timestamp>/`` on commit, with an ``index.json`` listing
+    the original paths.
+    """
+    
+    def __init__(self, backup_root: Path, enabled: bool = True):
+        """Initialize an empty backup set under ``backup_root``."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.enabled = enabled
+        self.final_dir = backup_root / f"batch_{timestamp}"
+        self.staging_dir = backup_root / f".batch_{timestamp}.partial"
+        self.entries: List[Dict[str, str]] = []
+    
+    def add(self, file_path: Path, side: str, relative_path: Path) -> None:
+        """Stage a copy of ``file_path``; raises if the copy fails."""
+        if not self.enabled or not file_path.exists():
+            return
+        
+        backup_path = self.staging_dir / side / relative_path
+        ensure_directory_exists(backup_path.parent)
+        shutil.copy2(file_path, backup_path)
+        self.entries.append({
+            'side': side,
+            'file': Path(relative_path).as_posix(),
+            'original': str(file_path),
+        })
+    
+    def commit(self) -> Optional[Path]:
+        """Move the staged backups into place; returns the backup directory."""
+        if not self.entries:
+            return None
+        
+        with open(self.staging_dir / "index.json", 'w', encoding='utf-8') as f:
+            json.dump({'files': self.entries}, f, indent=2)
+        os.replace(self.staging_dir, self.final_dir)
+        return self.final_dir
@@ -0,0 +1,138 @@
+"""Sync manifest recording the last-synced state of memory files."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .utils import ensure_directory_exists
+
+
+# Files modified this recently may still change within the same mtime tick
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the SHA-256 hex digest used to address synced content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """Per-workspace manifest of synced files backed by a content-addressed store.
+
+    Every time a file is identical on both sides after a sync, its hash is
+    recorded and the content is kept under ``sync_objects/``. That last-synced
+    version is the common base for three-way merges on the next conflict.
+
+    The manifest also caches the content hash of each side keyed by
+    ``(size, mtime_ns)``, so unchanged files are compared without reading them.
+    """
+
+    def __init__(self, data_dir: Path, local_dir: Path, shared_dir: Union[Path, str]):
+        """Initialize the manifest for a local directory and its shared side.
+
+        ``shared_dir`` is either a directory or a string identifying a remote,
+        such as a sync server URL.
+        """
+        remote = shared_dir if isinstance(shared_dir, str) else Path(shared_dir).resolve()
+        pair = f"{Path(local_dir).resolve()}|{remote}"
+        manifest_id = hashlib.sha1(pair.encode('utf-8')).hexdigest()[:16]
+
+        self.manifest_file = data_dir / "sync_manifests" / f"{manifest_id}.json"
+        self.objects_dir = data_dir / "sync_objects"
+        self._files: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    @staticmethod
+    def key(relative_path: Path) -> str:
+        """Normalize a relative path into a manifest key."""
+        return Path(relative_path).as_posix()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            if self.manifest_file.exists():
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('files', {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def get(self, relative_path: Path) -> Optional[Dict[str, Any]]:
+        """Get the manifest entry for a file, if it has been synced before."""
+        return self._files.get(self.key(relative_path))
+
+    def record(self, relative_path: Path, data: bytes) -> str:
+        """Record ``data`` as the last-synced version of a file."""
+        digest = hash_bytes(data)
+        key = self.key(relative_path)
+
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            ensure_directory_exists(object_path.parent)
+            tmp_path = object_path.with_suffix('.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, object_path)
+
+        entry = self._files.setdefault(key, {})
+        if entry.get('hash') != digest:
+            entry.update({'hash': digest, 'size': len(data)})
+            self._dirty = True
+        return digest
+
+    def base_hash(self, relative_path: Path) -> Optional[str]:
+        """Get the hash of the last-synced version of a file."""
+        entry = self.get(relative_path)
+        return entry.get('hash') if entry else None
+
+    def cached_hash(self, relative_path: Path, side: str, stat: os.stat_result) -> Optional[str]:
+        """Get the cached hash of one side if the file is unchanged since hashing."""
+        entry = self.get(relative_path)
+        cached = entry.get('sides', {}).get(side) if entry else None
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        return None
+
+    def remember_hash(
+        self, relative_path: Path, side: str, stat: os.stat_result, digest: str
+    ) -> None:
+        """Cache the hash of one side for the given file stat."""
+        if time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS:
+            return  # Too fresh to trust the mtime
+        entry = self._files.setdefault(self.key(relative_path), {})
+        entry.setdefault('sides', {})[side] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._dirty = True
+
+    def load_base(self, relative_path: Path) -> Optional[bytes]:
+        """Load the last-synced content of a file, or None if unknown."""
+        entry = self.get(relative_path)
+        if not entry or 'hash' not in entry:
+            return None
+        try:
+            return self._object_path(entry['hash']).read_bytes()
+        except OSError:
+            return None
+
+    def save(self) -> None:
+        """Persist the manifest if it changed."""
+        if not self._dirty:
+            return
+        ensure_directory_exists(self.manifest_file.parent)
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'files': self._files}, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.manifest_file)
+        self._dirty = False
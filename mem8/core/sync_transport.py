@@ -0,0 +1,147 @@
+"""HTTP transport for syncing memory with a mem8 API server."""
+
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# 256 KiB keeps typical markdown files in a single chunk while letting large
+# attachments resume and deduplicate at a useful granularity
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+class SyncTransportError(Exception):
+    """Raised when the sync server rejects a request or is unreachable."""
+
+
+def split_chunks(data: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[bytes]:
+    """Split content into fixed-size chunks (an empty file has no chunks)."""
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+class HttpSyncTransport:
+    """Client for the ``/api/v1/sync/{team_id}/...`` file sync endpoints.
+
+    Only changed files are transferred, and of those only the chunks the
+    other side is missing. Chunks travel zlib-compressed.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        team_id: str,
+        token: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: float = 30.0,
+        session=None,
+    ):
+        """Initialize the transport for one team on one server."""
+        import requests
+
+        self.server_url = server_url.rstrip('/')
+        self.team_id = str(team_id)
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+        if token:
+            self.session.headers['Authorization'] = f"Bearer {token}"
+        else:
+            self.session.headers['X-Local-Mode'] = 'true'
+
+    @property
+    def remote_id(self) -> str:
+        """Stable identifier of the remote side, used to key the sync manifest."""
+        return f"{self.server_url}/teams/{self.team_id}"
+
+    def _url(self, suffix: str) -> str:
+        return f"{self.server_url}/api/v1/sync/{self.team_id}/{suffix}"
+
+    def _request(self, method: str, suffix: str, **kwargs):
+        return self._send(method, self._url(suffix), suffix, **kwargs)
+
+    def _send(self, method: str, url: str, label: str, **kwargs):
+        import requests
+
+        kwargs.setdefault('timeout', self.timeout)
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            raise SyncTransportError(f"Sync server unreachable: {e}") from e
+
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get('detail', response.text)
+            except ValueError:
+                detail = response.text
+            raise SyncTransportError(f"{method} {label} failed ({response.status_code}): {detail}")
+        return response
+
+    def exchange_manifest(self, files: Dict[str, str]) -> Dict[str, Any]:
+        """Send local ``{path: hash}``; returns server ``changed`` entries and ``missing`` paths."""
+        return self._request('POST', 'manifest', json={'files': files}).json()
+
+    def upload(self, path: str, data: bytes, base_hash: Optional[str], mtime: Optional[float] = None) -> Dict[str, Any]:
+        """Upload the chunks of ``data`` the server lacks; returns the entry to commit."""
+        chunks = split_chunks(data, self.chunk_size)
+        digests = [hashlib.sha256(chunk).hexdigest() for chunk in chunks]
+
+        if digests:
+            missing = set(self._request('POST', 'chunks/missing', json={'chunks': digests}).json()['missing'])
+            for digest, chunk in zip(digests, chunks):
+                if digest in missing:
+                    self._request(
+                        'PUT', f"chunks/{digest}",
+                        data=zlib.compress(chunk),
+                        headers={'Content-Type': 'application/zlib'},
+                    )
+                    missing.discard(digest)
+
+        return {
+            'path': path,
+            'hash': hashlib.sha256(data).hexdigest(),
+            'size': len(data),
+            'chunks': digests,
+            'mtime': mtime,
+            'base_hash': base_hash,
+        }
+
+    def commit(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Publish uploaded entries in one batch; stale ones come back as conflicts."""
+        if not entries:
+            return {'committed': [], 'conflicts': []}
+        return self._request('POST', 'commit', json={'files': entries}).json()
+
+    def download(self, entry: Dict[str, Any]) -> bytes:
+        """Fetch and verify the content of a server manifest entry."""
+        parts = []
+        for digest in entry.get('chunks', []):
+            chunk = zlib.decompress(self._request('GET', f"chunks/{digest}").content)
+            if hashlib.sha256(chunk).hexdigest() != digest:
+                raise SyncTransportError(f"Corrupt chunk {digest} for {entry['path']}")
+            parts.append(chunk)
+
+        data = b''.join(parts)
+        if hashlib.sha256(data).hexdigest() != entry['hash']:
+            raise SyncTransportError(f"Content hash mismatch for {entry['path']}")
+        return data
+
+    def import_thoughts(self, records: Iterable[Dict[str, Any]], timeout: float = 600.0) -> Dict[str, Any]:
+        """Stream thought records to the bulk import endpoint as NDJSON.
+
+        The body is sent with chunked encoding while ``records`` is still being
+        read, so memory use stays flat however large the tree is.
+        """
+        def lines() -> Iterator[bytes]:
+            for record in records:
+                yield json.dumps(record).encode('utf-8') + b'\n'
+
+        return self._send(
+            'POST',
+            f"{self.server_url}/api/v1/thoughts/import",
+            'thoughts/import',
+            params={'team_id': self.team_id},
+            data=lines(),
+            headers={'Content-Type': 'application/x-ndjson'},
+            timeout=timeout,
+        ).json()
@@ -0,0 +1,195 @@
+"""Continuous background synchronization for mem8."""
+
+import logging
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from .sync import SyncManager
+
+logger = logging.getLogger(__name__)
+
+
+class SyncWatcher:
+    """Keep local and shared memory in sync until stopped.
+
+    Local edits are picked up from filesystem events and pushed once the
+    burst settles for ``debounce`` seconds, so a save storm becomes a single
+    transfer. Events for files a sync itself wrote are ignored while the
+    file is still as the sync left it. The shared side is polled every ``workspace.sync_interval``
+    seconds with jitter, backing off exponentially while syncs fail.
+    """
+
+    def __init__(
+        self,
+        sync_manager: SyncManager,
+        direction: str = 'both',
+        interval: Optional[float] = None,
+        debounce: float = 2.0,
+        max_backoff: float = 3600.0,
+        jitter: float = 0.1,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the watcher around an existing sync manager."""
+        config = sync_manager.config
+        self.sync_manager = sync_manager
+        self.direction = direction
+        self.interval = float(interval or config.get('workspace.sync_interval', 300))
+        self.debounce = debounce
+        self.max_backoff = max(max_backoff, self.interval)
+        self.jitter = jitter
+        self.on_result = on_result
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._observer = None
+        self._failures = 0
+        self._local_dirty = False
+        self._last_local_event = 0.0
+        self._next_poll = 0.0
+        self._syncing = False
+        self._events_during_sync: Set[Path] = set()
+        self._written: Dict[Path, Tuple[int, int]] = {}
+
+    @property
+    def pushes_local_changes(self) -> bool:
+        """Whether local edits trigger an immediate push."""
+        return self.direction in ('push', 'both')
+
+    def notify_local_change(self, path: Optional[Path] = None) -> None:
+        """Record a local edit; the push is deferred until edits settle."""
+        with self._lock:
+            if path is not None:
+                if self._syncing:
+                    # Judged once the sync reports which files it wrote
+                    self._events_during_sync.add(path)
+                    return
+                if self._written_by_sync(path):
+                    return
+            self._local_dirty = True
+            self._last_local_event = self._clock()
+        self._wake.set()
+
+    def _written_by_sync(self, path: Path) -> bool:
+        """Whether ``path`` is still exactly as the last sync wrote it."""
+        stamp = self._written.get(path)
+        if stamp is None:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == stamp
+
+    def next_poll_delay(self) -> float:
+        """Seconds until the next poll, including backoff and jitter."""
+        delay = min(self.interval * (2 ** self._failures), self.max_backoff)
+        spread = delay * self.jitter
+        return max(1.0, delay + random.uniform(-spread, spread))
+
+    def step(self) -> float:
+        """Run any sync that is due and return seconds until the next one."""
+        now = self._clock()
+
+        with self._lock:
+            settled = self._local_dirty and now - self._last_local_event >= self.debounce
+            if settled:
+                self._local_dirty = False
+
+        if settled:
+            self._run_sync('push', 'local')
+            now = self._clock()
+
+        if now >= self._next_poll:
+            self._run_sync(self.direction, 'poll')
+            now = self._clock()
+            self._next_poll = now + self.next_poll_delay()
+
+        timeout = self._next_poll - now
+        with self._lock:
+            if self._local_dirty:
+                timeout = min(timeout, self._last_local_event + self.debounce - now)
+        return max(0.0, timeout)
+
+    def run(self) -> None:
+        """Block and keep syncing until :meth:`stop` is called."""
+        self._stopped.clear()
+        self._start_observer()
+        try:
+            while not self._stopped.is_set():
+                timeout = self.step()
+                self._wake.wait(timeout)
+                self._wake.clear()
+        finally:
+            self._stop_observer()
+
+    def stop(self) -> None:
+        """Stop a running watcher."""
+        self._stopped.set()
+        self._wake.set()
+
+    def _run_sync(self, direction: str, trigger: str) -> Dict[str, Any]:
+        with self._lock:
+            self._syncing = True
+        try:
+            result = self.sync_manager.sync_memory(direction=direction)
+        finally:
+            with self._lock:
+                self._syncing = False
+                self._written = dict(self.sync_manager.written_files)
+                events, self._events_during_sync = self._events_during_sync, set()
+        for path in events:
+            self.notify_local_change(path)
+
+        if result.get('success'):
+            self._failures = 0
+        else:
+            self._failures += 1
+            logger.warning(f"Background sync failed: {result.get('error')}")
+
+        if self.on_result:
+            self.on_result(trigger, result)
+        return result
+
+    def _start_observer(self) -> None:
+        if not self.pushes_local_changes:
+            return
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not available, falling back to polling only")
+            return
+
+        watcher = self
+        local_memory = self.sync_manager.config.memory_dir
+        local_memory.mkdir(parents=True, exist_ok=True)
+
+        class _LocalChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type in ('opened', 'closed_no_write'):
+                    return
+                path = Path(event.src_path)
+                try:
+                    relative_path = path.relative_to(local_memory)
+                except ValueError:
+                    return
+                if watcher.sync_manager.is_excluded(relative_path):
+                    return
+                watcher.notify_local_change(path)
+
+        self._observer = Observer()
+        self._observer.schedule(_LocalChangeHandler(), str(local_memory), recursive=True)
+        self._observer.start()
+
+    def _stop_observer(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
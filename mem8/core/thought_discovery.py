@@ -1,8 +1,9 @@
 """Thought discovery service for indexing and finding thought entities."""
 
+import re
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from .config import Config
 from .thought_entity import ThoughtEntity
 
@@ -15,6 +16,9 @@ class ThoughtDiscoveryService:
         self._entity_cache = {}
         self._last_scan = None
         self._cache_ttl = 300  # 5 minutes
+        # Parsed entities by path with the (mtime, size) they were parsed at,
+        # so a rescan only reparses files that changed
+        self._file_entities: Dict[str, Tuple[Tuple[int, int], ThoughtEntity]] = {}
         
     def discover_all_memory(self, force_rescan: bool = False) -> List[ThoughtEntity]:
         """Discover all thought entities across all configured repositories."""
@@ -35,6 +39,12 @@ class ThoughtDiscoveryService:
             if repo_memory_dir.exists():
                 entities.extend(self._scan_directory(repo_memory_dir, repo_name=repo_path.name))
         
+        # Forget files this walk no longer found (deleted or renamed)
+        walked = {id(entity) for entity in entities}
+        self._file_entities = {
+            key: cached for key, cached in self._file_entities.items() if id(cached[1]) in walked
+        }
+
         # Update cache
         self._entity_cache = {str(entity.path): entity for entity in entities}
         self._last_scan = time.time()
@@ -53,7 +63,7 @@ class ThoughtDiscoveryService:
         for md_file in directory.rglob("*.md"):
             if md_file.is_file() and not self._should_skip_file(md_file):
                 try:
-                    entity = ThoughtEntity.from_file(md_file)
+                    entity = self._load_entity(md_file)
                     if repo_name:
                         entity.metadata['repository'] = repo_name
                     entities.append(entity)
@@ -63,6 +73,18 @@ class ThoughtDiscoveryService:
                     continue
         return entities
     
+    def _load_entity(self, md_file: Path) -> ThoughtEntity:
+        """Parse ``md_file``, reusing the previous parse if the file is unchanged."""
+        stat = md_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = str(md_file)
+        cached = self._file_entities.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        entity = ThoughtEntity.from_file(md_file)
+        self._file_entities[key] = (stamp, entity)
+        return entity
+
     def _should_skip_file(self, file_path: Path) -> bool:
         """Check if file should be skipped during scanning."""
         skip_patterns = [
@@ -118,6 +140,41 @@ class ThoughtDiscoveryService:
         entities = self.discover_all_memory(force_rescan)
         return [e for e in entities if e.scope == scope]
     
+    def filter_memory(
+        self,
+        filter_type: str = "all",
+        filter_value: Optional[str] = None,
+        keywords: Optional[str] = None,
+        force_rescan: bool = False,
+    ) -> List[ThoughtEntity]:
+        """Memory of a type, scope or status (or all), optionally matching keywords.
+
+        ``keywords`` are space-separated regexes matched case-insensitively
+        against content, topic and tags; an entity matches if any does.
+        """
+        if filter_type == "type":
+            results = self.find_by_type(filter_value, force_rescan)
+        elif filter_type == "scope":
+            results = self.find_by_scope(filter_value, force_rescan)
+        elif filter_type == "status":
+            results = self.find_by_status(filter_value, force_rescan)
+        else:
+            results = self.discover_all_memory(force_rescan)
+
+        if keywords and keywords.strip():
+            patterns = [re.compile(k.strip(), re.IGNORECASE) for k in keywords.split() if k.strip()]
+
+            def searchable_text(entity: ThoughtEntity) -> str:
+                return (
+                    entity.content + ' ' +
+                    str(entity.metadata.get('topic', '')) + ' ' +
+                    ' '.join(entity.metadata.get('tags', []))
+                )
+
+            results = [e for e in results if any(p.search(searchable_text(e)) for p in patterns)]
+
+        return results
+
     def find_by_path_pattern(self, pattern: str, force_rescan: bool = False) -> List[ThoughtEntity]:
         """Find memory matching path pattern."""
         entities = self.discover_all_memory(force_rescan)
@@ -168,3 +225,4 @@ class ThoughtDiscoveryService:
         """Clear the entity cache to force fresh discovery."""
         self._entity_cache = {}
         self._last_scan = None
+        self._file_entities = {}
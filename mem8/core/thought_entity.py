@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, List, Any
 import yaml
 
+from .frontmatter import parse_frontmatter
+
 
 @dataclass
 class ThoughtEntity:
@@ -29,7 +31,7 @@ class ThoughtEntity:
             if yaml_end != -1:
                 yaml_content = content[4:yaml_end]
                 try:
-                    metadata = yaml.safe_load(yaml_content) or {}
+                    metadata = parse_frontmatter(yaml_content) or {}
                 except yaml.YAMLError:
                     metadata = {}
                 content_body = content[yaml_end + 3:].strip()
@@ -1,12 +1,138 @@
 """Toolbelt verification and tracking for CLI tools."""
 
+import json
+import os
+import shutil
 import subprocess
 import platform
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, NamedTuple, Tuple, Optional
 import yaml
 
+from .frontmatter import parse_frontmatter
+from .utils import ensure_directory_exists
+
+# Seconds a single probe may take before the tool counts as unavailable
+PROBE_TIMEOUT = 5
+# Wrapper scripts (version manager shims) keep their mtime while the tool
+# behind them changes, so cached probes also expire after a day
+PROBE_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+class ProbeResult(NamedTuple):
+    """Outcome of running a tool probe such as ``git --version``."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+class ProbeCache:
+    """Cached probe results keyed by resolved executable, its mtime and size.
+
+    Unchanged tools are not re-executed; upgrading, moving or replacing a
+    tool changes its key.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.cache_file = data_dir / "toolbelt_probes.json"
+        self._entries: Dict[str, List[Any]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, List[Any]]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('probes', {})
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def key(executable: str, args: List[str]) -> Optional[Tuple[str, List[int]]]:
+        """``(entry key, stamp)`` for running ``executable`` with ``args``; None if it cannot be stat'ed."""
+        resolved = os.path.realpath(executable)
+        try:
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+        return json.dumps([resolved, args]), [stat.st_mtime_ns, stat.st_size]
+
+    def get(self, key: Tuple[str, List[int]]) -> Optional[ProbeResult]:
+        entry = self._entries.get(key[0])
+        if entry and entry[0] == key[1] and time.time() - entry[1] < PROBE_CACHE_MAX_AGE:
+            return ProbeResult(*entry[2:])
+        return None
+
+    def put(self, key: Tuple[str, List[int]], result: ProbeResult) -> None:
+        self._entries[key[0]] = [key[1], time.time(), *result]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if it changed."""
+        if not self._dirty:
+            return
+        try:
+            ensure_directory_exists(self.cache_file.parent)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'probes': self._entries}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            return  # The cache is an optimization; the results are still valid
+        self._dirty = False
+
+
+def _default_data_dir() -> Path:
+    from platformdirs import user_data_dir
+
+    return Path(os.environ.get("MEM8_DATA_DIR") or user_data_dir("mem8"))
+
+
+def _run_probe(argv: List[str]) -> Optional[ProbeResult]:
+    try:
+        result = subprocess.run(argv, capture_output=True, text=True, encoding='utf-8', errors='replace',
+                                stdin=subprocess.DEVNULL, timeout=PROBE_TIMEOUT)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    return ProbeResult(result.returncode, result.stdout, result.stderr)
+
+
+def probe_commands(commands: List[List[str]], data_dir: Optional[Path] = None,
+                   use_cache: bool = True) -> List[Optional[ProbeResult]]:
+    """Run tool probes such as ``["git", "--version"]`` concurrently.
+
+    Results come back in the order of ``commands``; None means the tool is
+    not on PATH, could not be started or timed out. Cached results are used
+    for tools whose executable is unchanged, so only new or upgraded tools
+    are executed, all at once: the whole call takes about as long as the
+    slowest probe.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ProbeCache(data_dir or _default_data_dir()) if use_cache else None
+    results: List[Optional[ProbeResult]] = [None] * len(commands)
+    pending = []
+    for i, argv in enumerate(commands):
+        executable = shutil.which(argv[0]) if argv else None
+        if not executable:
+            continue
+        key = ProbeCache.key(executable, argv[1:])
+        cached = cache.get(key) if cache and key else None
+        if cached:
+            results[i] = cached
+        else:
+            pending.append((i, key, [executable, *argv[1:]]))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as pool:
+            for (i, key, _), result in zip(pending, pool.map(_run_probe, [argv for _, _, argv in pending])):
+                results[i] = result
+                if cache and key and result is not None:
+                    cache.put(key, result)
+    if cache:
+        cache.save()
+    return results
+
 
 def parse_toolbelt_file(file_path: Path) -> Tuple[Dict[str, Any], str]:
     """Parse toolbelt file, separating frontmatter from user content.
@@ -28,7 +154,7 @@ def parse_toolbelt_file(file_path: Path) -> Tuple[Dict[str, Any], str]:
         if yaml_end != -1:
             yaml_content = content[4:yaml_end]
             try:
-                metadata = yaml.safe_load(yaml_content) or {}
+                metadata = parse_frontmatter(yaml_content) or {}
             except yaml.YAMLError:
                 metadata = {}
             markdown_body = content[yaml_end + 3:].strip()
@@ -42,9 +168,12 @@ def parse_toolbelt_file(file_path: Path) -> Tuple[Dict[str, Any], str]:
     return metadata, markdown_body
 
 
-def check_toolbelt() -> Dict[str, Any]:
+def check_toolbelt(data_dir: Optional[Path] = None) -> Dict[str, Any]:
     """Check and return toolbelt CLI tools and OS info.
 
+    Args:
+        data_dir: mem8 data directory holding the probe cache (defaults to the user data dir)
+
     Returns:
         Dictionary with 'os' and 'tools' keys containing system and tool information.
     """
@@ -71,22 +200,16 @@ def check_toolbelt() -> Dict[str, Any]:
         'python_version': platform.python_version()
     }
 
-    # Check each tool
+    # Probe all tools at once
     verified = {}
-    for tool, config in toolbelt.items():
+    probes = probe_commands([config['command'].split() for config in toolbelt.values()], data_dir)
+    for (tool, config), result in zip(toolbelt.items(), probes):
+        if result is None or result.returncode != 0:
+            continue  # Tool not available
+        output = result.stdout or result.stderr
         try:
-            result = subprocess.run(
-                config['command'].split(),
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                output = result.stdout or result.stderr
-                version = config['parse'](output) if output else 'available'
-                verified[tool] = version
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            # Tool not available
+            verified[tool] = config['parse'](output) if output else 'available'
+        except Exception:
             pass
 
     return {
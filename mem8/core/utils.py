@@ -192,35 +192,20 @@ def resolve_import_path(import_path: str, base_path: Path) -> Optional[Path]:
 
 def get_git_info() -> Dict[str, Any]:
     """Get git repository information if available."""
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--show-toplevel'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        repo_root = Path(result.stdout.strip())
-        
-        # Get current branch
-        branch_result = subprocess.run(
-            ['git', 'branch', '--show-current'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        current_branch = branch_result.stdout.strip()
-        
-        return {
-            'is_git_repo': True,
-            'repo_root': repo_root,
-            'current_branch': current_branch,
-        }
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    from .git_context import git_context
+
+    context = git_context()
+    if context is None:
         return {
             'is_git_repo': False,
             'repo_root': None,
             'current_branch': None,
         }
+    return {
+        'is_git_repo': True,
+        'repo_root': context.root,
+        'current_branch': context.branch,
+    }
 
 
 def create_symlink(target: Path, link_path: Path, force: bool = False) -> bool:
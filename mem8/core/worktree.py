@@ -2,7 +2,7 @@
 
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 def _validate_branch_name(branch_name: str) -> None:
     """Validate branch name to prevent command injection and invalid git refs.
@@ -121,40 +121,75 @@ def remove_worktree(worktree_path: Path, force: bool = False) -> None:
         raise RuntimeError(f"Failed to remove worktree: {result.stderr}")
 
 
+def _parse_status_v2(output: str) -> Dict[str, Any]:
+    """Parse ``git status --porcelain=v2 --branch`` output."""
+    status: Dict[str, Any] = {"branch": "", "commit": None, "upstream": None, "ahead": 0, "behind": 0, "changes": 0}
+    for line in output.splitlines():
+        if not line.startswith('# '):
+            if line:
+                status["changes"] += 1
+            continue
+        key, _, value = line[2:].partition(' ')
+        if key == 'branch.oid':
+            status["commit"] = None if value == '(initial)' else value
+        elif key == 'branch.head':
+            status["branch"] = '' if value == '(detached)' else value
+        elif key == 'branch.upstream':
+            status["upstream"] = value
+        elif key == 'branch.ab':
+            ahead, _, behind = value.partition(' ')
+            status["ahead"], status["behind"] = int(ahead), -int(behind)
+    status["is_clean"] = status["changes"] == 0
+    return status
+
+
 def get_worktree_status(worktree_path: Path) -> Dict[str, Any]:
     """Get status information for a specific worktree."""
     if not worktree_path.exists():
         return {"exists": False}
-    
-    # Change to worktree directory and get git status
-    cmd = ["git", "-C", str(worktree_path), "status", "--porcelain"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
+
+    # One call gives branch, upstream tracking and changes; --no-optional-locks keeps
+    # concurrent calls from contending on index.lock
+    cmd = ["git", "--no-optional-locks", "-C", str(worktree_path), "status", "--porcelain=v2", "--branch"]
+    result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+
     if result.returncode != 0:
         return {
             "exists": True,
             "valid": False,
             "error": result.stderr
         }
-    
-    # Count changes
-    lines = result.stdout.strip().split('\n') if result.stdout.strip() else []
-    
-    # Get current branch
-    branch_cmd = ["git", "-C", str(worktree_path), "branch", "--show-current"]
-    branch_result = subprocess.run(branch_cmd, capture_output=True, text=True)
-    current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
-    
+
     return {
         "exists": True,
         "valid": True,
         "path": str(worktree_path),
-        "branch": current_branch,
-        "changes": len(lines) if lines != [''] else 0,
-        "is_clean": len(lines) == 0 or lines == ['']
+        **_parse_status_v2(result.stdout),
     }
 
 
+def collect_worktree_statuses(worktrees: Optional[List[Dict[str, Any]]] = None,
+                              max_workers: int = 8) -> List[Dict[str, Any]]:
+    """Status of every worktree, queried concurrently.
+
+    Each entry from :func:`list_worktrees` gets a ``status`` key holding
+    :func:`get_worktree_status` for it (bare worktrees have no working tree
+    and are left without one). Order is preserved.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if worktrees is None:
+        worktrees = list_worktrees()
+    targets = [wt for wt in worktrees if not wt.get('bare') and wt.get('path')]
+    if targets:
+        # git does the work in its own process, so threads are enough
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as pool:
+            statuses = pool.map(lambda wt: get_worktree_status(Path(wt['path'])), targets)
+            for wt, status in zip(targets, statuses):
+                wt['status'] = status
+    return worktrees
+
+
 def find_worktrees_for_repo(repo_name: str, base_dir: Path) -> List[Path]:
     """Find all worktrees for a specific repository in the base directory."""
     repo_dir = base_dir / repo_name
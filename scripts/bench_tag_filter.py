@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-tag thought filtering: JSON scan vs. the thought_tags table.
+
+Builds a SQLite database of synthetic thoughts (1M by default), then times
+the same AND-of-tags query both ways. The JSON variant is the correct
+SQLite equivalent of the old ``Thought.tags.contains([tag])`` filter.
+
+    python scripts/bench_tag_filter.py --count 1000000 --db /tmp/mem8-bench.db
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+
+def build(path: Path, count: int, teams: int, vocabulary: int, tags_per_thought: int) -> None:
+    """Create the schema with SQLAlchemy and bulk-load synthetic rows."""
+    from sqlalchemy import create_engine
+
+    from mem8_api.database import metadata
+    from mem8_api import models  # noqa: F401
+
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    engine.dispose()
+
+    rng = random.Random(8)
+    team_ids = [str(uuid.uuid4()) for _ in range(teams)]
+    # Zipf-like popularity so some tags are common and most are rare
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    names = [f"tag-{rank}" for rank in range(vocabulary)]
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    batch_thoughts, batch_tags = [], []
+    for i in range(count):
+        thought_id = str(uuid.uuid4())
+        team_id = team_ids[i % teams]
+        tags = list(dict.fromkeys(rng.choices(names, weights, k=tags_per_thought)))
+        batch_thoughts.append((thought_id, f"Thought {i}", "body", f"notes/{i}.md", team_id, json.dumps(tags)))
+        batch_tags.extend((thought_id, tag, team_id) for tag in tags)
+        if len(batch_thoughts) == 10000 or i == count - 1:
+            conn.executemany(
+                "INSERT INTO thoughts (id, title, content, path, team_id, tags, thought_metadata,"
+                " word_count, is_published, is_archived) VALUES (?, ?, ?, ?, ?, ?, '{}', 1, 1, 0)",
+                batch_thoughts,
+            )
+            conn.executemany("INSERT INTO thought_tags (thought_id, tag, team_id) VALUES (?, ?, ?)", batch_tags)
+            batch_thoughts, batch_tags = [], []
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def timed(conn: sqlite3.Connection, sql: str, params, repeat: int):
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = conn.execute(sql, params).fetchone()[0]
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(samples)
+
+
+def compile_filter(tags, team_id):
+    """Render the API's tag filter to SQLite SQL."""
+    from sqlalchemy import func, select
+    from sqlalchemy.dialects import sqlite
+
+    from mem8_api.models.thought import Thought
+    from mem8_api.services.tags import has_tags
+
+    query = select(func.count()).select_from(Thought).where(Thought.team_id == team_id, has_tags(tags, team_id))
+    return str(query.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000, help="Number of thoughts")
+    parser.add_argument("--teams", type=int, default=10)
+    parser.add_argument("--vocabulary", type=int, default=500, help="Distinct tags")
+    parser.add_argument("--tags-per-thought", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db", type=Path, default=Path("mem8-tag-bench.db"))
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{args.db}")
+    sys.path.insert(0, str(Path(__file__).parent.parent / "backend" / "src"))
+
+    if not args.db.exists():
+        started = time.perf_counter()
+        build(args.db, args.count, args.teams, args.vocabulary, args.tags_per_thought)
+        print(f"Built {args.count} thoughts in {time.perf_counter() - started:.1f}s")
+
+    conn = sqlite3.connect(args.db)
+    team_id = conn.execute("SELECT team_id FROM thoughts LIMIT 1").fetchone()[0]
+    json_sql = "SELECT count(*) FROM thoughts WHERE team_id = ?"
+
+    print(f"{'tags':<28}{'matches':>10}{'json scan ms':>15}{'tag table ms':>15}")
+    for tags in (["tag-0"], ["tag-0", "tag-1"], ["tag-2", "tag-40"], ["tag-0", "tag-3", "tag-7"], ["tag-300", "tag-301"]):
+        sql = json_sql + " AND EXISTS (SELECT 1 FROM json_each(thoughts.tags) WHERE value = ?)" * len(tags)
+        json_count, json_ms = timed(conn, sql, (team_id, *tags), args.repeat)
+        table_count, table_ms = timed(conn, compile_filter(tags, team_id), (), args.repeat)
+        assert json_count == table_count, (tags, json_count, table_count)
+        print(f"{' + '.join(tags):<28}{table_count:>10}{json_ms:>15.1f}{table_ms:>15.1f}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
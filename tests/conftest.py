@@ -13,6 +13,11 @@ import pytest
 
 # Add the parent directory to sys.path so we can import mem8
 sys.path.insert(0, str(Path(__file__).parent.parent))
+# ...and the API backend, imported as mem8_api
+BACKEND_SRC = Path(__file__).parent.parent / "backend" / "src"
+sys.path.insert(0, str(BACKEND_SRC))
+
+BACKEND_MODULES = ("sqlalchemy", "aiosqlite", "greenlet", "pydantic_settings", "prometheus_client")
 
 
 @pytest.fixture(autouse=True)
@@ -33,6 +38,25 @@ def isolate_mem8_env(tmp_path, monkeypatch):
     monkeypatch.setenv("MEM8_DISABLE_HOME_SHORTCUT", "1")
 
 
+@pytest.fixture
+def backend(monkeypatch):
+    """Configure the mem8 API backend for an in-memory SQLite database.
+
+    Skips when backend dependencies are missing. Import ``mem8_api`` modules
+    inside the test: ``mem8_api.database`` creates its engine from
+    ``DATABASE_URL`` when it is first imported.
+    """
+    for module in BACKEND_MODULES:
+        pytest.importorskip(module)
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite://")
+
+    from mem8_api.config import get_settings
+
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.fixture
 def temp_workspace(tmp_path) -> Dict[str, Path]:
     """Create a temporary workspace and shared folder for tests."""
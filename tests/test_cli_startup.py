@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Guards for mem8 CLI cold-start time.
+
+Importing mem8.cli.main must not pull in command modules or their heavy
+dependencies; those load only when a command runs.
+"""
+
+import os
+import subprocess
+import sys
+
+# Generous default so slow CI machines pass; tighten locally via the env var
+IMPORT_BUDGET_MS = float(os.environ.get("MEM8_IMPORT_BUDGET_MS", "250"))
+
+HEAVY_MODULES = (
+    "mem8.cli.commands.core",
+    "mem8.core.config",
+    "mem8.core.sync",
+    "yaml",
+    "psutil",
+    "rich.table",
+)
+
+
+def import_times(module="mem8.cli.main"):
+    """Cumulative import time in ms per module for ``import <module>``."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert res.returncode == 0, res.stderr
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def test_cli_import_skips_command_modules():
+    times = import_times()
+    assert "mem8.cli.main" in times
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert times["mem8.cli.main"] < IMPORT_BUDGET_MS, times["mem8.cli.main"]
+
+
+def test_lazy_help_matches_commands():
+    from mem8.cli.main import COMMANDS
+
+    for lazy in COMMANDS:
+        command = lazy.load()
+        assert command.name == lazy.name
+        first_paragraph = (command.help or "").strip().split("\n\n")[0]
+        assert " ".join(first_paragraph.split()) == lazy.help
+
+
+def test_core_modules_defer_system_libraries():
+    # Loaded only by the code paths that need them
+    for module in ("mem8.core.config", "mem8.core.memory", "mem8.core.ports", "mem8.core.toolbelt"):
+        times = import_times(module)
+        assert [name for name in ("psutil", "platformdirs") if name in times] == [], module
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for git evidence in completion analysis.
+"""
+
+import subprocess
+
+import pytest
+
+from mem8.core import completion_analysis
+from mem8.core.completion_analysis import CompletionAnalysisEngine
+from mem8.core.config import Config
+from mem8.core.thought_entity import ThoughtEntity
+
+
+def _commit(repo, message):
+    subprocess.run(["git", "commit", "--allow-empty", "-q", "-m", message], cwd=repo, check=True)
+
+
+@pytest.mark.unit
+def test_batch_reads_git_log_once(make_repo, chdir, git_available, monkeypatch):
+    if not git_available:
+        pytest.skip("git not available in test environment")
+
+    repo = make_repo(name="repo", with_memory=False)
+    _commit(repo, "Add token refresh\n\nPart of the Authentication rework")
+    _commit(repo, "Fix flaky Authentication test")
+    _commit(repo, "Bump dependencies")
+    plans = repo / "memory" / "shared" / "plans"
+    plans.mkdir(parents=True)
+    for name, topic in [("auth.md", "Authentication rework"), ("docs.md", "Documentation site")]:
+        (plans / name).write_text(f"---\ntopic: {topic}\n---\n# {topic}\n", encoding="utf-8")
+    chdir(repo)
+
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(args, *a, **kw):
+        if args[:2] == ["git", "log"]:
+            calls.append(args)
+        return real_run(args, *a, **kw)
+
+    monkeypatch.setattr(completion_analysis.subprocess, "run", counting_run)
+
+    engine = CompletionAnalysisEngine(Config())
+    entities = [ThoughtEntity.from_file(path) for path in sorted(plans.glob("*.md"))]
+    batch = engine.analyze_batch(entities)
+
+    assert len(calls) == 1
+    evidence = {
+        result["entity_path"]: [e for e in result["evidence"] if e["type"] == "git_implementation"]
+        for result in batch["individual_results"]
+    }
+    auth = evidence[str(plans / "auth.md")]
+    # "Authentication", "rework" and the full topic each match like `git log --grep`
+    assert auth[0]["details"]["total_commits"] == 4
+    assert evidence[str(plans / "docs.md")] == []
+
+
+@pytest.mark.unit
+def test_batch_results_are_cached_until_the_repo_changes(make_repo, chdir, git_available, monkeypatch):
+    if not git_available:
+        pytest.skip("git not available in test environment")
+
+    repo = make_repo(name="repo", with_memory=False)
+    _commit(repo, "Start the parser rewrite")
+    (repo / "src").mkdir()
+    (repo / "src" / "parser.py").write_text("", encoding="utf-8")
+    plans = repo / "memory" / "shared" / "plans"
+    plans.mkdir(parents=True)
+    for name in ("parser.md", "lexer.md"):
+        topic = name[:-3].title() + " rewrite"
+        (plans / name).write_text(
+            f"---\ntopic: {topic}\n---\n# {topic}\n- [x] Update `src/parser.py`\n- [ ] Add `src/lexer.py`\n",
+            encoding="utf-8",
+        )
+    chdir(repo)
+
+    engine = CompletionAnalysisEngine(Config())
+    analyzed = []
+    analyze = engine.analyze_completion
+    monkeypatch.setattr(engine, "analyze_completion", lambda entity: analyzed.append(entity.path.name) or analyze(entity))
+
+    def run():
+        analyzed.clear()
+        entities = [ThoughtEntity.from_file(path) for path in sorted(plans.glob("*.md"))]
+        return engine.analyze_batch(entities)["individual_results"]
+
+    first = run()
+    assert sorted(analyzed) == ["lexer.md", "parser.md"]
+    assert run() == first and analyzed == []
+
+    # An edited entity is recomputed on its own
+    (plans / "lexer.md").write_text((plans / "lexer.md").read_text(encoding="utf-8") + "\nMore notes\n", encoding="utf-8")
+    run()
+    assert analyzed == ["lexer.md"]
+
+    # A new file in the workspace can change artifact evidence, so everything is recomputed
+    (repo / "src" / "lexer.py").write_text("", encoding="utf-8")
+    results = run()
+    assert sorted(analyzed) == ["lexer.md", "parser.md"]
+    artifacts = [e for e in results[0]["evidence"] if e["type"] == "artifact_creation"]
+    assert sorted(artifacts[0]["details"]["existing_files"]) == ["src/lexer.py", "src/parser.py"]
+
+
+@pytest.mark.unit
+def test_worker_pool_matches_sequential(make_repo, chdir, monkeypatch):
+    repo = make_repo(name="repo", with_memory=True, files=6)
+    chdir(repo)
+    entities = [ThoughtEntity.from_file(path) for path in sorted((repo / "memory").rglob("*.md"))]
+    engine = CompletionAnalysisEngine(Config())
+
+    sequential = engine.analyze_batch(entities, use_cache=False, workers=1)
+    monkeypatch.setattr(completion_analysis, "PARALLEL_MIN_ENTITIES", 1)
+    assert engine.analyze_batch(entities, use_cache=False, workers=2) == sequential
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the optional mem8 query daemon.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from mem8.core import daemon
+from mem8.core.config import Config
+from mem8.core.memory import MemoryManager
+
+pytestmark = pytest.mark.skipif(not daemon.supported(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def running_daemon():
+    server = daemon.Daemon(idle_timeout=30)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not daemon.status() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    yield server
+    daemon.stop()
+    thread.join(5)
+
+
+def test_daemon_answers_like_in_process(tmp_path, chdir, running_daemon):
+    notes = tmp_path / "workspace" / "memory" / "shared" / "plans"
+    notes.mkdir(parents=True)
+    (notes / "auth.md").write_text("---\ntopic: Auth plan\n---\n# Auth\nRotate the docker secrets\n", encoding="utf-8")
+    (notes / "ci.md").write_text("# CI\nNothing here\n", encoding="utf-8")
+    chdir(tmp_path / "workspace")
+
+    params = dict(query="docker", limit=10, content_type="all", search_method="fulltext", path_filter=None)
+    local = MemoryManager(Config()).search_content(**params)
+    assert daemon.request("search", params) == local
+    assert [row["metadata"]["topic"] for row in daemon.request("find", dict(keywords="docker"))] == ["Auth plan"]
+
+    # Edits show up on the next query without restarting the daemon
+    (notes / "ci.md").write_text("# CI\nBuild the docker image\n", encoding="utf-8")
+    assert daemon.request("search", params)["total_found"] == 2
+
+    with pytest.raises(daemon.DaemonError):
+        daemon.request("search", dict(params, path_filter="../outside"))
+
+
+def test_daemon_steps_aside_for_other_versions(monkeypatch, running_daemon):
+    response = daemon._call(daemon.socket_path(), {"op": "search", "version": "0.0.0", "params": {}}, 5)
+    assert response == {"ok": False, "stale": True}
+    assert running_daemon.stopping
+
+    monkeypatch.setenv("MEM8_DAEMON", "off")
+    assert daemon.request("search", dict(query="x")) is None
+
+
+def test_only_one_of_concurrent_daemons_binds(monkeypatch, running_daemon):
+    path = daemon.socket_path()
+    inode = path.stat().st_ino
+    # A second daemon started before the first answers pings
+    monkeypatch.setattr(daemon, "status", lambda config_dir=None: None)
+    second = threading.Thread(target=daemon.Daemon(idle_timeout=30).serve, daemon=True)
+    second.start()
+    second.join(5)
+
+    assert not second.is_alive()
+    assert path.stat().st_ino == inode
+    assert daemon._call(path, {"op": "ping", "version": daemon.__version__}, 2)["ok"]
+
+
+def test_warm_caches_forget_deleted_and_renamed_files(tmp_path, chdir):
+    notes = tmp_path / "workspace" / "memory" / "shared"
+    notes.mkdir(parents=True)
+    for name in ("a.md", "b.md", "c.md"):
+        (notes / name).write_text(f"# {name}\ndocker\n", encoding="utf-8")
+    chdir(tmp_path / "workspace")
+    manager = MemoryManager(Config())
+
+    def warm():
+        manager.search_content(query="docker", content_type="memory")
+        manager.thought_discovery.filter_memory(force_rescan=True, keywords="docker")
+        return (
+            {Path(key).name for key in manager._file_cache},
+            {Path(key).name for key in manager.thought_discovery._file_entities},
+        )
+
+    assert warm() == ({"a.md", "b.md", "c.md"},) * 2
+    (notes / "a.md").unlink()
+    (notes / "b.md").rename(notes / "d.md")
+    assert warm() == ({"c.md", "d.md"},) * 2
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for fast frontmatter parsing.
+"""
+
+import datetime
+
+import pytest
+import yaml
+
+from mem8.core import frontmatter
+from mem8.core.frontmatter import _parse_simple, parse_frontmatter
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text", [
+    "topic: Auth rework\nstatus: draft\n",
+    "topic: OAuth: scopes\n",
+    "status: yes\n",
+    "count: 12\n",
+    "date: 2025-10-01\n",
+    "empty:\n",
+    "note: see #12\n",
+    "note: ends with colon:\n",
+    "tags: [a, b]\n",
+    "title: 'quoted'\n",
+    "true: key\n",
+    "url: http://example.com/a?b=c\n",
+    "id: ENG-1234\n",
+    "# comment\ntopic: x\n",
+    "nested:\n  key: value\n",
+])
+def test_matches_yaml(text):
+    def outcome(parse):
+        try:
+            return parse(text)
+        except yaml.YAMLError as e:
+            return type(e)
+
+    assert outcome(parse_frontmatter) == outcome(yaml.safe_load)
+
+
+@pytest.mark.unit
+def test_fast_path_only_takes_plain_strings():
+    assert _parse_simple("topic: Auth rework\nauthor: bob\n") == {"topic": "Auth rework", "author": "bob"}
+    for text in ("status: yes\n", "count: 12\n", "tags: [a]\n", "a: b: c\n", "note: x #y\n", "nested:\n  k: v\n"):
+        assert _parse_simple(text) is None
+
+
+@pytest.mark.unit
+def test_identical_headers_are_parsed_once(monkeypatch):
+    frontmatter._parse.cache_clear()
+    loads = []
+    real_load = yaml.load
+    monkeypatch.setattr(frontmatter.yaml, "load", lambda *a, **kw: loads.append(1) or real_load(*a, **kw))
+
+    header = "date: 2025-10-01T10:00:00-05:00\ntags: [research, codebase]\n"
+    first = parse_frontmatter(header)
+    second = parse_frontmatter(header)
+
+    assert len(loads) == 1
+    assert first == second and isinstance(first["date"], datetime.datetime)
+    # Callers get their own copies
+    first["tags"].append("edited")
+    assert parse_frontmatter(header)["tags"] == ["research", "codebase"]
+
+
+@pytest.mark.unit
+def test_invalid_yaml_raises():
+    with pytest.raises(yaml.YAMLError):
+        parse_frontmatter("key: [unclosed\n")
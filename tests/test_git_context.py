@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for git facts read from .git and a single git log pass.
+"""
+
+import subprocess
+
+import pytest
+
+from mem8.core import git_context as git_context_module
+from mem8.core import metadata
+from mem8.core.git_context import git_context
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit(repo, message, author="Test User <test@example.com>"):
+    _git(repo, "commit", "--allow-empty", "-q", "-m", message, "--author", author)
+
+
+@pytest.fixture
+def repo(make_repo, git_available):
+    if not git_available:
+        pytest.skip("git not available in test environment")
+    git_context_module._contexts.clear()
+    repo = make_repo(name="repo", with_memory=False)
+    _commit(repo, "Second", author="Other Person <other@example.com>")
+    _commit(repo, "Third")
+    return repo
+
+
+@pytest.mark.unit
+def test_branch_and_head_match_git(repo):
+    context = git_context(repo)
+    assert context.branch == _git(repo, "branch", "--show-current")
+    assert context.head_commit == _git(repo, "rev-parse", "HEAD")
+
+    # Packed refs and a detached HEAD are read without git
+    _git(repo, "pack-refs", "--all")
+    assert git_context(repo).head_commit == _git(repo, "rev-parse", "HEAD")
+    _git(repo, "checkout", "-q", "--detach", "HEAD~1")
+    detached = git_context(repo)
+    assert detached.branch == ""
+    assert detached.head_commit == _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.mark.unit
+def test_linked_worktree(repo, tmp_path):
+    worktree = tmp_path / "feature"
+    _git(repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+    _commit(worktree, "On feature")
+
+    context = git_context(worktree / ".")
+    assert context.root == worktree.resolve()
+    assert context.branch == "feature"
+    assert context.head_commit == _git(worktree, "rev-parse", "HEAD")
+    assert context.history()["total_commits"] == 4
+
+
+@pytest.mark.unit
+def test_history_matches_git(repo):
+    _git(repo, "checkout", "-q", "-b", "side")
+    _commit(repo, "Side work", author="Third Person <third@example.com>")
+    _git(repo, "checkout", "-q", "-")
+
+    history = git_context(repo).history()
+    assert history["total_commits"] == int(_git(repo, "rev-list", "--count", "HEAD"))
+    assert history["contributors"] == 3
+    assert history["first_commit"] == _git(repo, "log", "--format=%ci", "--max-parents=0")
+    assert history["last_commit_date"] == _git(repo, "log", "-1", "--format=%ci")
+
+
+@pytest.mark.unit
+def test_context_is_reused_until_head_moves(repo):
+    first = git_context(repo)
+    assert git_context(repo / ".") is first
+
+    _commit(repo, "Fourth")
+    second = git_context(repo)
+    assert second is not first
+    assert second.head_commit == _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.mark.unit
+def test_outside_a_repository(tmp_path):
+    assert git_context(tmp_path) is None
+
+
+@pytest.mark.unit
+def test_project_metadata_uses_two_git_processes(repo, chdir, monkeypatch):
+    chdir(repo)
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(args, *a, **kw):
+        calls.append(args[1])
+        return real_run(args, *a, **kw)
+
+    monkeypatch.setattr(git_context_module.subprocess, "run", counting_run)
+    project = metadata.generate_project_metadata()
+
+    assert sorted(calls) == ["log", "status"]
+    assert project["git_metadata"]["git_commit"] == _git(repo, "rev-parse", "HEAD")
+    assert project["repository_stats"]["total_commits"] == 3
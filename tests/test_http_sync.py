@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Integration tests for HTTP sync against a locally started API server.
+"""
+
+import hashlib
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+import zlib
+from pathlib import Path
+
+import pytest
+
+for module in ("sqlalchemy", "aiosqlite", "greenlet", "pydantic_settings", "prometheus_client", "jwt", "httpx"):
+    pytest.importorskip(module)
+
+import requests  # noqa: E402
+
+from mem8.core.config import Config  # noqa: E402
+from mem8.core.sync import SyncManager  # noqa: E402
+
+BACKEND_SRC = Path(__file__).parent.parent / "backend" / "src"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def api_server(tmp_path_factory):
+    """Run the mem8 API with SQLite and a temporary sync store."""
+    root = tmp_path_factory.mktemp("api")
+    port = _free_port()
+    env = os.environ.copy()
+    env.update({
+        "PYTHONPATH": str(BACKEND_SRC),
+        "DATABASE_URL": f"sqlite+aiosqlite:///{root / 'mem8.db'}",
+        "SYNC_STORAGE_DIR": str(root / "sync-storage"),
+    })
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "mem8_api.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=str(root), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                if requests.get(f"{url}/api/v1/health", timeout=1).ok:
+                    break
+            except requests.RequestException:
+                time.sleep(0.1)
+        else:
+            pytest.skip("API server did not start")
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _workspace(tmp_path: Path, name: str, server_url: str, team_id: str):
+    workspace = tmp_path / name
+    (workspace / "memory").mkdir(parents=True)
+    os.chdir(workspace)
+    config = Config(str(tmp_path / f"{name}-config"))
+    config.set('sync.transport', 'http')
+    config.set('sync.server_url', server_url)
+    config.set('sync.team_id', team_id)
+    return config, workspace / "memory"
+
+
+@pytest.mark.integration
+def test_http_sync_round_trip_and_merge(api_server, tmp_path, chdir):
+    team_id = str(uuid.uuid4())
+    chdir(tmp_path)
+
+    alice, alice_memory = _workspace(tmp_path, "alice", api_server, team_id)
+    (alice_memory / "plans").mkdir()
+    (alice_memory / "plans" / "plan.md").write_text("# Plan\n\none\n\ntwo\n", encoding="utf-8")
+    (alice_memory / "big.bin").write_bytes(os.urandom(600 * 1024))
+    result = SyncManager(alice).sync_memory()
+    assert result['success'], result
+    assert result['summary']['pushed'] == 2
+
+    bob, bob_memory = _workspace(tmp_path, "bob", api_server, team_id)
+    result = SyncManager(bob).sync_memory()
+    assert result['summary']['pulled'] == 2
+    assert (bob_memory / "big.bin").read_bytes() == (alice_memory / "big.bin").read_bytes()
+
+    # Non-overlapping edits on both sides merge automatically
+    (bob_memory / "plans" / "plan.md").write_text("# Plan v2\n\none\n\ntwo\n", encoding="utf-8")
+    assert SyncManager(bob).sync_memory()['summary']['pushed'] == 1
+
+    os.chdir(tmp_path / "alice")
+    (alice_memory / "plans" / "plan.md").write_text("# Plan\n\none\n\ntwo\n\nthree\n", encoding="utf-8")
+    result = SyncManager(alice).sync_memory()
+    assert result['summary']['merged'] == 1
+    assert result['summary']['conflicts'] == 0
+    merged = "# Plan v2\n\none\n\ntwo\n\nthree\n"
+    assert (alice_memory / "plans" / "plan.md").read_text(encoding="utf-8") == merged
+
+    os.chdir(tmp_path / "bob")
+    SyncManager(bob).sync_memory()
+    assert (bob_memory / "plans" / "plan.md").read_text(encoding="utf-8") == merged
+
+
+@pytest.mark.integration
+def test_one_way_merges_respect_direction(api_server, tmp_path, chdir):
+    team_id = str(uuid.uuid4())
+    chdir(tmp_path)
+    base, theirs = "# Plan\n\none\n\ntwo\n", "# Plan v2\n\none\n\ntwo\n"
+    ours, merged = "# Plan\n\none\n\ntwo\n\nthree\n", "# Plan v2\n\none\n\ntwo\n\nthree\n"
+
+    alice, alice_memory = _workspace(tmp_path, "alice", api_server, team_id)
+    plan = alice_memory / "plan.md"
+    plan.write_text(base, encoding="utf-8")
+    SyncManager(alice).sync_memory()
+    bob, bob_memory = _workspace(tmp_path, "bob", api_server, team_id)
+    SyncManager(bob).sync_memory()
+
+    def server_copy():
+        os.chdir(tmp_path / "bob")
+        SyncManager(bob).sync_memory(direction='pull')
+        return (bob_memory / "plan.md").read_text(encoding="utf-8")
+
+    # Pull-only: the merge lands locally and nothing is pushed
+    (bob_memory / "plan.md").write_text(theirs, encoding="utf-8")
+    SyncManager(bob).sync_memory()
+    os.chdir(tmp_path / "alice")
+    plan.write_text(ours, encoding="utf-8")
+    result = SyncManager(alice).sync_memory(direction='pull')
+    assert result['summary']['merged'] == 1 and result['summary']['pushed'] == 0
+    assert plan.read_text(encoding="utf-8") == merged
+    assert server_copy() == theirs
+
+    # Push-only: the merge goes to the server, the local file is untouched,
+    # and the next two-way sync pulls the merge instead of pushing over it
+    os.chdir(tmp_path / "alice")
+    SyncManager(alice).sync_memory()
+    plan.write_text(merged.replace("three", "four"), encoding="utf-8")
+    os.chdir(tmp_path / "bob")
+    (bob_memory / "plan.md").write_text(merged.replace("Plan v2", "Plan v3"), encoding="utf-8")
+    SyncManager(bob).sync_memory()
+    os.chdir(tmp_path / "alice")
+    result = SyncManager(alice).sync_memory(direction='push')
+    assert result['summary']['merged'] == 1 and result['summary']['pulled'] == 0
+    assert plan.read_text(encoding="utf-8") == merged.replace("three", "four")
+    pushed = "# Plan v3\n\none\n\ntwo\n\nfour\n"
+    assert server_copy() == pushed
+    os.chdir(tmp_path / "alice")
+    SyncManager(alice).sync_memory()
+    assert plan.read_text(encoding="utf-8") == pushed
+    assert server_copy() == pushed
+
+
+@pytest.mark.integration
+def test_http_sync_rejects_path_traversal(api_server):
+    team_id = str(uuid.uuid4())
+    response = requests.post(
+        f"{api_server}/api/v1/sync/{team_id}/commit",
+        json={"files": [{"path": "../escape.md", "hash": "0" * 64, "size": 0, "chunks": []}]},
+        headers={"X-Local-Mode": "true"},
+        timeout=5,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+def test_http_sync_rejects_entries_that_do_not_match_their_chunks(api_server):
+    team_id = str(uuid.uuid4())
+    data = b"# Notes\n"
+    digest = hashlib.sha256(data).hexdigest()
+    headers = {"X-Local-Mode": "true"}
+    requests.put(
+        f"{api_server}/api/v1/sync/{team_id}/chunks/{digest}",
+        data=zlib.compress(data), headers=headers, timeout=5,
+    ).raise_for_status()
+
+    def commit(hash_, size):
+        entry = {"path": "notes.md", "hash": hash_, "size": size, "chunks": [digest]}
+        return requests.post(
+            f"{api_server}/api/v1/sync/{team_id}/commit", json={"files": [entry]}, headers=headers, timeout=5,
+        )
+
+    assert commit("0" * 64, len(data)).status_code == 400
+    assert commit(digest, len(data) + 1).status_code == 400
+    assert commit(digest, len(data)).status_code == 200
+
+
+@pytest.mark.integration
+def test_bulk_import_upserts_by_path(api_server, tmp_path, chdir):
+    team_id = str(uuid.uuid4())
+    chdir(tmp_path)
+
+    config, memory = _workspace(tmp_path, "importer", api_server, team_id)
+    (memory / "plans").mkdir()
+    for i in range(3):
+        (memory / "plans" / f"plan-{i}.md").write_text(f"# Plan {i}\n\nbody\n", encoding="utf-8")
+    (memory / "tagged.md").write_text("---\ntags: [auth, api]\n---\n# Tagged\n", encoding="utf-8")
+
+    result = SyncManager(config).import_to_server()
+    assert result['success'], result
+    assert (result['created'], result['updated'], result['unchanged']) == (4, 0, 0)
+
+    (memory / "plans" / "plan-0.md").write_text("# Plan 0\n\nrevised\n", encoding="utf-8")
+    result = SyncManager(config).import_to_server()
+    assert (result['created'], result['updated'], result['unchanged']) == (0, 1, 3)
+    assert result['errors'] == []
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for API request and SQL metrics.
+"""
+
+import pytest
+
+
+def _count(name, **labels):
+    from prometheus_client import REGISTRY
+
+    return REGISTRY.get_sample_value(f"{name}_count", labels) or 0
+
+
+def test_requests_are_labelled_by_route_template(backend):
+    for module in ("fastapi", "httpx"):
+        pytest.importorskip(module)
+    from fastapi import APIRouter, FastAPI
+    from fastapi.testclient import TestClient
+
+    from mem8_api.metrics import PrometheusMiddleware
+
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.add_middleware(PrometheusMiddleware)
+
+    template = {"method": "GET", "route": "/api/v1/items/{item_id}", "status": "2xx"}
+    unmatched = {"method": "GET", "route": "unmatched", "status": "4xx"}
+    before = _count("mem8_http_request_seconds", **template)
+    before_unmatched = _count("mem8_http_request_seconds", **unmatched)
+
+    with TestClient(app) as client:
+        assert client.get("/api/v1/items/1").status_code == 200
+        assert client.get("/api/v1/items/2").status_code == 200
+        assert client.get("/nowhere/3").status_code == 404
+
+    assert _count("mem8_http_request_seconds", **template) == before + 2
+    assert _count("mem8_http_request_seconds", **unmatched) == before_unmatched + 1
+    assert _count("mem8_http_request_seconds", method="GET", route="/api/v1/items/1", status="2xx") == 0
+
+    # Arbitrary verbs share one label value
+    other = {"method": "other", "route": "/api/v1/items/{item_id}", "status": "4xx"}
+    before_other = _count("mem8_http_request_seconds", **other)
+    with TestClient(app) as client:
+        for verb in ("FOO", "XYZ1"):
+            client.request(verb, "/api/v1/items/1")
+    assert _count("mem8_http_request_seconds", **other) == before_other + 2
+    assert _count("mem8_http_request_seconds", method="FOO", route="/api/v1/items/{item_id}", status="4xx") == 0
+
+
+def test_queries_are_timed_by_operation(backend):
+    from sqlalchemy import create_engine, text
+
+    from mem8_api.metrics import instrument_engine
+
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    before = {op: _count("mem8_db_query_seconds", operation=op) for op in ("select", "insert", "other")}
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+        conn.execute(text("  select x from t"))
+        conn.execute(text("SELECT count(*) FROM t"))
+
+    assert _count("mem8_db_query_seconds", operation="select") == before["select"] + 2
+    assert _count("mem8_db_query_seconds", operation="insert") == before["insert"] + 1
+    assert _count("mem8_db_query_seconds", operation="other") >= before["other"] + 1
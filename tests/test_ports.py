@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for port lease lookups and conflict detection.
+"""
+
+import os
+import random
+import socket
+
+import pytest
+
+from mem8.core.ports import LeaseIndex, PortManager
+
+
+def _lease(start, count):
+    return {'project_name': 'p', 'project_path': 'p', 'start_port': start, 'port_count': count, 'leased_at': ''}
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch, chdir):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path / "home"))
+    chdir(tmp_path)
+    return PortManager()
+
+
+@pytest.mark.unit
+def test_index_matches_brute_force():
+    rng = random.Random(48)
+    leases = {f"/p/{i}": _lease(rng.randrange(20000, 20400), rng.randrange(1, 40)) for i in range(60)}
+    index = LeaseIndex(leases)
+
+    def owners(port):
+        return {p for p, lease in leases.items() if lease['start_port'] <= port < lease['start_port'] + lease['port_count']}
+
+    for port in range(19990, 20450):
+        covering = index.covering(port)
+        assert (covering[2] if covering else None) in (owners(port) or {None})
+        if covering:
+            assert index.covering(port, exclude=covering[2]) is None or len(owners(port)) > 1
+
+    pairs = {frozenset((a[2], b[2])) for a, b in index.overlaps()}
+    expected = {
+        frozenset((p, q)) for p in leases for q in leases
+        if p < q and any(p in owners(port) and q in owners(port) for port in range(20000, 20440))
+    }
+    assert pairs == expected
+
+
+@pytest.mark.unit
+def test_find_available_ports_skips_leases_and_listeners(manager):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        busy = listener.getsockname()[1]
+        manager.leases['leases'] = {
+            "/other": _lease(busy - 3, 3),
+            manager.get_project_id(): _lease(busy + 1, 2),  # Own lease does not block
+        }
+
+        assert manager.find_available_ports(busy - 4, 3) == [busy - 4, busy + 1, busy + 2]
+
+
+@pytest.mark.unit
+def test_check_conflicts_reports_shared_ranges(manager):
+    manager.leases['leases'] = {"/a": _lease(20000, 10), "/b": _lease(20005, 10), "/c": _lease(20030, 5)}
+
+    assert manager.check_conflicts() == [{
+        'port': 20005, 'start_port': 20005, 'end_port': 20009, 'port_range': '20005-20009',
+        'project1': '/a', 'project2': '/b',
+    }]
+
+
+def _lease_in(directory):
+    os.chdir(directory)
+    return PortManager().lease_ports(start=21000, count=3)['start_port']
+
+
+@pytest.mark.unit
+def test_concurrent_leases_do_not_collide(manager, tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    projects = []
+    for i in range(6):
+        projects.append(tmp_path / f"wt{i}")
+        projects[-1].mkdir()
+
+    with ProcessPoolExecutor(max_workers=6) as pool:
+        starts = list(pool.map(_lease_in, projects))
+
+    assert len(set(starts)) == len(projects)
+    leases = PortManager().list_all_leases()
+    assert {lease['project_path'] for lease in leases.values()} == {str(p.resolve()) for p in projects}
+    assert PortManager().check_conflicts() == []
+
+
+@pytest.mark.unit
+def test_deleted_projects_lose_their_lease(manager, tmp_path):
+    unmounted = tmp_path / "unmounted-drive" / "project"
+    manager.leases['leases'][str(unmounted)] = _lease(22000, 3)
+    manager._save_registry()
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    _lease_in(gone)
+    os.chdir(tmp_path)
+    gone.rmdir()
+
+    # Leasing elsewhere leaves them alone; only an explicit prune releases them
+    other = tmp_path / "other"
+    other.mkdir()
+    _lease_in(other)
+    assert str(gone.resolve()) in PortManager().list_all_leases()
+    os.chdir(tmp_path)
+
+    released = PortManager().prune_stale_leases()
+
+    assert [lease['project_path'] for lease in released] == [str(gone.resolve())]
+    assert sorted(PortManager().list_all_leases()) == sorted([str(unmounted), str(other.resolve())])
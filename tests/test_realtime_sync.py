@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Tests for real-time sync fan-out across API workers.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+for module in ("fastapi", "pydantic_settings", "prometheus_client"):
+    pytest.importorskip(module)
+
+from mem8_api.routers import sync  # noqa: E402
+from mem8_api.routers.sync import ClientConnection, ConnectionManager  # noqa: E402
+from mem8_api.services.backplane import InMemoryBackplane, InMemoryHub  # noqa: E402
+from mem8_api.services.realtime import PathTrie, apply_content_delta, content_hash, thought_diff  # noqa: E402
+
+
+class FakeWebSocket:
+    def __init__(self, send_delay=0.0):
+        self.received = []
+        self.send_delay = send_delay
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.send_delay)
+        self.received.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+    async def receive_text(self):
+        while self.close_code is None:
+            await asyncio.sleep(0.005)
+        raise RuntimeError('Cannot call "receive" once a close message has been sent.')
+
+
+def test_events_reach_subscribers_on_other_workers():
+    async def scenario():
+        hub = InMemoryHub()
+        workers = [ConnectionManager(), ConnectionManager()]
+        for worker in workers:
+            await worker.start_backplane(InMemoryBackplane(hub))
+
+        plans, research, everything = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await workers[1].connect(plans, "team")
+        await workers[1].connect(research, "team")
+        await workers[1].connect(everything, "team")
+        workers[1].subscribe(plans, "shared/plans")
+        workers[1].subscribe(research, "shared/research")
+
+        await workers[0].publish("team", {"type": "thought_created"}, path="shared/plans/a.md")
+        await asyncio.sleep(0.01)
+
+        for worker in workers:
+            await worker.stop_backplane()
+        return plans, research, everything
+
+    plans, research, everything = asyncio.run(scenario())
+    assert [m["type"] for m in plans.received] == ["thought_created"]
+    assert research.received == []
+    assert [m["type"] for m in everything.received] == ["thought_created"]
+
+
+def test_thought_diff_sends_content_delta():
+    previous = {"id": "1", "path": "a.md", "title": "A", "content": "".join(f"line {i}\n" for i in range(40))}
+    current = dict(previous, title="B", content=previous["content"].replace("line 3\n", "line three\n"))
+
+    diff = thought_diff(previous, current)
+
+    assert diff["changes"] == {"title": "B"}
+    assert "content" not in diff["changes"]
+    assert apply_content_delta(previous["content"], diff["content_delta"]) == current["content"]
+
+
+def test_path_trie_matches_prefixes_and_prunes():
+    trie = PathTrie()
+    trie.add("shared/plans", "plans")
+    trie.add("shared", "shared")
+    trie.add("/", "root")
+
+    assert trie.match("shared/plans/auth.md") == {"plans", "shared", "root"}
+    assert trie.match("shared/plansx/a.md") == {"shared", "root"}
+    assert trie.match("personal/a.md") == {"root"}
+
+    for prefix, subscriber in [("shared/plans", "plans"), ("shared", "shared"), ("/", "root")]:
+        trie.remove(prefix, subscriber)
+    assert not trie
+
+
+def test_subscriptions_filter_local_delivery():
+    async def scenario():
+        manager = ConnectionManager()
+        plans, research, everything = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        for websocket in (plans, research, everything):
+            await manager.connect(websocket, "team")
+        manager.subscribe(plans, "shared/plans")
+        manager.subscribe(research, "shared/research")
+
+        await manager.broadcast_to_team("team", {"type": "created"}, path="shared/research/a.md")
+        # A move out of plans reaches both sides
+        await manager.broadcast_to_team(
+            "team", {"type": "moved"}, path="shared/research/b.md", previous_path="shared/plans/b.md"
+        )
+        manager.unsubscribe(plans, "shared/plans")
+        await manager.broadcast_to_team("team", {"type": "created"}, path="personal/c.md")
+        await asyncio.sleep(0.01)
+        for websocket in (plans, research, everything):
+            manager.disconnect(websocket)
+        return plans, research, everything
+
+    plans, research, everything = asyncio.run(scenario())
+    assert [m["type"] for m in plans.received] == ["moved", "created"]
+    assert [m["type"] for m in research.received] == ["created", "moved"]
+    assert [m["type"] for m in everything.received] == ["created", "moved", "created"]
+
+
+def test_thought_diff_fields_moves_and_full_content():
+    previous = {"id": "1", "path": "a.md", "title": "A", "content": "short\n", "updated_at": "t1", "word_count": 1}
+    current = dict(previous, path="b.md", content="entirely new\n", updated_at="t2", word_count=2)
+
+    diff = thought_diff(previous, current)
+
+    assert diff["previous_path"] == "a.md" and diff["path"] == "b.md"
+    # Small documents are cheaper to resend whole than to patch
+    assert diff["changes"] == {"content": "entirely new\n", "updated_at": "t2"}
+    assert diff["content_hash"] == content_hash("entirely new\n")
+    assert thought_diff(None, current)["changes"]["title"] == "A"
+
+
+def _queued(client):
+    return [json.loads(text)["n"] for _, text in client._queue]
+
+
+def test_full_queue_drops_oldest():
+    client = ClientConnection(FakeWebSocket(), max_queue=2, policy="drop", send_timeout=1)
+    for n in range(3):
+        assert client.enqueue(json.dumps({"n": n}), key="same")
+    assert _queued(client) == [1, 2]
+
+
+def test_full_queue_coalesces_same_key():
+    client = ClientConnection(FakeWebSocket(), max_queue=2, policy="coalesce", send_timeout=1)
+    client.enqueue(json.dumps({"n": 0}), key="a.md")
+    client.enqueue(json.dumps({"n": 1}), key="b.md")
+    assert client.enqueue(json.dumps({"n": 2}), key="a.md")
+    assert _queued(client) == [2, 1]
+    # Without a queued message to replace, the oldest is dropped
+    assert client.enqueue(json.dumps({"n": 3}), key="c.md")
+    assert _queued(client) == [1, 3]
+
+
+def test_full_queue_disconnects_with_disconnect_policy():
+    async def scenario():
+        manager = ConnectionManager(max_queue=1, policy="disconnect", send_timeout=5)
+        slow, fast = FakeWebSocket(send_delay=1), FakeWebSocket()
+        await manager.connect(slow, "team")
+        await manager.connect(fast, "team")
+        for n in range(3):
+            await manager.broadcast_to_team("team", {"n": n})
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        status = manager.status()
+        manager.disconnect(fast)
+        return slow, fast, status
+
+    slow, fast, status = asyncio.run(scenario())
+    assert slow.close_code == 1013
+    assert [m["n"] for m in fast.received] == [0, 1, 2]
+    assert status["connections"] == 1
+
+
+def test_send_timeout_closes_the_socket():
+    async def scenario():
+        manager = ConnectionManager(max_queue=10, policy="drop", send_timeout=0.05)
+        stuck = FakeWebSocket(send_delay=10)
+        await manager.connect(stuck, "team")
+        await manager.broadcast_to_team("team", {"n": 0})
+        await asyncio.sleep(0.2)
+        return stuck, manager.status()
+
+    stuck, status = asyncio.run(scenario())
+    assert stuck.close_code == 1013
+    assert status["connections"] == 0
+
+
+def test_slow_client_does_not_block_others():
+    async def scenario():
+        manager = ConnectionManager(max_queue=100, policy="drop", send_timeout=5)
+        slow = FakeWebSocket(send_delay=0.5)
+        fast = [FakeWebSocket() for _ in range(3)]
+        for websocket in (slow, *fast):
+            await manager.connect(websocket, "team")
+
+        started = asyncio.get_running_loop().time()
+        for n in range(5):
+            await manager.broadcast_to_team("team", {"n": n})
+        while any(len(websocket.received) < 5 for websocket in fast):
+            await asyncio.sleep(0.005)
+        elapsed = asyncio.get_running_loop().time() - started
+        for websocket in (slow, *fast):
+            manager.disconnect(websocket)
+        return elapsed, slow
+
+    elapsed, slow = asyncio.run(scenario())
+    assert elapsed < 0.25
+    assert len(slow.received) < 5
+
+
+def test_endpoint_cleans_up_however_the_connection_ends(monkeypatch):
+    async def scenario():
+        manager = ConnectionManager(max_queue=1, policy="disconnect", send_timeout=5)
+        monkeypatch.setattr(sync, "connection_manager", manager)
+        slow, broken = FakeWebSocket(send_delay=1), FakeWebSocket()
+
+        async def fail():
+            raise ConnectionResetError("peer went away")
+
+        broken.receive_text = fail
+        endpoints = [asyncio.create_task(sync.websocket_sync(ws, "team")) for ws in (slow, broken)]
+        await asyncio.sleep(0.01)
+        # The slow consumer's queue overflows and its socket is closed under the endpoint
+        for n in range(3):
+            await manager.broadcast_to_team("team", {"n": n})
+            await asyncio.sleep(0.01)
+        results = await asyncio.gather(*endpoints, return_exceptions=True)
+        return slow, results, manager
+
+    slow, results, manager = asyncio.run(scenario())
+    assert slow.close_code == 1013
+    assert [type(result) for result in results] == [RuntimeError, ConnectionResetError]
+    assert manager.team_connections == {}
+    assert manager.clients == {} and manager.connection_info == {}
+
+
+def test_coalescing_keeps_a_delete_behind_earlier_updates(monkeypatch):
+    async def scenario():
+        manager = ConnectionManager(max_queue=3, policy="coalesce", send_timeout=5)
+        monkeypatch.setattr(sync, "connection_manager", manager)
+        slow = FakeWebSocket(send_delay=0.05)
+        await manager.connect(slow, "team")
+        await manager.broadcast_to_team("team", {"type": "busy"})  # In flight while the rest queue up
+        await asyncio.sleep(0)
+
+        thought = {"id": "1", "path": "a.md", "title": "A", "content": "a\n"}
+        await sync.notify_thought_created("team", thought)
+        await sync.notify_thought_updated("team", dict(thought, title="B"), previous=thought)
+        await sync.notify_thought_updated("team", dict(thought, title="C"), previous=dict(thought, title="B"))
+        await sync.notify_thought_deleted("team", "1", "a.md")
+        while len(slow.received) < 4:
+            await asyncio.sleep(0.01)
+        manager.disconnect(slow)
+        return slow
+
+    slow = asyncio.run(scenario())
+    assert [m["type"] for m in slow.received] == ["busy", "thought_updated", "thought_updated", "thought_deleted"]
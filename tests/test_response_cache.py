@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for the API response cache.
+"""
+
+import asyncio
+
+import pytest
+
+for module in ("pydantic_settings", "prometheus_client"):
+    pytest.importorskip(module)
+
+from mem8_api.services.response_cache import ResponseCache  # noqa: E402
+
+
+def test_writes_invalidate_team_and_global_entries():
+    async def scenario():
+        cache = ResponseCache(redis_url=None, ttls={"search": 60}, max_entries=16)
+        calls = []
+
+        async def compute(label):
+            calls.append(label)
+            return {"label": label, "n": len(calls)}
+
+        async def lookup(team_id, label):
+            return await cache.get_or_compute("search", team_id, "anonymous", {"q": label}, lambda: compute(label))
+
+        first = await lookup("team-a", "x")
+        assert await lookup("team-a", "x") == first
+        await lookup("team-b", "x")
+        await lookup(None, "x")
+        assert len(calls) == 3
+
+        await cache.invalidate("team-a")
+        await lookup("team-a", "x")
+        await lookup("team-b", "x")
+        await lookup(None, "x")
+        return calls
+
+    # team-a and the unscoped query are recomputed; team-b stays cached
+    assert asyncio.run(scenario()) == ["x", "x", "x", "x", "x"]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the search suggestion term index.
+"""
+
+import asyncio
+from collections import Counter
+
+
+def _thought(title, tags=(), **fields):
+    return {"title": title, "tags": list(tags), "is_published": True, "is_archived": False, **fields}
+
+
+def test_suggestions_rank_by_frequency_and_follow_writes(backend):
+    from mem8_api.services.suggestions import SuggestionIndex, TermIndex, thought_terms
+
+    index = SuggestionIndex()
+    index.indexes["team"] = TermIndex(
+        thought_terms(_thought("Authentication plan", ["auth"]))
+        + thought_terms(_thought("Authentication bugs"))
+        + thought_terms(_thought("Author notes"))
+    )
+
+    assert index.indexes["team"].complete("au", 10) == ["authentication", "auth", "author"]
+
+    index.record("team", None, _thought("Automation", ["auth"]))
+    index.record("team", _thought("Author notes"), _thought("Author notes", is_archived=True))
+
+    assert index.indexes["team"].complete("au", 10) == ["auth", "authentication", "automation"]
+    assert index.indexes["team"].complete("auth", 1) == ["authentication"]
+
+
+def test_least_recently_used_teams_are_dropped(backend, monkeypatch):
+    from mem8_api.services.suggestions import ALL_TEAMS, SuggestionIndex, TermIndex
+
+    index = SuggestionIndex(max_teams=2)
+    loads = []
+
+    async def query(session_factory, key):
+        loads.append(key)
+        return TermIndex(Counter({f"term-{key}": 1}))
+
+    monkeypatch.setattr(index, "_query", query)
+
+    async def scenario():
+        await index.suggest(None, "te", 5, "a")
+        await index.suggest(None, "te", 5, "b")
+        await index.suggest(None, "te", 5, "a")
+        await index.suggest(None, "te", 5)
+        await index.rebuild(None)
+
+    asyncio.run(scenario())
+    assert list(index.indexes) == ["a", ALL_TEAMS]
+    assert loads == ["a", "b", ALL_TEAMS, "a", ALL_TEAMS]
+
+
+def test_loads_under_constant_writes_give_up_retrying(backend, monkeypatch):
+    from mem8_api.services import suggestions
+    from mem8_api.services.suggestions import SuggestionIndex, TermIndex
+
+    index = SuggestionIndex()
+    loads = []
+
+    async def query(session_factory, key):
+        loads.append(key)
+        # A write for the team lands during every load
+        index.record("team", None, _thought("Busy"))
+        return TermIndex(suggestions.thought_terms(_thought("Busy")))
+
+    monkeypatch.setattr(index, "_query", query)
+
+    assert asyncio.run(index.suggest(None, "bu", 5, "team")) == ["busy"]
+    assert len(loads) == suggestions.MAX_LOAD_ATTEMPTS
+    assert not index._stale
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Tests for local/shared memory synchronization.
+"""
+
+import pytest
+
+from mem8.core.config import Config
+from mem8.core.exclude import ExcludeMatcher
+from mem8.core.merge import merge_lines, three_way_merge
+from mem8.core.sync import SyncManager
+
+
+@pytest.fixture
+def sync_env(temp_workspace, chdir):
+    """Workspace with a memory dir and a configured shared location."""
+    workspace = temp_workspace["workspace"]
+    shared = temp_workspace["shared"]
+    (workspace / "memory").mkdir()
+    chdir(workspace)
+
+    config = Config()
+    config.set('shared.default_location', str(shared))
+    return {
+        "config": config,
+        "local": workspace / "memory",
+        "shared": shared / "memory",
+    }
+
+
+@pytest.mark.unit
+def test_merge_lines_combines_disjoint_edits():
+    base = ["a\n", "b\n", "c\n", "d\n", "e\n"]
+    ours = ["A\n", "b\n", "c\n", "d\n", "e\n"]
+    theirs = ["a\n", "b\n", "c\n", "d\n", "E\n"]
+
+    assert merge_lines(base, ours, theirs) == ["A\n", "b\n", "c\n", "d\n", "E\n"]
+
+
+@pytest.mark.unit
+def test_merge_lines_reports_overlapping_edits():
+    base = ["a\n", "b\n", "c\n"]
+    ours = ["a\n", "B1\n", "c\n"]
+    theirs = ["a\n", "B2\n", "c\n"]
+
+    assert merge_lines(base, ours, theirs) is None
+
+
+@pytest.mark.unit
+def test_three_way_merge_frontmatter_keywise():
+    base = "---\nstatus: draft\ntags: [a]\n---\n# Title\n\nBody\n"
+    ours = "---\nstatus: complete\ntags: [a]\n---\n# Title\n\nBody\n"
+    theirs = "---\nstatus: draft\ntags: [a, b]\n---\n# Title\n\nBody\n\nMore\n"
+
+    merged = three_way_merge(base, ours, theirs)
+
+    assert merged is not None
+    assert "status: complete" in merged
+    assert "- b" in merged
+    assert merged.endswith("Body\n\nMore\n")
+
+
+@pytest.mark.unit
+def test_three_way_merge_frontmatter_conflict():
+    base = "---\nstatus: draft\n---\nBody\n"
+    ours = "---\nstatus: complete\n---\nBody\n"
+    theirs = "---\nstatus: obsolete\n---\nBody\n"
+
+    assert three_way_merge(base, ours, theirs) is None
+
+
+@pytest.mark.unit
+def test_exclude_matcher_gitignore_semantics():
+    matcher = ExcludeMatcher([
+        '.git', '*.pyc', 'build/', 'docs/**/draft-*.md', '/tmp', '*.log', '!keep.log',
+    ])
+
+    assert matcher.matches('.git', is_dir=True)
+    assert matcher.matches('sub/.git/config')
+    assert matcher.matches('a/b/c.pyc')
+    assert matcher.matches('build', is_dir=True)
+    assert not matcher.matches('build')  # directory-only pattern
+    assert matcher.matches('x/build/out.md')
+    assert matcher.matches('docs/draft-1.md')
+    assert matcher.matches('docs/a/b/draft-2.md')
+    assert not matcher.matches('other/docs/draft-1.md')
+    assert matcher.matches('tmp/file.md')
+    assert not matcher.matches('sub/tmp/file.md')
+    assert matcher.matches('debug.log')
+    assert not matcher.matches('logs/keep.log')
+    assert not matcher.matches('notes/my.git.md')
+
+
+@pytest.mark.unit
+def test_exclude_matcher_walk_prunes_excluded_directories(tmp_path):
+    (tmp_path / "keep").mkdir()
+    (tmp_path / "keep" / "a.md").write_text("a", encoding="utf-8")
+    (tmp_path / "keep" / "a.pyc").write_text("a", encoding="utf-8")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "b.md").write_text("b", encoding="utf-8")
+
+    matcher = ExcludeMatcher(['__pycache__', '*.pyc'])
+    assert [rel.as_posix() for _, rel in matcher.walk(tmp_path)] == ["keep/a.md"]
+
+
+@pytest.mark.unit
+def test_sync_auto_merges_non_overlapping_edits(sync_env):
+    config, local, shared = sync_env["config"], sync_env["local"], sync_env["shared"]
+    (local / "plan.md").write_text("# Plan\n\nstep one\n\nstep two\n", encoding="utf-8")
+
+    manager = SyncManager(config)
+    assert manager.sync_memory()['success']
+    assert (shared / "plan.md").exists()
+
+    (local / "plan.md").write_text("# Plan v2\n\nstep one\n\nstep two\n", encoding="utf-8")
+    (shared / "plan.md").write_text("# Plan\n\nstep one\n\nstep two\n\nstep three\n", encoding="utf-8")
+
+    result = SyncManager(config).sync_memory()
+
+    expected = "# Plan v2\n\nstep one\n\nstep two\n\nstep three\n"
+    assert result['summary']['merged'] == 1
+    assert result['summary']['conflicts'] == 0
+    assert (local / "plan.md").read_text(encoding="utf-8") == expected
+    assert (shared / "plan.md").read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.unit
+def test_sync_leaves_overlapping_edits_as_conflict(sync_env):
+    config, local, shared = sync_env["config"], sync_env["local"], sync_env["shared"]
+    (local / "note.md").write_text("line\n", encoding="utf-8")
+    SyncManager(config).sync_memory()
+
+    (local / "note.md").write_text("local line\n", encoding="utf-8")
+    (shared / "note.md").write_text("shared line\n", encoding="utf-8")
+
+    manager = SyncManager(config)
+    result = manager.sync_memory()
+
+    assert result['summary']['merged'] == 0
+    assert result['summary']['conflicts'] > 0
+    assert (local / "note.md").read_text(encoding="utf-8") == "local line\n"
+
+    conflicts = manager.detect_conflicts()
+    assert [c['file'] for c in conflicts] == ["note.md"]
+    assert not manager.resolve_conflict(conflicts[0], 'merge')
+    assert manager.resolve_conflict(conflicts[0], 'use_shared')
+    assert (local / "note.md").read_text(encoding="utf-8") == "shared line\n"
+
+
+@pytest.mark.unit
+def test_watcher_coalesces_local_edits_and_backs_off(sync_env):
+    from mem8.core.sync_watch import SyncWatcher
+
+    now = [0.0]
+    calls = []
+
+    class FakeManager:
+        config = sync_env["config"]
+        written_files = {}
+
+        def sync_memory(self, direction='both', dry_run=False):
+            calls.append(direction)
+            return {'success': direction != 'both', 'error': 'offline'}
+
+    watcher = SyncWatcher(FakeManager(), interval=60, debounce=2.0, jitter=0.0,
+                          clock=lambda: now[0])
+
+    # Startup polls immediately; a failure doubles the next interval
+    assert watcher.step() == pytest.approx(120.0)
+    assert calls == ['both']
+
+    # A burst of edits results in a single push once it settles
+    for t in (10.0, 10.5, 11.0):
+        now[0] = t
+        watcher.notify_local_change()
+    assert watcher.step() == pytest.approx(2.0)
+    now[0] = 13.0
+    watcher.step()
+    now[0] = 20.0
+    watcher.step()
+    assert calls == ['both', 'push']
+
+
+@pytest.mark.unit
+def test_watcher_ignores_files_its_own_sync_wrote(sync_env):
+    from mem8.core.sync_watch import SyncWatcher
+
+    now = [0.0]
+    calls = []
+    local, shared = sync_env["local"], sync_env["shared"]
+    manager = SyncManager(sync_env["config"])
+    real_sync = manager.sync_memory
+
+    def sync_memory(direction='both', dry_run=False):
+        calls.append(direction)
+        result = real_sync(direction=direction, dry_run=dry_run)
+        # The observer reports the pull's writes while the sync is still running
+        for path in manager.written_files:
+            watcher.notify_local_change(path)
+        return result
+
+    manager.sync_memory = sync_memory
+    watcher = SyncWatcher(manager, interval=60, debounce=2.0, jitter=0.0, clock=lambda: now[0])
+
+    shared.mkdir(parents=True, exist_ok=True)
+    (shared / "note.md").write_text("from shared\n", encoding="utf-8")
+    watcher.step()
+    assert (local / "note.md").read_text(encoding="utf-8") == "from shared\n"
+
+    # ...and again after it returned
+    watcher.notify_local_change(local / "note.md")
+    now[0] = 10.0
+    watcher.step()
+    assert calls == ['both']
+
+    (local / "note.md").write_text("edited locally\n", encoding="utf-8")
+    watcher.notify_local_change(local / "note.md")
+    now[0] = 20.0
+    watcher.step()
+    assert calls == ['both', 'push']
+
+
+@pytest.mark.unit
+def test_conflict_detection_reuses_cached_hashes_and_batch_resolves(sync_env, monkeypatch):
+    import os
+    import mem8.core.sync as sync_module
+
+    config, local, shared = sync_env["config"], sync_env["local"], sync_env["shared"]
+    shared.mkdir(parents=True)
+    for name in ("a.md", "b.md", "same.md"):
+        (local / name).write_text(f"local {name}\n", encoding="utf-8")
+        (shared / name).write_text(
+            "same\n" if name == "same.md" else f"shared {name}\n", encoding="utf-8"
+        )
+    (local / "same.md").write_text("same\n", encoding="utf-8")
+    for path in list(local.iterdir()) + list(shared.iterdir()):
+        os.utime(path, (1_600_000_000, 1_600_000_000))
+
+    manager = SyncManager(config)
+    assert sorted(c['file'] for c in manager.iter_conflicts()) == ["a.md", "b.md"]
+
+    hashed = []
+    real_hash_file = sync_module.hash_file
+    monkeypatch.setattr(sync_module, "hash_file", lambda p: hashed.append(p) or real_hash_file(p))
+
+    conflicts = list(SyncManager(config).iter_conflicts())
+    assert len(conflicts) == 2
+    assert hashed == []
+
+    result = manager.resolve_conflicts(conflicts, 'use_local')
+    assert sorted(result['resolved']) == ["a.md", "b.md"]
+    assert result['failed'] == []
+    assert sorted(p.name for p in (result['backup_dir'] / "shared").iterdir()) == ["a.md", "b.md"]
+    assert (shared / "a.md").read_text(encoding="utf-8") == "local a.md\n"
+    assert manager.detect_conflicts() == []
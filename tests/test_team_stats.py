@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for per-team thought counters.
+"""
+
+import asyncio
+import uuid
+
+
+def test_counters_follow_writes_and_refresh_repairs_drift(backend):
+    from sqlalchemy import delete, select, update
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from mem8_api.database import metadata
+    from mem8_api.models.team import TeamStats
+    from mem8_api.models.thought import Thought
+    from mem8_api.services.team_stats import record_thought_change, refresh_team_stats
+
+    team_a, team_b, team_gone = (str(uuid.uuid4()) for _ in range(3))
+
+    async def counters(db):
+        rows = (await db.execute(select(TeamStats))).scalars().all()
+        return {
+            str(row.team_id): (row.thought_count, row.word_count, row.archived_count)
+            for row in rows
+        }
+
+    async def write(db, team_id, path, words, before=None, **changes):
+        snapshot = before and {"word_count": before.word_count, "is_archived": before.is_archived}
+        thought = before or Thought(title=path, content=path, path=path, team_id=team_id)
+        thought.word_count = words
+        for name, value in changes.items():
+            setattr(thought, name, value)
+        db.add(thought)
+        await record_thought_change(db, team_id, snapshot, thought)
+        await db.commit()
+        return thought
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        steps = []
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            first = await write(db, team_a, "a.md", 10)
+            second = await write(db, team_a, "b.md", 5)
+            await write(db, team_b, "c.md", 7)
+            steps.append(await counters(db))
+
+            await write(db, team_a, "a.md", 12, before=first)
+            await write(db, team_a, "b.md", 5, before=second, is_archived=True)
+            steps.append(await counters(db))
+
+            await db.delete(second)
+            await record_thought_change(db, team_a, second, None)
+            await db.commit()
+            steps.append(await counters(db))
+
+            # Drift: a lost delta, a thought written without a counter update and a stale team
+            await db.execute(update(TeamStats).where(TeamStats.team_id == team_a).values(word_count=99))
+            await db.execute(delete(TeamStats).where(TeamStats.team_id == team_b))
+            db.add(TeamStats(team_id=team_gone, thought_count=3))
+            await db.commit()
+            updated = await refresh_team_stats(db)
+            steps.append(await counters(db))
+
+        await engine.dispose()
+        return steps, updated
+
+    steps, updated = asyncio.run(scenario())
+    assert steps == [
+        {team_a: (2, 15, 0), team_b: (1, 7, 0)},
+        {team_a: (2, 17, 1), team_b: (1, 7, 0)},
+        {team_a: (1, 12, 0), team_b: (1, 7, 0)},
+        {team_a: (1, 12, 0), team_b: (1, 7, 0)},
+    ]
+    assert updated == 2
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk thought import.
+"""
+
+import asyncio
+import uuid
+
+
+def test_counts_and_team_stats_follow_the_rows_written(backend):
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from mem8_api.database import metadata
+    from mem8_api.models.team import TeamStats
+    from mem8_api.models.thought import Thought
+    from mem8_api.schemas.thought import ThoughtImportItem
+    from mem8_api.services.team_stats import record_thought_change, refresh_team_stats
+    from mem8_api.services.thought_import import ThoughtImporter
+
+    team_id = str(uuid.uuid4())
+
+    async def counters(db):
+        stats = (await db.execute(select(TeamStats))).scalar_one()
+        return stats.thought_count, stats.word_count
+
+    async def run_import(db, documents):
+        importer = ThoughtImporter(db, team_id)
+        for path, content in documents.items():
+            await importer.add(ThoughtImportItem(path=path, content=content))
+        result = await importer.finish()
+        return result.created, result.updated, result.unchanged
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            results = [await run_import(db, {"a.md": "one two", "b.md": "three"})]
+
+            # Another writer creates c.md right after the importer looked it up
+            real_execute = db.execute
+
+            async def execute(statement, *args, **kwargs):
+                result = await real_execute(statement, *args, **kwargs)
+                if getattr(statement, "is_select", False) and db.execute is execute:
+                    db.execute = real_execute
+                    thought = Thought(title="c", content="x y z w", path="c.md", team_id=team_id, word_count=4)
+                    db.add(thought)
+                    await db.flush()
+                    await record_thought_change(db, team_id, None, thought)
+                return result
+
+            db.execute = execute
+            results.append(await run_import(db, {"a.md": "one two", "b.md": "three four", "c.md": "five"}))
+            imported = await counters(db)
+            await refresh_team_stats(db)
+            recounted = await counters(db)
+
+        await engine.dispose()
+        return results, imported, recounted
+
+    results, imported, recounted = asyncio.run(scenario())
+    assert results == [(2, 0, 0), (0, 2, 1)]
+    assert imported == recounted == (3, 5)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the one-thought-per-path constraint.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+
+def test_init_db_replaces_path_index_and_refuses_duplicates(backend, tmp_path, monkeypatch):
+    from sqlalchemy import inspect, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from mem8_api import database
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+    team_id = str(uuid.uuid4())
+
+    async def indexes():
+        async with engine.connect() as conn:
+            return {
+                index["name"]
+                for index in await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_indexes("thoughts"))
+            }
+
+    async def scenario():
+        # A database from before paths were unique, holding one duplicate
+        await database.init_db()
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP INDEX uq_thoughts_team_path"))
+            await conn.execute(text("CREATE INDEX ix_thoughts_team_path ON thoughts (team_id, path)"))
+            for thought_id in ("t1", "t2"):
+                await conn.execute(text(
+                    "INSERT INTO thoughts (id, title, content, path, team_id, is_published, is_archived, "
+                    "created_at, updated_at) VALUES (:id, 'a', 'a', 'a.md', :team, 1, 0, "
+                    "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ), {"id": thought_id, "team": team_id})
+
+        with pytest.raises(RuntimeError, match="a.md"):
+            await database.init_db()
+        assert "uq_thoughts_team_path" not in await indexes()
+
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM thoughts WHERE id = 't2'"))
+        await database.init_db()
+        result = await indexes()
+        await engine.dispose()
+        return result
+
+    names = asyncio.run(scenario())
+    assert "uq_thoughts_team_path" in names
+    assert "ix_thoughts_team_path" not in names
+
+
+def test_moving_a_thought_onto_a_taken_path_conflicts(backend):
+    from fastapi import HTTPException
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from mem8_api.database import metadata
+    from mem8_api.models.thought import Thought
+    from mem8_api.routers.thoughts import update_thought
+    from mem8_api.schemas.thought import ThoughtUpdate
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        team_id = str(uuid.uuid4())
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            first, second = (
+                Thought(title=path, content=path, path=path, team_id=team_id) for path in ("a.md", "b.md")
+            )
+            db.add_all([first, second])
+            await db.commit()
+
+            with pytest.raises(HTTPException) as conflict:
+                await update_thought(second.id, ThoughtUpdate(path="a.md"), db=db, cache=None)
+            paths = (await db.execute(select(Thought.path).order_by(Thought.path))).scalars().all()
+
+        await engine.dispose()
+        return conflict.value.status_code, paths
+
+    status_code, paths = asyncio.run(scenario())
+    assert status_code == 409
+    assert paths == ["a.md", "b.md"]
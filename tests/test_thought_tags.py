@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for normalized thought tags and tag facets.
+"""
+
+import asyncio
+import uuid
+
+
+def test_multi_tag_filter_and_facets(backend):
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from mem8_api.database import metadata
+    from mem8_api.models.thought import Thought
+    from mem8_api.services.tags import has_tags, set_thought_tags, tag_facets
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        team_id = str(uuid.uuid4())
+        async with AsyncSession(engine) as db:
+            for path, tags in [
+                ("a.md", ["auth", "api"]),
+                ("b.md", ["auth"]),
+                ("c.md", ["api", "perf", " api "]),
+                ("d.md", []),
+            ]:
+                thought = Thought(title=path, content=path, path=path, team_id=team_id, tags=tags)
+                db.add(thought)
+                await set_thought_tags(db, thought)
+            await db.commit()
+
+            both = (await db.execute(select(Thought.path).where(has_tags(["auth", "api"], team_id)))).scalars().all()
+            api = (await db.execute(select(Thought.path).where(has_tags(["api"])))).scalars().all()
+            facets = await tag_facets(db, select(Thought.id).where(Thought.team_id == team_id))
+
+        await engine.dispose()
+        return both, sorted(api), facets
+
+    both, api, facets = asyncio.run(scenario())
+    assert both == ["a.md"]
+    assert api == ["a.md", "c.md"]
+    assert facets == {"api": 2, "auth": 2, "perf": 1}
+
+
+def test_backfill_resumes_after_partial_migration(backend, monkeypatch):
+    from sqlalchemy import event, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from mem8_api.database import metadata
+    from mem8_api.models.thought import Thought, ThoughtTag
+    from mem8_api.services import tags
+    from mem8_api.services.tags import backfill_thought_tags, set_thought_tags
+
+    monkeypatch.setattr(tags, "BACKFILL_BATCH_SIZE", 2)
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        team_id = str(uuid.uuid4())
+        async with AsyncSession(engine) as db:
+            thoughts = [
+                Thought(title=path, content=path, path=path, team_id=team_id, tags=labels)
+                for path, labels in [("a.md", ["x"]), ("b.md", ["y", "z"]), ("c.md", []), ("d.md", ["x"]), ("e.md", [" "])]
+            ]
+            db.add_all(thoughts)
+            await db.flush()
+            # An earlier backfill stopped after the first thought
+            await set_thought_tags(db, thoughts[0])
+            await db.commit()
+
+            migrated = await backfill_thought_tags(db)
+
+            # Once finished, only the lookup for unmigrated thoughts runs
+            statements = []
+
+            def record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", record)
+            again = await backfill_thought_tags(db)
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+            rows = (await db.execute(
+                select(Thought.path, ThoughtTag.tag).join(ThoughtTag, ThoughtTag.thought_id == Thought.id)
+            )).all()
+            blank = (await db.execute(select(Thought.tags).where(Thought.path == "e.md"))).scalar_one()
+
+        await engine.dispose()
+        return migrated, again, statements, sorted(rows), blank
+
+    migrated, again, statements, rows, blank = asyncio.run(scenario())
+    assert (migrated, again) == (2, 0)
+    assert len(statements) == 1
+    assert rows == [("a.md", "x"), ("b.md", "y"), ("b.md", "z"), ("d.md", "x")]
+    assert blank == []
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent, cached toolbelt probes.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from mem8.core.toolbelt import probe_commands
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses shell script tools")
+
+
+@pytest.fixture
+def fake_tools(tmp_path, monkeypatch):
+    """Put slow fake tools on PATH that log each run to ``runs.log``."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "runs.log"
+
+    def make(name, version):
+        tool = bin_dir / name
+        tool.write_text(f"#!/bin/sh\necho {name} >> '{log}'\nsleep 0.4\necho '{name} version {version}'\n")
+        tool.chmod(0o755)
+        return tool
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    tools = {name: make(name, f"1.{i}.0") for i, name in enumerate(["alpha", "beta", "gamma", "delta"])}
+    return tools, lambda: log.read_text().split() if log.exists() else []
+
+
+@pytest.mark.unit
+def test_probes_run_concurrently(fake_tools, tmp_path):
+    tools, runs = fake_tools
+    commands = [[name, "--version"] for name in tools] + [["mem8-no-such-tool", "--version"]]
+
+    start = time.monotonic()
+    results = probe_commands(commands, tmp_path / "data")
+    elapsed = time.monotonic() - start
+
+    assert [r.stdout.strip() if r else None for r in results] == [
+        "alpha version 1.0.0", "beta version 1.1.0", "gamma version 1.2.0", "delta version 1.3.0", None,
+    ]
+    # Four 0.4s probes take about as long as one
+    assert elapsed < 1.2
+    assert sorted(runs()) == sorted(tools)
+
+
+@pytest.mark.unit
+def test_unchanged_tools_are_not_rerun(fake_tools, tmp_path):
+    tools, runs = fake_tools
+    data_dir = tmp_path / "data"
+    commands = [[name, "--version"] for name in tools]
+
+    first = probe_commands(commands, data_dir)
+    assert probe_commands(commands, data_dir) == first
+    assert len(runs()) == 4
+
+    # Upgrading a tool changes its mtime, so only that tool is probed again
+    stat = tools["beta"].stat()
+    os.utime(tools["beta"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    probe_commands(commands, data_dir)
+    assert runs().count("beta") == 2 and len(runs()) == 5
+
+    assert len(json.loads((data_dir / "toolbelt_probes.json").read_text())["probes"]) == 4
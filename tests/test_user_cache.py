@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the authenticated user cache.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+def test_cached_user_is_served_until_invalidated(backend):
+    from mem8_api.services.user_cache import UserCache
+
+    async def scenario():
+        cache = UserCache(ttl=60)
+        row = SimpleNamespace(
+            id="u1", email="a@example.com", username="a", full_name="A",
+            is_active=True, is_superuser=False, hashed_password="secret",
+        )
+        missing = await cache.get("u1")
+        await cache.set(row)
+        cached = await cache.get("u1")
+        await cache.invalidate("u1")
+        return missing, cached, await cache.get("u1")
+
+    missing, cached, invalidated = asyncio.run(scenario())
+    assert missing is None
+    assert (cached.id, cached.username, cached.is_active) == ("u1", "a", True)
+    assert cached.hashed_password is None
+    assert invalidated is None
+
+
+def test_token_lookup_returns_the_same_user_type_from_cache_and_database(backend, monkeypatch):
+    for module in ("fastapi", "jwt", "httpx"):
+        pytest.importorskip(module)
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from mem8_api.database import metadata
+    from mem8_api.models.user import User
+    from mem8_api.routers import auth
+    from mem8_api.services.user_cache import UserCache
+
+    monkeypatch.setattr(auth, "get_user_cache", lambda cache=UserCache(ttl=60): cache)
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            user = User(email="a@example.com", username="a", hashed_password="secret")
+            db.add(user)
+            await db.commit()
+            token, _ = auth.create_access_token(user.id)
+
+            users = []
+            for _ in range(2):
+                request = SimpleNamespace(state=SimpleNamespace())
+                users.append(await auth._user_from_token(request, token, db))
+
+        await engine.dispose()
+        return users
+
+    from_database, from_cache = asyncio.run(scenario())
+    for user in (from_database, from_cache):
+        assert isinstance(user, User)
+        assert (user.username, user.is_active, user.hashed_password) == ("a", True, None)
+    assert from_database.id == from_cache.id
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for worktree status collection.
+"""
+
+import subprocess
+
+import pytest
+
+from mem8.core import worktree
+from mem8.core.worktree import _parse_status_v2, collect_worktree_statuses
+
+
+@pytest.mark.unit
+def test_parse_status_v2():
+    output = (
+        "# branch.oid 1f2e3d4c\n"
+        "# branch.head feature\n"
+        "# branch.upstream origin/feature\n"
+        "# branch.ab +2 -1\n"
+        "1 .M N... 100644 100644 100644 aaa bbb src/app.py\n"
+        "? notes.md\n"
+    )
+    assert _parse_status_v2(output) == {
+        "branch": "feature", "commit": "1f2e3d4c", "upstream": "origin/feature",
+        "ahead": 2, "behind": 1, "changes": 2, "is_clean": False,
+    }
+
+    detached = _parse_status_v2("# branch.oid (initial)\n# branch.head (detached)\n")
+    assert detached["branch"] == "" and detached["commit"] is None and detached["is_clean"]
+
+
+@pytest.mark.unit
+def test_collect_statuses_one_git_call_per_worktree(make_repo, chdir, git_available, tmp_path, monkeypatch):
+    if not git_available:
+        pytest.skip("git not available in test environment")
+
+    repo = make_repo(name="repo", with_memory=False)
+    chdir(repo)
+    for ticket in ("ENG-1", "ENG-2"):
+        subprocess.run(["git", "worktree", "add", "-q", "-b", ticket, str(tmp_path / ticket)], check=True)
+    (tmp_path / "ENG-2" / "scratch.txt").write_text("wip", encoding="utf-8")
+
+    worktrees = worktree.list_worktrees()
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(args, *a, **kw):
+        calls.append(args)
+        return real_run(args, *a, **kw)
+
+    monkeypatch.setattr(worktree.subprocess, "run", counting_run)
+    results = collect_worktree_statuses(worktrees, max_workers=2)
+
+    assert len(calls) == 3
+    statuses = {wt["path"].rsplit("/", 1)[-1]: wt["status"] for wt in results}
+    assert statuses["ENG-1"]["branch"] == "ENG-1" and statuses["ENG-1"]["is_clean"]
+    assert statuses["ENG-2"]["changes"] == 1
+    assert [wt["path"] for wt in results] == [wt["path"] for wt in worktree.list_worktrees()]